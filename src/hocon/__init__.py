@@ -1,5 +1,5 @@
 """Loads Hocon to a list / dictionary. From IOStream (load) or from string (loads)."""
 
-from ._main import load, loads
+from ._main import cached_load, load, load_lazy, loads, loads_lazy
 
-__all__ = ("load", "loads")
+__all__ = ("cached_load", "load", "load_lazy", "loads", "loads_lazy")
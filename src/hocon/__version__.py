@@ -2,4 +2,4 @@
 
 __title__ = "hocon"
 __description__ = "A modern HOCON parser with json-like API."
-__version__ = "0.6.3"
+__version__ = "0.7.0"
@@ -0,0 +1,339 @@
+"""On-disk and in-process caches of parsed and resolved documents.
+
+A cache entry is valid as long as every file read while parsing (the root file and all includes) is unchanged
+and every environment variable consulted while resolving still has the same value.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from .__version__ import __version__
+from .constants import ANY_VALUE_TYPE, ROOT_TYPE
+from .parser import parse, parse_path
+from .parser._include import expand_glob
+from .parser.data import Sources
+from .resolver import resolve
+from .resolver._memo import copy_resolved
+from .strings import QuotedString, UnquotedString
+from .unresolved import ANY_UNRESOLVED, UnresolvedConcatenation, UnresolvedDuplication, UnresolvedSubstitution
+
+JSON_TYPE = dict[str, Any] | list[Any] | str | int | float | bool | None
+
+
+@dataclass(frozen=True)
+class FileState:
+    """What a file looked like when it was read. A missing file (optional include) has no digest."""
+
+    path: Path
+    encoding: str
+    mtime_ns: int = 0
+    size: int = 0
+    digest: str | None = None
+
+    @classmethod
+    def of(cls, path: Path, text: str | None, encoding: str) -> "FileState":
+        """Describe the file by the text that was actually parsed.
+
+        Stats are kept only if the file still holds that text (checked after taking them),
+        otherwise they never match and the digest decides.
+        """
+        if text is None:
+            return cls(path, encoding)
+        stat = path.stat()
+        if path.read_text(encoding=encoding) != text:
+            return cls(path, encoding, digest=_digest(text.encode()))
+        return cls(path, encoding, stat.st_mtime_ns, stat.st_size, _digest(text.encode()))
+
+    def is_unchanged(self) -> bool:
+        """Compare stats first, hash the file content only if they differ (e.g. the file was just touched)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return self.digest is None
+        if self.digest is None:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size):
+            return True
+        return _digest(self.path.read_text(encoding=self.encoding).encode()) == self.digest
+
+
+@dataclass(frozen=True)
+class GlobState:
+    """Files a glob include matched. A file added to (or removed from) the matches invalidates the cache entry."""
+
+    pattern: str
+    matches: tuple[Path, ...]
+
+    def is_unchanged(self) -> bool:
+        return tuple(expand_glob(self.pattern)) == self.matches
+
+
+SourceState = FileState | GlobState
+
+
+@dataclass
+class _Entry:
+    files: list[SourceState]
+    environment: dict[str, str | None]
+    parsed: JSON_TYPE
+    resolved: ROOT_TYPE
+
+    def is_environment_unchanged(self) -> bool:
+        return _is_environment_unchanged(self.environment)
+
+
+class DiskCache:
+    """Cache of a single document load (root file + encoding + selected paths) in cache_dir.
+
+    Entries are JSON, so reading one never runs code. Still, cache_dir must be writable by trusted users only:
+    whoever can write an entry decides what the cached configuration is.
+    """
+
+    def __init__(self, cache_dir: str | Path, root_filepath: Path, encoding: str, paths: list[str] | None) -> None:
+        self.root_filepath = root_filepath
+        self.encoding = encoding
+        self.paths = paths
+        key = "\0".join([__version__, str(root_filepath), encoding, repr(paths)])
+        self.entry_path = Path(cache_dir) / f"{_digest(key.encode())}.json"
+
+    def load(self, read_root: Callable[[], str], *, prefetch_includes: bool = False) -> ROOT_TYPE:
+        """Return the cached result if still valid. Otherwise read root with read_root, parse, resolve and store.
+
+        Unchanged files with changed environment variables skip parsing, but get resolved again.
+        """
+        entry = self._read_entry()
+        if entry is not None and all(file.is_unchanged() for file in entry.files):
+            if entry.is_environment_unchanged():
+                return entry.resolved
+            return self._resolve_and_store(entry.files, entry.parsed)
+        parsed, files = _parse_recording_files(
+            read_root(),
+            self.root_filepath,
+            self.encoding,
+            prefetch_includes=prefetch_includes,
+        )
+        return self._resolve_and_store(files, _encode(parsed))
+
+    def _resolve_and_store(self, files: list[SourceState] | None, parsed: JSON_TYPE) -> ROOT_TYPE:
+        """Resolve a fresh copy of the encoded parse tree (resolving may modify it) and store the entry.
+
+        Without files to validate it with, the entry is not stored.
+        """
+        environment: dict[str, str | None] = {}
+        paths = None if self.paths is None else [parse_path(path) for path in self.paths]
+        resolved = resolve(_decode(parsed, {}), paths, environment)
+        if files is not None:
+            self._write_entry(_Entry(files, environment, parsed, resolved))
+        return resolved
+
+    def _read_entry(self) -> _Entry | None:
+        try:
+            with self.entry_path.open(encoding="utf-8") as file:
+                content = json.load(file)
+            files: list[SourceState] = [FileState(Path(path), *state) for path, *state in content["files"]]
+            files.extend(GlobState(pattern, tuple(map(Path, matches))) for pattern, matches in content["globs"])
+            resolved = _decode(content["resolved"], {})
+            return _Entry(files, content["environment"], content["parsed"], resolved)
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+    def _write_entry(self, entry: _Entry) -> None:
+        """Write to a temporary file and move it in place, so that concurrent loads never read a partial entry."""
+        content = {
+            "files": [
+                [str(state.path), state.encoding, state.mtime_ns, state.size, state.digest]
+                for state in entry.files
+                if isinstance(state, FileState)
+            ],
+            "globs": [
+                [state.pattern, [str(path) for path in state.matches]]
+                for state in entry.files
+                if isinstance(state, GlobState)
+            ],
+            "environment": entry.environment,
+            "parsed": entry.parsed,
+            "resolved": _encode(entry.resolved),
+        }
+        self.entry_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.entry_path.parent, delete=False) as file:
+            json.dump(content, file)
+        Path(file.name).replace(self.entry_path)
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """LoadCache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+@dataclass
+class _Loaded:
+    files: list[SourceState] | None
+    environment: dict[str, str | None]
+    result: ROOT_TYPE
+
+
+class LoadCache:
+    """In-process LRU cache of loaded files, keyed by absolute path (and encoding).
+
+    Every hit re-validates the entry with os.stat of the root file and all of its includes
+    (plus the environment variables consulted), so a changed file is loaded again.
+
+    cached_load("application.conf", maxsize=32)
+    cached_load.cache_info() ---> CacheInfo(hits=0, misses=1, evictions=0, maxsize=32, currsize=1)
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[Path, str], _Loaded] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._maxsize: int | None = None
+
+    def __call__(
+        self,
+        path: str | Path,
+        maxsize: int | None = 128,
+        encoding: str = "UTF-8",
+        *,
+        copy: bool = True,
+    ) -> ROOT_TYPE:
+        """Load HOCON file, unless it is cached and unchanged.
+
+        :param path: HOCON file path.
+        :param maxsize: how many files to keep cached (None for no limit). The least recently used get evicted.
+        :param encoding: encoding of the file and its includes.
+        :param copy: return a copy of the cached result. Without a copy, the result must not be modified.
+        :return: resolved dict or list
+        """
+        key = (Path(path).absolute(), encoding)
+        with self._lock:
+            self._maxsize = maxsize
+            loaded = self._entries.get(key)
+            if loaded is not None and _is_valid(loaded):
+                self._hits += 1
+                self._entries.move_to_end(key)
+            else:
+                self._misses += 1
+                loaded = None
+        if loaded is None:
+            loaded = _load(*key)
+            if loaded.files is None:
+                return loaded.result
+            with self._lock:
+                self._entries[key] = loaded
+                self._entries.move_to_end(key)
+                self._evict()
+        return cast("ROOT_TYPE", copy_resolved(loaded.result)) if copy else loaded.result
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Drop all the entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+def _is_valid(loaded: _Loaded) -> bool:
+    if loaded.files is None or not _is_environment_unchanged(loaded.environment):
+        return False
+    return all(file.is_unchanged() for file in loaded.files)
+
+
+def _load(path: Path, encoding: str) -> _Loaded:
+    parsed, files = _parse_recording_files(path.read_text(encoding=encoding), path, encoding)
+    environment: dict[str, str | None] = {}
+    return _Loaded(files, environment, resolve(parsed, environment=environment))
+
+
+def _parse_recording_files(
+    data: str,
+    root_filepath: Path,
+    encoding: str,
+    *,
+    prefetch_includes: bool = False,
+) -> tuple[ROOT_TYPE, list[SourceState] | None]:
+    """Parse data read from root_filepath. Return the parse tree and the states of all the files read (and globbed).
+
+    Return no states if the document has includes caches cannot validate (see Sources.untracked).
+    """
+    sources = Sources()
+    sources.files[root_filepath] = data
+    parsed = parse(data, root_filepath, encoding, sources=sources, prefetch_includes=prefetch_includes)
+    if sources.untracked:
+        return parsed, None
+    files: list[SourceState] = [FileState.of(path, text, encoding) for path, text in sources.files.items()]
+    files.extend(GlobState(pattern, tuple(matches)) for pattern, matches in sources.globs.items())
+    return parsed, files
+
+
+def _is_environment_unchanged(environment: dict[str, str | None]) -> bool:
+    return all(os.environ.get(name) == value for name, value in environment.items())
+
+
+_ITEMS_TAGS: dict[type, str] = {
+    list: "list",
+    UnresolvedConcatenation: "concatenation",
+    UnresolvedDuplication: "duplication",
+}
+_STRING_TAGS: dict[type, str] = {QuotedString: "quoted", UnquotedString: "unquoted"}
+_TAGGED_TYPES = {tag: type_ for type_, tag in (_ITEMS_TAGS | _STRING_TAGS).items()}
+
+
+def _encode(value: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> JSON_TYPE:
+    """Turn a parse tree (or a resolved value) into JSON. Everything but plain scalars becomes a [tag, ...] list."""
+    if type(value) is dict:
+        return ["dict", [[key, _encode(item)] for key, item in value.items()]]
+    if isinstance(value, list | UnresolvedConcatenation | UnresolvedDuplication):
+        return [_ITEMS_TAGS[type(value)], [_encode(item) for item in value]]
+    if isinstance(value, QuotedString | UnquotedString):
+        return [_STRING_TAGS[type(value)], str(value)]
+    if isinstance(value, UnresolvedSubstitution):
+        return ["substitution", value.id_, value.keys, value.optional, value.relative_location, value.including_root]
+    if value is None or isinstance(value, str | int | float):
+        return value
+    msg = f"Cannot cache {type(value)}"
+    raise TypeError(msg)
+
+
+def _decode(value: JSON_TYPE, substitutions: dict[int, UnresolvedSubstitution]) -> Any:  # noqa: ANN401
+    """Rebuild what _encode turned into JSON. A substitution met more than once becomes the same object again."""
+    if not isinstance(value, list):
+        return value
+    tag, *content = value
+    if tag == "dict":
+        return {key: _decode(item, substitutions) for key, item in content[0]}
+    if tag == "substitution":
+        id_, keys, optional, relative_location, including_root = content
+        if id_ not in substitutions:
+            substitutions[id_] = UnresolvedSubstitution(keys, optional, relative_location, including_root)
+        return substitutions[id_]
+    if tag in _STRING_TAGS.values():
+        return _TAGGED_TYPES[tag](content[0])
+    return _TAGGED_TYPES[tag]([_decode(item, substitutions) for item in content[0]])
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
@@ -1,28 +1,84 @@
 from pathlib import Path
 from typing import TextIO
 
+from ._cache import DiskCache, LoadCache
 from .constants import ROOT_TYPE
-from .parser import parse
-from .resolver import resolve
+from .parser import parse, parse_path
+from .parser._formats import decode_json
+from .resolver import ConfigView, resolve, resolve_on_access
 
+cached_load = LoadCache()
 
-def load(fp: TextIO) -> ROOT_TYPE:
+
+def load(
+    fp: TextIO,
+    paths: list[str] | None = None,
+    cache_dir: str | Path | None = None,
+    *,
+    prefetch_includes: bool = False,
+) -> ROOT_TYPE:
     """Load HOCON from an open file.
 
     Relative path for include and encoding is set automatically.
+    With cache_dir set, the parse tree and the result are cached on disk. The cached result is returned
+    without even reading fp, as long as the file, its includes and the consulted environment variables are unchanged.
+    Entries are plain JSON, but anyone who can write to cache_dir controls the loaded values, so keep it private.
+    Streams not backed by a file on disk (StringIO, stdin) are loaded like with loads, caching is off for them.
     """
-    absolute_path = Path(fp.name).absolute()
-    return loads(fp.read(), absolute_path, fp.encoding)
+    name = getattr(fp, "name", None)
+    absolute_path = Path(name).absolute() if isinstance(name, str) else None
+    encoding = getattr(fp, "encoding", None) or "UTF-8"
+    if cache_dir is not None and absolute_path is not None and absolute_path.is_file():
+        cache = DiskCache(cache_dir, absolute_path, encoding, paths)
+        return cache.load(fp.read, prefetch_includes=prefetch_includes)
+    return loads(fp.read(), absolute_path, encoding, paths=paths, prefetch_includes=prefetch_includes)
 
 
-def loads(data: str, root_filepath: str | Path | None = None, encoding: str = "UTF-8") -> ROOT_TYPE:
-    """Load a string to HOCON.
+def loads(
+    data: str,
+    root_filepath: str | Path | None = None,
+    encoding: str = "UTF-8",
+    paths: list[str] | None = None,
+    *,
+    prefetch_includes: bool = False,
+) -> ROOT_TYPE:
+    """Load a string to HOCON. Plain JSON (an object or an array) gets decoded by the json module, skipping the parser.
 
     :param data: string to parse and resolve.
     :param root_filepath: path to resolve 'include' from. Set current working directory by default.
     :param encoding: encoding to use for 'include' files.
+    :param paths: path expressions (like "akka.actor") of the only subtrees to resolve. All the others are dropped.
+        Paths select object fields only, a path going into a list raises HOCONError.
+    :param prefetch_includes: read included files concurrently, ahead of the parser (e.g. on network file systems).
     :return: resolved dict or list
     """
+    decoded = decode_json(data)
+    if decoded is not None:
+        return decoded if paths is None else resolve(decoded, [parse_path(path) for path in paths])
+    root_filepath = root_filepath or Path.cwd() / "application.conf"
+    parsed = parse(data, root_filepath=root_filepath, encoding=encoding, prefetch_includes=prefetch_includes)
+    if paths is None:
+        return resolve(parsed)
+    return resolve(parsed, [parse_path(path) for path in paths])
+
+
+def load_lazy(fp: TextIO) -> ConfigView:
+    """Load HOCON object from an open file, resolving values only when accessed.
+
+    Relative path for include and encoding is set automatically.
+    """
+    absolute_path = Path(fp.name).absolute()
+    return loads_lazy(fp.read(), absolute_path, fp.encoding)
+
+
+def loads_lazy(data: str, root_filepath: str | Path | None = None, encoding: str = "UTF-8") -> ConfigView:
+    """Load a string to a read-only HOCON object view, resolving values only when accessed.
+
+    :param data: string to parse.
+    :param root_filepath: path to resolve 'include' from. Set current working directory by default.
+    :param encoding: encoding to use for 'include' files.
+    :return: mapping view; nested objects are views as well, other values get resolved (and cached) on first access
+    """
     root_filepath = root_filepath or Path.cwd() / "application.conf"
     parsed = parse(data, root_filepath=root_filepath, encoding=encoding)
-    return resolve(parsed)
+    return resolve_on_access(parsed)
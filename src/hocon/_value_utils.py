@@ -0,0 +1,167 @@
+"""Value helpers shared by the parser (folding literal values) and the resolver.
+
+Casting unquoted tokens, joining strings and merging objects work the same way on both sides.
+"""
+
+from collections.abc import Callable
+from copy import copy
+from typing import Any, TypeVar, cast
+
+from hocon.constants import _FLOAT_CONSTANTS, ANY_VALUE_TYPE, SCALAR_RE, SIMPLE_VALUE_TYPE, WHITE_CHARS
+from hocon.strings import HOCON_STRING, QuotedString, UnquotedString
+from hocon.unresolved import (
+    ANY_UNRESOLVED,
+    UnresolvedConcatenation,
+    UnresolvedDuplication,
+    UnresolvedSubstitution,
+)
+
+
+def resolve_simple_value(chunks: list[HOCON_STRING]) -> SIMPLE_VALUE_TYPE:
+    chunks = _strip_string_list(chunks)
+    if len(chunks) == 1 and isinstance(chunks[0], UnquotedString):
+        return cast_string_value(str(chunks[0]))
+    return "".join(list(map(str, chunks)))
+
+
+def _strip_string_list(values: list[HOCON_STRING]) -> list[HOCON_STRING]:
+    first = next(
+        index for index, value in enumerate(values) if value.strip(WHITE_CHARS) or isinstance(value, QuotedString)
+    )
+    last = -1 * next(
+        index
+        for index, value in enumerate(reversed(values))
+        if value.strip(WHITE_CHARS) or isinstance(value, QuotedString)
+    )
+    if last == 0:
+        return values[first:]
+    return values[first:last]
+
+
+def cast_string_value(string: str) -> SIMPLE_VALUE_TYPE:
+    """Return the value of an unquoted token: a bool, None, a number or the string itself.
+
+    The whole token gets classified with a single precompiled fullmatch (see SCALAR_RE), instead of a series
+    of prefix checks followed by a number match.
+    """
+    match = SCALAR_RE.fullmatch(string)
+    if match is None:
+        return string
+    return _SCALAR_CASTS[cast("str", match.lastgroup)](string)
+
+
+_SCALAR_CASTS: dict[str, Callable[[str], SIMPLE_VALUE_TYPE]] = {
+    "true": lambda _: True,
+    "false": lambda _: False,
+    "null": lambda _: None,
+    "int": int,
+    "float": float,
+    "constant": _FLOAT_CONSTANTS.__getitem__,
+}
+
+
+def merge(superior: dict, inferior: dict) -> dict:
+    """Merge two objects recursively. If keys overlap, merge values.
+
+    Neither object is modified. Subtrees untouched by the superior object are shared with the result.
+    """
+    return _merge(superior, inferior, {})
+
+
+def _merge(superior: dict, inferior: dict, owned: dict[int, Any]) -> dict:
+    """Copy nodes only on the modified paths.
+
+    Nodes created during the merge are registered in owned (by id), so that they are copied just once,
+    no matter how many objects are merged into them in a row. Owned keeps the nodes alive, so ids cannot get reused.
+    """
+    result = _own(inferior, owned)
+    for key, value in superior.items():
+        if key not in result:
+            result[key] = value
+            continue
+        result[key] = _ValueMerger.merge(result[key], value, owned)
+    return result
+
+
+_MUTABLE_NODE = TypeVar("_MUTABLE_NODE", dict, UnresolvedDuplication, UnresolvedConcatenation)
+
+
+def _own(node: _MUTABLE_NODE, owned: dict[int, Any]) -> _MUTABLE_NODE:
+    if id(node) in owned:
+        return node
+    node_copy = copy(node)
+    owned[id(node_copy)] = node_copy
+    return node_copy
+
+
+class _ValueMerger:
+    duplication_elem = dict | list | UnresolvedSubstitution | UnresolvedConcatenation
+
+    @classmethod
+    def merge(
+        cls,
+        inferior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        owned: dict[int, Any],
+    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
+        if isinstance(inferior, dict) and isinstance(superior, dict):
+            return _merge(superior, inferior, owned)
+        if isinstance(inferior, UnresolvedDuplication):
+            return cls._merge_with_duplication(inferior, superior, owned)
+        # A simple value overridden by an unresolved one stays as its fallback, in case it turns out undefined.
+        if isinstance(inferior, cls.duplication_elem) or isinstance(superior, ANY_UNRESOLVED):
+            return cls._merge_with_duplication_element(inferior, superior, owned)
+        return superior
+
+    @classmethod
+    def _merge_with_duplication(
+        cls,
+        inferior: UnresolvedDuplication,
+        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        owned: dict[int, Any],
+    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
+        if isinstance(superior, UnresolvedDuplication):
+            duplication = _own(inferior, owned)
+            for value in superior:
+                cls._append(duplication, value, owned)
+            return duplication
+        if isinstance(superior, cls.duplication_elem):
+            duplication = _own(inferior, owned)
+            cls._append(duplication, superior, owned)
+            return duplication
+        return superior
+
+    @classmethod
+    def _merge_with_duplication_element(
+        cls,
+        inferior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        owned: dict[int, Any],
+    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
+        if isinstance(superior, UnresolvedDuplication):
+            duplication = UnresolvedDuplication([inferior])
+            owned[id(duplication)] = duplication
+            for value in superior:
+                cls._append(duplication, value, owned)
+            return duplication
+        if isinstance(superior, cls.duplication_elem):
+            duplication = UnresolvedDuplication([inferior])
+            owned[id(duplication)] = duplication
+            cls._append(duplication, superior, owned)
+            return duplication
+        return superior
+
+    @staticmethod
+    def _append(
+        duplication: UnresolvedDuplication,
+        value: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+        owned: dict[int, Any],
+    ) -> None:
+        """Append value to an owned duplication. Fold consecutive self appends (a += x) into one concatenation."""
+        last = duplication[-1]
+        if isinstance(last, UnresolvedConcatenation) and last.folds_with(value):
+            folded = _own(last, owned)
+            folded.extend(value[1:])
+            duplication[-1] = folded
+        else:
+            duplication.append(value)
@@ -42,6 +42,16 @@ _FLOAT_CONSTANTS = {
     "NaN": float("nan"),
 }
 NUMBER_RE = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?", (re.VERBOSE | re.MULTILINE | re.DOTALL))
+"""Matches a number: integer part, fraction and exponent groups. Kept public, casting uses SCALAR_RE."""
+SCALAR_RE = re.compile(
+    r"(?P<true>true.*)|(?P<false>false.*)|(?P<null>null.*)|(?P<int>-?(?:0|[1-9]\d*))"
+    r"|(?P<float>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)|(?P<constant>-?Infinity|NaN)",
+    re.DOTALL,
+)
+"""Classifies a whole unquoted token (fullmatch): the name of the matched group is its type.
+
+A token starting with true, false or null is that value, a number has to match the whole token.
+"""
 ELEMENT_SEPARATORS = ",\n"
 SECTION_OPENING = "{["
 SECTION_CLOSING = "}]"
@@ -1,5 +1,8 @@
 """Read hocon data file with raw string into a structure of parsed (unresolved!) objects."""
 
+from ._classpath import Classpath, classpath
+from ._key import parse_path
 from ._parser import parse
+from ._url import UrlFetcher, urls
 
-__all__ = ("parse",)
+__all__ = ("Classpath", "UrlFetcher", "classpath", "parse", "parse_path", "urls")
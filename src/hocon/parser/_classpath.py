@@ -0,0 +1,80 @@
+"""Resources for classpath() includes, looked up in packages (also zipped ones) and directories."""
+
+import sys
+import threading
+import zipfile
+from collections.abc import Iterable, Iterator
+from importlib.resources import files
+from importlib.resources.abc import Traversable
+from pathlib import Path
+
+RESOURCE_TYPE = Path | Traversable
+CLASSPATH_ROOT = str | RESOURCE_TYPE
+
+
+class Classpath:
+    """Ordered search roots for classpath() includes, like Java classpath. The first root having a resource wins.
+
+    A root is a package name (str), a directory (Path) or any importlib Traversable. Packages are read
+    through importlib.resources, so packages inside zip files (zipapps, zipped wheels) work without extracting them.
+    All the resource names get indexed on the first lookup, so an include never probes every root.
+    With no roots set, resources are looked up in the sys.path entries (directories and zip files) instead,
+    one by one, since indexing all of them would mean walking every installed package.
+
+    classpath.roots = ["myapp.config", Path("/etc/myapp")]
+    include classpath("db/defaults.conf") ---> myapp/config/db/defaults.conf or /etc/myapp/db/defaults.conf
+    """
+
+    def __init__(self, roots: Iterable[CLASSPATH_ROOT] = ()) -> None:
+        self._lock = threading.Lock()
+        self._roots: list[RESOURCE_TYPE] = []
+        self._index: dict[str, RESOURCE_TYPE] | None = None
+        self.roots = list(roots)
+
+    @property
+    def roots(self) -> list[RESOURCE_TYPE]:
+        return list(self._roots)
+
+    @roots.setter
+    def roots(self, roots: Iterable[CLASSPATH_ROOT]) -> None:
+        traversables = [files(root) if isinstance(root, str) else root for root in roots]
+        with self._lock:
+            self._roots = traversables
+            self._index = None
+
+    def find(self, name: str) -> RESOURCE_TYPE | None:
+        """Return the resource (a slash separated path, relative to a root) or None if no root has it."""
+        with self._lock:
+            if not self._roots:
+                return _find_on_sys_path(name.lstrip("/"))
+            if self._index is None:
+                self._index = {}
+                for root in reversed(self._roots):
+                    self._index.update(_walk(root, ""))
+            return self._index.get(name.lstrip("/"))
+
+
+def _find_on_sys_path(name: str) -> RESOURCE_TYPE | None:
+    for entry in sys.path:
+        root = Path(entry)
+        resource: RESOURCE_TYPE
+        if root.is_dir():
+            resource = root / name
+        elif zipfile.is_zipfile(root):
+            resource = zipfile.Path(root, name)
+        else:
+            continue
+        if resource.is_file():
+            return resource
+    return None
+
+
+def _walk(directory: RESOURCE_TYPE, prefix: str) -> Iterator[tuple[str, RESOURCE_TYPE]]:
+    for resource in directory.iterdir():
+        if resource.is_dir():
+            yield from _walk(resource, f"{prefix}{resource.name}/")
+        elif resource.is_file():
+            yield f"{prefix}{resource.name}", resource
+
+
+classpath = Classpath()
@@ -1,12 +1,13 @@
-from hocon.constants import ELEMENT_SEPARATORS, WHITE_CHARS
+from hocon.constants import ELEMENT_SEPARATORS
 from hocon.exceptions import HOCONUnexpectedBracesError, HOCONUnexpectedSeparatorError
 
+from ._scan import WHITESPACE_RUN, find, scan
 from .data import ParserInput
 
 
 def eat_comments(data: ParserInput, idx: int) -> int:
     while True:
-        if data[idx] == "#" or data[idx : idx + 2] == "//":
+        if data.data[idx] == "#" or data.data[idx : idx + 2] == "//":
             idx = __eat_until_newline(data, idx) + 1
             idx = eat_whitespace(data, idx)
         else:
@@ -14,18 +15,14 @@ def eat_comments(data: ParserInput, idx: int) -> int:
 
 
 def eat_whitespace(data: ParserInput, idx: int) -> int:
-    while True:
-        char = data[idx]
-        if char not in WHITE_CHARS:
-            return idx
-        idx += 1
+    return scan(WHITESPACE_RUN, data, idx)
 
 
 def eat_whitespace_and_comments(data: ParserInput, idx: int) -> int:
     while True:
         old_idx = idx
         idx = eat_whitespace(data, idx)
-        if data[idx] == "#" or data[idx : idx + 2] == "//":
+        if data.data[idx] == "#" or data.data[idx : idx + 2] == "//":
             idx = __eat_until_newline(data, idx) + 1
         if old_idx == idx:
             return idx
@@ -40,16 +37,13 @@ def eat_list_item_separators(data: ParserInput, idx: int) -> tuple[bool, int]:
 
 
 def __eat_until_newline(data: ParserInput, idx: int) -> int:
-    while True:
-        if data[idx] == "\n":
-            return idx
-        idx += 1
+    return find(data, "\n", idx)
 
 
 def __eat_item_separators(data: ParserInput, idx: int, struct_end: str, unexpected_brace: str) -> tuple[bool, int]:
     separators_found = ""
     while True:
-        char = data[idx]
+        char = data.data[idx]
         if char == unexpected_brace:
             msg = "Unexpected closure found"
             raise HOCONUnexpectedBracesError(msg, data, idx)
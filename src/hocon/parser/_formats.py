@@ -0,0 +1,112 @@
+"""Fast paths for included (and root) files that are not HOCON: .json and .properties (see FORMATS).
+
+Both produce trees shaped like the HOCON parser output (substitution-free values are folded, strings are
+QuotedString), so that they merge with (and get resolved like) any other parse tree.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any, cast
+
+from hocon.constants import ROOT_TYPE
+from hocon.strings import QuotedString
+
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def decode_json(data: str) -> ROOT_TYPE | None:
+    """Decode JSON into what resolving its parse tree would return: no parsing, no resolving.
+
+    JSON holds no substitutions, so the result doubles as its parse tree (see FORMATS).
+
+    Decoding is done with the C accelerated json module. Duplicate keys merge (objects) or override, like in HOCON.
+    Return None if data is not a JSON object or array, so that the caller falls back to the HOCON parser
+    (HOCON is a superset of JSON; it also reports errors the HOCON way).
+    """
+    decoded = _decode(data)
+    return None if decoded is None else cast("ROOT_TYPE", _quote(decoded))
+
+
+def _decode(data: str) -> dict[str, Any] | list[Any] | None:
+    """Return None for anything but a JSON object or array. NaN and Infinity are left to the HOCON parser."""
+    if not data.lstrip(_JSON_WHITESPACE).startswith(("{", "[")):
+        return None
+    try:
+        decoded = json.loads(data, object_pairs_hook=_merge_pairs, parse_constant=_reject_constant)
+    except ValueError:
+        return None
+    return decoded if isinstance(decoded, dict | list) else None
+
+
+def _reject_constant(constant: str) -> None:
+    msg = f"{constant} is not JSON"
+    raise ValueError(msg)
+
+
+def _merge_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key, value in pairs:
+        previous = result.get(key)
+        result[key] = _merge(previous, value) if isinstance(previous, dict) and isinstance(value, dict) else value
+    return result
+
+
+def _merge(inferior: dict[str, Any], superior: dict[str, Any]) -> dict[str, Any]:
+    return _merge_pairs([*inferior.items(), *superior.items()])
+
+
+def _quote(value: Any) -> Any:  # noqa: ANN401
+    if type(value) is str:
+        return QuotedString(value)
+    if type(value) is dict:
+        return {key: _quote(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_quote(item) for item in value]
+    return value
+
+
+_LINE_CONTINUATION = re.compile(r"(?<!\\)((?:\\\\)*)\\(?:\r\n|\r|\n)[ \t\f]*")
+_LINE_END = re.compile(r"\r\n|\r|\n")
+_PROPERTY = re.compile(r"((?:[^\\:= \t\f]|\\.)*)[ \t\f]*[:=]?[ \t\f]*(.*)", re.DOTALL)
+_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+_ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "f": "\f"}
+
+
+def parse_properties(data: str) -> dict[str, Any]:
+    """Read java.util.Properties format. Keys are paths split on '.', values are strings.
+
+    If a path is both a value and an object (a=1, a.b=2), the object wins.
+    """
+    result: dict[str, Any] = {}
+    for line in _LINE_END.split(_LINE_CONTINUATION.sub(r"\1", data)):
+        stripped = line.lstrip(" \t\f")
+        if not stripped or stripped[0] in "#!":
+            continue
+        key, value = cast("re.Match[str]", _PROPERTY.match(stripped)).groups()
+        _set_path(result, _unescape(key).split("."), _unescape(value))
+    parse_tree: dict[str, Any] = _quote(result)
+    return parse_tree
+
+
+def _unescape(string: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        escaped = match.group(1)
+        if len(escaped) > 1:
+            return chr(int(escaped[1:], 16))
+        return _ESCAPES.get(escaped, escaped)
+
+    return _ESCAPE.sub(replace, string)
+
+
+def _set_path(result: dict[str, Any], keys: list[str], value: str) -> None:
+    parent = result
+    for key in keys[:-1]:
+        if not isinstance(parent.get(key), dict):
+            parent[key] = {}
+        parent = parent[key]
+    if not isinstance(parent.get(keys[-1]), dict):
+        parent[keys[-1]] = value
+
+
+FORMATS: dict[str, Callable[[str], ROOT_TYPE | None]] = {".json": decode_json, ".properties": parse_properties}
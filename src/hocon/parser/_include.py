@@ -1,55 +1,216 @@
+import posixpath
+import re
+from dataclasses import dataclass, replace
 from enum import StrEnum, auto
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import urljoin
 
 from hocon.exceptions import HOCONIncludeError
+from hocon.parser._classpath import RESOURCE_TYPE, classpath
 from hocon.parser._eat import eat_whitespace_and_comments
 from hocon.parser._quoted_string import parse_quoted_string
+from hocon.parser._url import UrlResource, is_url, urls
 from hocon.parser.data import ParserInput
+from hocon.unresolved import UnresolvedConcatenation, UnresolvedDuplication, UnresolvedSubstitution
+
+_GLOB_MAGIC = re.compile(r"[*?[]")
+INCLUDED_TYPE = RESOURCE_TYPE | UrlResource
+PROBED_EXTENSIONS = (".properties", ".json", ".conf")
 
 
 class IncludeMode(StrEnum):
-    """See https://github.com/lightbend/config/blob/v1.4.3/HOCON.md#include-syntax."""
+    """See https://github.com/lightbend/config/blob/v1.4.3/HOCON.md#include-syntax.
+
+    GLOB is an extension: include glob("conf.d/*.conf") includes all the matching files, in sorted order.
+    """
 
     FILE = auto()
     CLASSPATH = auto()
     URL = auto()
+    GLOB = auto()
     DEFAULT = auto()
 
 
-def parse_include_value(data: ParserInput, idx: int) -> tuple[ParserInput, int]:
+@dataclass(frozen=True)
+class Include:
+    """What an include statement asks for."""
+
+    mode: IncludeMode
+    target: str
+    required: bool
+
+    def locate(self, data: ParserInput) -> INCLUDED_TYPE | None:
+        """Return the included resource: absolute path of a file, a classpath resource or url content.
+
+        Return None if there is no such classpath resource or url (glob includes get expanded instead).
+        Includes without a keyword inside a url or classpath resource are urls or classpath resources relative to it.
+        Classpath and url includes are recorded in data.sources as untracked, caches cannot tell if they changed.
+        """
+        resource: INCLUDED_TYPE | None
+        name = self.classpath_name(data)
+        if name is not None:
+            data.sources.untracked.append(f'classpath("{name}")')
+            resource, description = classpath.find(name), f"classpath resource '{name}'"
+        elif self.mode == IncludeMode.URL or (self.mode == IncludeMode.DEFAULT and is_url(data.absolute_filepath)):
+            url = urljoin(str(data.absolute_filepath), self.target)
+            data.sources.untracked.append(f'url("{url}")')
+            resource = urls.fetch(url, data.encoding, required=self.required)
+            description = f"{self.mode} resource '{self.target}'"
+        else:
+            return (Path(data.absolute_filepath).parent / self.target).absolute()
+        if resource is None and self.required:
+            msg = f"Required {description} not found."
+            raise HOCONIncludeError(msg)
+        return resource
+
+    def classpath_name(self, data: ParserInput) -> str | None:
+        """Return the name of the classpath resource to include, None if this is not a classpath include."""
+        if self.mode == IncludeMode.CLASSPATH:
+            return self.target
+        if self.mode == IncludeMode.DEFAULT and data.classpath_name is not None:
+            return posixpath.normpath(posixpath.join(posixpath.dirname(data.classpath_name), self.target))
+        return None
+
+    def probe(self, data: ParserInput) -> list[INCLUDED_TYPE]:
+        """Return the included resources, in merge order. See locate.
+
+        A file or classpath resource without an extension stands for all of name.properties, name.json
+        and name.conf that exist, merged in this order (so .conf wins). If there are none, it is just name.
+        """
+        if (
+            self.mode != IncludeMode.URL
+            and not is_url(data.absolute_filepath)
+            and not PurePosixPath(self.target).suffix
+        ):
+            probes = [replace(self, target=self.target + extension, required=False) for extension in PROBED_EXTENSIONS]
+            found = [
+                resource for probe in probes if (resource := probe.locate(data)) is not None and _exists(data, resource)
+            ]
+            if found:
+                return found
+        resource = self.locate(data)
+        return [] if resource is None else [resource]
+
+    def expand(self, data: ParserInput) -> list[Path]:
+        """Return absolute paths of the files matching glob pattern, in sorted order. Record them in data.sources."""
+        pattern = str((Path(data.absolute_filepath).parent / self.target).absolute())
+        filepaths = expand_glob(pattern)
+        data.sources.globs[pattern] = filepaths
+        if self.required and not filepaths:
+            msg = f"No file matches required glob include '{self.target}'."
+            raise HOCONIncludeError(msg)
+        return filepaths
+
+
+def expand_glob(pattern: str) -> list[Path]:
+    """Return the files matching an absolute glob pattern (** matches any subdirectories), sorted by path.
+
+    Like glob.glob, hidden files and directories match only a pattern that asks for them (starts a part with a dot).
+    """
+    parts = Path(pattern).parts
+    literal_count = next((index for index, part in enumerate(parts) if _GLOB_MAGIC.search(part)), len(parts))
+    base, relative_parts = Path(*parts[:literal_count]), parts[literal_count:]
+    if not relative_parts:
+        return [base] if base.is_file() else []
+    matches_hidden = any(part.startswith(".") for part in relative_parts)
+    return sorted(
+        path
+        for path in base.glob("/".join(relative_parts))
+        if path.is_file() and (matches_hidden or not any(part.startswith(".") for part in path.relative_to(base).parts))
+    )
+
+
+def parse_include_value(data: ParserInput, idx: int) -> tuple[Include, int]:
     required: bool = False
-    if data[idx : idx + 8] == "required":
+    if data.data[idx : idx + 8] == "required":
         required = True
         idx += 8
-        if data[idx] != "(":
+        if data.data[idx] != "(":
             msg = "Missing '(' bracket in required function!"
             raise HOCONIncludeError(msg, data, idx)
         idx += 1
     include_mode, idx = _read_mode(data, idx)
-    if data[idx : idx + 3] == '"""' or data[idx] != '"':
+    if data.data[idx : idx + 3] == '"""' or data.data[idx] != '"':
         msg = "Only single quoted include filepaths are supported."
         raise HOCONIncludeError(msg, data, idx)
     string, idx = parse_quoted_string(data, idx + 1)
     idx = _eat_closing_brackets(data, idx, include_mode, required=required)
-    content = load_include_content(data, str(string), include_mode, required=required)
-    return content, idx
+    return Include(include_mode, str(string), required), idx
 
 
-def load_include_content(data: ParserInput, string: str, mode: IncludeMode, *, required: bool) -> ParserInput:
-    if mode in {IncludeMode.FILE, IncludeMode.DEFAULT}:
-        external_filepath = Path(data.absolute_filepath).parent / string
-        if not required and not external_filepath.exists():
-            external_data = "{}"
-        else:
-            external_data = external_filepath.read_text(encoding=data.encoding)
-        external_input = ParserInput(data=external_data, absolute_filepath=external_filepath, encoding=data.encoding)
-        ext_idx = eat_whitespace_and_comments(external_input, 0)
-        if external_input[ext_idx] == "[":
-            msg = f"An included file '{string}' must contain an object, not an array."
-            raise HOCONIncludeError(msg)
-        return external_input
-    msg = f"Include {mode=} not implemented"
-    raise NotImplementedError(msg)
+def _exists(data: ParserInput, resource: INCLUDED_TYPE) -> bool:
+    """Only files get located without checking if they exist. Missing ones are recorded, in case they appear later."""
+    if not isinstance(resource, Path) or resource.is_file():
+        return True
+    data.sources.files.setdefault(resource, None)
+    return False
+
+
+def resource_path(resource: INCLUDED_TYPE) -> Path:
+    """Return path of an included resource. Zipped resources get a path inside the archive, like app.pyz/pkg/a.conf.
+
+    Urls become paths like http:/host/a.conf, which are good enough as cache keys.
+    """
+    return resource if isinstance(resource, Path) else Path(str(resource))
+
+
+def load_include_content(data: ParserInput, include: Include, resource: INCLUDED_TYPE) -> ParserInput | None:
+    """Read the included resource. Return None if it is missing and not required."""
+    external_data = _read_include(data, include, resource)
+    if isinstance(resource, Path):
+        data.sources.files[resource] = external_data
+    if external_data is None:
+        return None
+    return ParserInput(
+        data=external_data,
+        absolute_filepath=resource.url if isinstance(resource, UrlResource) else resource_path(resource),
+        encoding=data.encoding,
+        sources=data.sources,
+        prefetcher=data.prefetcher,
+        classpath_name=include.classpath_name(data),
+    )
+
+
+def assert_object_included(include: Include, external_parsed: ParserInput) -> None:
+    ext_idx = eat_whitespace_and_comments(external_parsed, 0)
+    if external_parsed[ext_idx] == "[":
+        msg = f"An included file '{include.target}' must contain an object, not an array."
+        raise HOCONIncludeError(msg)
+
+
+def _read_include(data: ParserInput, include: Include, resource: INCLUDED_TYPE) -> str | None:
+    """Return content of the included file, or None if it is missing and not required."""
+    if isinstance(resource, UrlResource):
+        return resource.text
+    if not isinstance(resource, Path):
+        return resource.read_text(encoding=data.encoding)
+    external_filepath = resource
+    if data.prefetcher is not None:
+        return data.prefetcher.read_text(external_filepath, required=include.required)
+    if not include.required and not external_filepath.exists():
+        return None
+    return external_filepath.read_text(encoding=data.encoding)
+
+
+def reroot(value: Any, old_root: tuple[str, ...], new_root: tuple[str, ...]) -> Any:  # noqa: ANN401
+    """Copy a parsed (included) tree, moving its substitutions from under old_root to under new_root.
+
+    Only substitutions depend on where the tree got included. Everything that holds them is copied,
+    since merging and resolving modify the tree in place. Strings are immutable, so they are shared.
+    """
+    if isinstance(value, UnresolvedSubstitution):
+        return UnresolvedSubstitution(
+            value.keys,
+            value.optional,
+            relative_location=value.relative_location,
+            including_root=new_root + value.including_root[len(old_root) :],
+        )
+    if type(value) is dict:
+        return {key: reroot(item, old_root, new_root) for key, item in value.items()}
+    if isinstance(value, list | UnresolvedConcatenation | UnresolvedDuplication):
+        return type(value)(reroot(item, old_root, new_root) for item in value)
+    return value
 
 
 def _eat_closing_brackets(data: ParserInput, idx: int, include_mode: IncludeMode, *, required: bool) -> int:
@@ -61,7 +222,7 @@ def _eat_closing_brackets(data: ParserInput, idx: int, include_mode: IncludeMode
 
 
 def _eat_closing_bracket(data: ParserInput, idx: int) -> int:
-    if data[idx] == ")":
+    if data.data[idx] == ")":
         return idx + 1
     msg = "Missing closing ')' bracket in include statement!"
     raise HOCONIncludeError(msg, data, idx)
@@ -70,17 +231,17 @@ def _eat_closing_bracket(data: ParserInput, idx: int) -> int:
 def _read_mode(data: ParserInput, idx: int) -> tuple[IncludeMode, int]:
     for mode in IncludeMode:
         mode_len = len(str(mode))
-        if data[idx : idx + mode_len] != mode:
+        if data.data[idx : idx + mode_len] != mode:
             continue
         idx += mode_len
-        if data[idx] != "(":
+        if data.data[idx] != "(":
             msg = "Missing '(' bracket!"
             raise HOCONIncludeError(msg, data, idx)
         idx += 1
         break
     else:
         mode = IncludeMode.DEFAULT
-    if data[idx] == '"':
+    if data.data[idx] == '"':
         return mode, idx
     msg = "Unsupported include syntax!"
     raise HOCONIncludeError(msg, data, idx)
@@ -2,6 +2,7 @@ from collections import UserString
 from dataclasses import dataclass
 
 from hocon.constants import WHITE_CHARS
+from hocon.exceptions import HOCONInvalidKeyError
 from hocon.strings import UnquotedString
 
 from ._eat import eat_comments
@@ -28,8 +29,8 @@ def parse_keypath(data: ParserInput, idx: int = 0, keyend_indicator: str = ":={"
         if not keychunks_list[-1] and string.startswith("include") and type(string) is UnquotedString:
             return Keypath(keys=[], end_idx=idx, include=True)
         keychunks_list[-1].append(str(string))
-        char = data[idx]
-        if data[idx] in keyend_indicator or data[idx : idx + 2] == "+=":
+        char = data.data[idx]
+        if data.data[idx] in keyend_indicator or data.data[idx : idx + 2] == "+=":
             if isinstance(string, UnquotedString):
                 keychunks_list[-1][-1] = keychunks_list[-1][-1].rstrip(WHITE_CHARS)
             keys = ["".join(chunks) for chunks in keychunks_list]
@@ -38,14 +39,23 @@ def parse_keypath(data: ParserInput, idx: int = 0, keyend_indicator: str = ":={"
             if char == "+":
                 return Keypath(keys, idx + 2, iadd=True)
             return Keypath(keys, idx + 1)
-        if data[idx] == ".":
+        if data.data[idx] == ".":
             idx += 1
             keychunks_list.append([])
 
 
+def parse_path(path: str) -> list[str]:
+    """Split a path expression (like a.b."c.d") into keys, the same way substitution keypaths are parsed."""
+    keypath = parse_keypath(ParserInput(path + "}", ""), keyend_indicator="}")
+    if keypath.end_idx != len(path) + 1:
+        msg = f"Invalid path expression: {path}"
+        raise HOCONInvalidKeyError(msg)
+    return keypath.keys
+
+
 def _parse_key_chunk(data: ParserInput, idx: int) -> tuple[UserString, int]:
-    char = data[idx]
-    if data[idx : idx + 3] == '"""':
+    char = data.data[idx]
+    if data.data[idx : idx + 3] == '"""':
         string, idx = parse_triple_quoted_string(data, idx + 3)
     elif char == '"':
         string, idx = parse_quoted_string(data, idx + 1)
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -14,30 +15,68 @@ from ._eat import (
     eat_whitespace,
     eat_whitespace_and_comments,
 )
-from ._include import parse_include_value
+from ._formats import FORMATS
+from ._include import (
+    INCLUDED_TYPE,
+    Include,
+    IncludeMode,
+    assert_object_included,
+    load_include_content,
+    parse_include_value,
+    reroot,
+    resource_path,
+)
 from ._key import parse_keypath
+from ._prefetch import IncludePrefetcher
 from ._simple_value import parse_simple_value
 from ._value_utils import (
     assert_no_content_left,
     convert_iadd_to_self_referential_substitution,
+    fold_concatenation,
     merge_unconcatenated,
 )
-from .data import ParserInput
+from .data import ParserInput, Sources
+
 
+def parse(
+    data: str,
+    root_filepath: str | Path | None = None,
+    encoding: str = "UTF-8",
+    sources: Sources | None = None,
+    *,
+    prefetch_includes: bool = False,
+) -> ROOT_TYPE:
+    """Parse data. Every included file read gets recorded in sources, if given.
 
-def parse(data: str, root_filepath: str | Path | None = None, encoding: str = "UTF-8") -> ROOT_TYPE:
+    Its include_cache shows how many includes were served from the cache (see IncludeCache).
+    With prefetch_includes, included files are read on a thread pool ahead of the parser (see IncludePrefetcher).
+    """
     root_filepath = root_filepath or Path.cwd()
     if not data:
         msg = "Empty string provided"
         raise HOCONNoDataError(msg)
-    data_object = ParserInput(data, Path(root_filepath), encoding=encoding)
-    return _parse(data_object)
+    parse_format = FORMATS.get(Path(root_filepath).suffix)
+    parsed = None if parse_format is None else parse_format(data)
+    if parsed is not None:
+        return parsed
+    data_object = ParserInput(
+        data,
+        Path(root_filepath),
+        encoding=encoding,
+        sources=sources or Sources(),
+    )
+    if not prefetch_includes:
+        return _parse(data_object)
+    with IncludePrefetcher(encoding) as prefetcher:
+        prefetcher.prefetch(data, Path(root_filepath))
+        data_object.prefetcher = prefetcher
+        return _parse(data_object)
 
 
 def _parse(data: ParserInput, idx: int = 0) -> ROOT_TYPE:
     result: ROOT_TYPE
     idx = eat_whitespace_and_comments(data, idx)
-    if data[idx] == "[":
+    if data.data[idx] == "[":
         result, idx = parse_list(data, idx=idx + 1)
     else:
         result, idx = _parse_root_dict(data, idx=idx)
@@ -46,7 +85,7 @@ def _parse(data: ParserInput, idx: int = 0) -> ROOT_TYPE:
 
 
 def _parse_root_dict(data: ParserInput, idx: int = 0) -> tuple[dict, int]:
-    if data[idx] == "{":
+    if data.data[idx] == "{":
         result, idx = parse_dict(data, idx=idx + 1)
     else:
         data.data += "\n}"
@@ -54,51 +93,54 @@ def _parse_root_dict(data: ParserInput, idx: int = 0) -> tuple[dict, int]:
     return result, idx
 
 
-def parse_dict(data: ParserInput, idx: int = 0, current_keypath: list[str] | None = None) -> tuple[dict, int]:
-    if current_keypath is None:
-        current_keypath = []
+def parse_dict(data: ParserInput, idx: int = 0, current_keypath: tuple[str, ...] = ()) -> tuple[dict, int]:
+    """Keypaths are tuples, so the path of a value is shared by all the substitutions inside it.
+
+    Values without substitutions are folded to their final values (see fold_concatenation), so are list elements.
+    """
     unconcatenated_dictionary: dict = {}
     while True:
         idx = eat_whitespace_and_comments(data, idx)
-        if data[idx] == "}":
+        if data.data[idx] == "}":
             idx += 1
             break
         keypath = parse_keypath(data, idx=idx)
         if keypath.include:
-            ext_dict, idx = parse_include(data, idx=keypath.end_idx, current_keypath=current_keypath)
-            for ext_key, ext_value in ext_dict.items():
-                unconcatenated_dictionary = merge_unconcatenated(unconcatenated_dictionary, [ext_key], ext_value)
+            ext_dicts, idx = parse_include(data, idx=keypath.end_idx, current_keypath=current_keypath)
+            for ext_dict in ext_dicts:
+                for ext_key, ext_value in ext_dict.items():
+                    merge_unconcatenated(unconcatenated_dictionary, [ext_key], ext_value)
             continue
         idx = eat_whitespace(data, keypath.end_idx)
-        unconcatenated_value, idx = parse_dict_value(data, idx=idx, current_keypath=current_keypath + keypath.keys)
+        value_keypath = current_keypath + tuple(keypath.keys)
+        unconcatenated_value, idx = parse_dict_value(data, idx=idx, current_keypath=value_keypath)
+        value = fold_concatenation(unconcatenated_value)
         if keypath.iadd:
-            unconcatenated_value = convert_iadd_to_self_referential_substitution(
+            value = convert_iadd_to_self_referential_substitution(
                 keypath.keys,
-                unconcatenated_value,
-                current_keypath=current_keypath + keypath.keys,
+                value,
+                current_keypath=value_keypath,
                 root_location=data.root_path,
             )
-        unconcatenated_dictionary = merge_unconcatenated(unconcatenated_dictionary, keypath.keys, unconcatenated_value)
+        merge_unconcatenated(unconcatenated_dictionary, keypath.keys, value)
     return unconcatenated_dictionary, idx
 
 
-def parse_list(data: ParserInput, idx: int = 0, current_keypath: list[str] | None = None) -> tuple[list, int]:
-    if current_keypath is None:
-        current_keypath = []
-    unconcatenated_list: list[UnresolvedConcatenation] = []
+def parse_list(data: ParserInput, idx: int = 0, current_keypath: tuple[str, ...] = ()) -> tuple[list, int]:
+    unconcatenated_list: list[ANY_VALUE_TYPE | UnresolvedConcatenation] = []
     index = 0
     while True:
         idx = eat_whitespace_and_comments(data, idx)
-        if data[idx] == "]":
+        if data.data[idx] == "]":
             idx += 1
             return unconcatenated_list, idx
-        unconcatenated_value, idx = parse_list_element(data, idx=idx, current_keypath=[*current_keypath, str(index)])
-        unconcatenated_list.append(unconcatenated_value)
+        unconcatenated_value, idx = parse_list_element(data, idx=idx, current_keypath=(*current_keypath, str(index)))
+        unconcatenated_list.append(fold_concatenation(unconcatenated_value))
         index += 1
 
 
-def parse_value_chunk(data: ParserInput, idx: int, current_keypath: list[str]) -> tuple[Any, int]:
-    char = data[idx]
+def parse_value_chunk(data: ParserInput, idx: int, current_keypath: tuple[str, ...]) -> tuple[Any, int]:
+    char = data.data[idx]
     if char == "{":
         dictionary, idx = parse_dict(data, idx=idx + 1, current_keypath=current_keypath)
         return dictionary, idx
@@ -111,7 +153,7 @@ def parse_value_chunk(data: ParserInput, idx: int, current_keypath: list[str]) -
 def parse_dict_value(
     data: ParserInput,
     idx: int,
-    current_keypath: list[str],
+    current_keypath: tuple[str, ...],
 ) -> tuple[UnresolvedConcatenation[ANY_VALUE_TYPE | ANY_UNRESOLVED], int]:
     values: UnresolvedConcatenation[ANY_VALUE_TYPE | ANY_UNRESOLVED] = UnresolvedConcatenation()
     while True:
@@ -129,7 +171,7 @@ def parse_dict_value(
 def parse_list_element(
     data: ParserInput,
     idx: int,
-    current_keypath: list[str],
+    current_keypath: tuple[str, ...],
 ) -> tuple[UnresolvedConcatenation[ANY_VALUE_TYPE | ANY_UNRESOLVED], int]:
     values: UnresolvedConcatenation[ANY_VALUE_TYPE | ANY_UNRESOLVED] = UnresolvedConcatenation()
     while True:
@@ -144,12 +186,75 @@ def parse_list_element(
             return values, idx
 
 
-def parse_include(data: ParserInput, idx: int, current_keypath: list[str]) -> tuple[dict, int]:
-    """We start parsing right after 'include' phrase here."""
+def parse_include(data: ParserInput, idx: int, current_keypath: tuple[str, ...]) -> tuple[list[dict], int]:
+    """We start parsing right after 'include' phrase here. Return parsed files to merge, in order.
+
+    Glob includes read all the matching files concurrently (see IncludePrefetcher), but merge them in sorted order.
+    """
     idx = eat_whitespace_and_comments(data, idx)
-    external_parsed, idx = parse_include_value(data, idx)
-    external_parsed.root_path = data.root_path + current_keypath
+    include, idx = parse_include_value(data, idx)
+    root_path = data.root_path + current_keypath
+    if include.mode != IncludeMode.GLOB:
+        return [_parse_included_file(data, include, resource, root_path) for resource in include.probe(data)], idx
+    filepaths = include.expand(data)
+    if data.prefetcher is not None:
+        data.prefetcher.prefetch_files(filepaths)
+        return [_parse_included_file(data, include, filepath, root_path) for filepath in filepaths], idx
+    with IncludePrefetcher(data.encoding) as prefetcher:
+        prefetcher.prefetch_files(filepaths)
+        data_with_prefetch = replace(data, prefetcher=prefetcher)
+        return [_parse_included_file(data_with_prefetch, include, filepath, root_path) for filepath in filepaths], idx
+
+
+def _parse_included_file(
+    data: ParserInput,
+    include: Include,
+    resource: INCLUDED_TYPE,
+    root_path: tuple[str, ...],
+) -> dict:
+    """Each file is read and parsed once per document, repeated includes get a copy of the cached tree.
+
+    Whether the tree is included at the document root is part of the cache key, because it changes the parse tree:
+    a += x folds with previous appends only at the root (see fold_self_append).
+    JSON and .properties trees are not cached: they hold no substitutions, and decoding them again is cheaper than
+    copying them.
+    Missing optional files are not cached, so that a later required include of the same file still fails.
+    """
+    if resource_path(resource).suffix in FORMATS:
+        return _parse_included_resource(data, include, resource, root_path)
+    cache = data.sources.include_cache
+    key = (resource_path(resource), data.encoding, not root_path)
+    if key in cache.trees:
+        cache.hits += 1
+        external_dict, parsed_root_path = cache.trees[key]
+    else:
+        cache.misses += 1
+        external_dict = _parse_included_resource(data, include, resource, root_path)
+        if isinstance(resource, Path) and data.sources.files[resource] is None:
+            return external_dict
+        cache.trees[key] = (external_dict, root_path)
+        parsed_root_path = root_path
+    rerooted: dict = reroot(external_dict, parsed_root_path, root_path)
+    return rerooted
+
+
+def _parse_included_resource(
+    data: ParserInput,
+    include: Include,
+    resource: INCLUDED_TYPE,
+    root_path: tuple[str, ...],
+) -> dict:
+    """Parse .json and .properties resources with their fast paths (see FORMATS), anything else as HOCON."""
+    external_parsed = load_include_content(data, include, resource)
+    if external_parsed is None:
+        return {}
+    parse_format = FORMATS.get(resource_path(resource).suffix)
+    external_dict = None if parse_format is None else parse_format(external_parsed.data)
+    if isinstance(external_dict, dict):
+        return external_dict
+    assert_object_included(include, external_parsed)
+    external_parsed.root_path = root_path
     ext_idx = eat_whitespace_and_comments(external_parsed, 0)
     external_dict, ext_idx = _parse_root_dict(external_parsed, idx=ext_idx)
     assert_no_content_left(external_parsed, ext_idx)
-    return external_dict, idx
+    return external_dict
@@ -0,0 +1,68 @@
+"""Opt-in concurrent reading of included files, ahead of the parser."""
+
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+INCLUDE_STATEMENT = re.compile(r'\binclude\s+(?:required\()?(?:file\()?"([^"\\\n]*)"')
+
+
+class IncludePrefetcher:
+    """Read files included (directly or transitively) by a document on a thread pool.
+
+    Include statements are found with a regex pre-scan, which may miss some of them or find false ones
+    (e.g. inside strings or comments). Either way the parser alone decides what gets included and in which order:
+    prefetched files are taken from here, the others are read on the spot.
+    Read errors are kept until the parser asks for the file, so they surface exactly where they would without prefetch.
+    """
+
+    def __init__(self, encoding: str, max_workers: int | None = None) -> None:
+        self.encoding = encoding
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="hocon-include")
+        self._reads: dict[Path, Future[str]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(cancel_futures=True)
+
+    def prefetch(self, data: str, filepath: Path) -> None:
+        """Start reading every file data (read from filepath) seems to include."""
+        self.prefetch_files(
+            [(filepath.parent / match.group(1)).absolute() for match in INCLUDE_STATEMENT.finditer(data)],
+        )
+
+    def prefetch_files(self, paths: list[Path]) -> None:
+        """Start reading all the files (and the files they seem to include)."""
+        with self._lock:
+            for path in paths:
+                if not self._closed and path not in self._reads:
+                    self._reads[path] = self._executor.submit(self._read, path)
+
+    def read_text(self, path: Path, *, required: bool) -> str | None:
+        """Return content of the file, or None if it is missing and not required."""
+        future = self._reads.get(path)
+        try:
+            return path.read_text(encoding=self.encoding) if future is None else future.result()
+        except OSError:
+            if required or path.exists():
+                raise
+            return None
+
+    def _read(self, path: Path) -> str:
+        text = path.read_text(encoding=self.encoding)
+        self.prefetch(text, path)
+        return text
@@ -2,6 +2,7 @@ from _json import scanstring
 
 from hocon.strings import QuotedString
 
+from ._scan import QUOTES_RUN, find, run_end
 from .data import ParserInput
 
 
@@ -11,14 +12,7 @@ def parse_quoted_string(data: ParserInput, idx: int) -> tuple[QuotedString, int]
 
 
 def parse_triple_quoted_string(data: ParserInput, idx: int) -> tuple[QuotedString, int]:
-    string = ""
-    while True:
-        if data[idx : idx + 3] == '"""':
-            break
-        string += data[idx]
-        idx += 1
-    while True:
-        if data[idx + 1 : idx + 4] != '"""':
-            return QuotedString(string), idx + 3
-        string += data[idx]
-        idx += 1
+    """Read until the last 3 quotes of a closing quote run. Any extra quotes belong to the string."""
+    closing_start = find(data, '"""', idx)
+    closing_end = run_end(QUOTES_RUN, data, closing_start)
+    return QuotedString(data.data[idx : closing_end - 3]), closing_end
@@ -0,0 +1,51 @@
+"""Scanners consuming whole runs of characters with a single precompiled regex / str.find call."""
+
+import re
+
+from hocon.constants import INLINE_WHITE_CHARS, UNQUOTED_STR_FORBIDDEN_CHARS, WHITE_CHARS
+
+from .data import ParserInput
+
+
+def _run_of(chars: str) -> re.Pattern[str]:
+    return re.compile(f"[{re.escape(chars)}]*")
+
+
+def _run_until(chars: str) -> re.Pattern[str]:
+    """Match everything up to one of the chars or a '//' comment opening."""
+    return re.compile(f"(?:[^{re.escape(chars)}/]|/(?!/))*")
+
+
+WHITESPACE_RUN = _run_of(WHITE_CHARS)
+INLINE_WHITESPACE_RUN = _run_of(INLINE_WHITE_CHARS)
+QUOTES_RUN = _run_of('"')
+UNQUOTED_VALUE_RUN = _run_until(UNQUOTED_STR_FORBIDDEN_CHARS + WHITE_CHARS)
+UNQUOTED_KEY_RUN = _run_until(UNQUOTED_STR_FORBIDDEN_CHARS + ".")
+
+
+def run_end(pattern: re.Pattern[str], data: ParserInput, idx: int) -> int:
+    """Return the index right after the run of pattern starting at idx."""
+    match = pattern.match(data.data, idx)
+    return match.end() if match else idx
+
+
+def scan(pattern: re.Pattern[str], data: ParserInput, idx: int) -> int:
+    """Return the index right after the run of pattern starting at idx.
+
+    Running into the end of data raises IndexError, exactly like reading data char by char would.
+    """
+    match = pattern.match(data.data, idx)
+    end = match.end() if match else idx
+    if end >= len(data.data):
+        msg = "string index out of range"
+        raise IndexError(msg)
+    return end
+
+
+def find(data: ParserInput, substring: str, idx: int) -> int:
+    """Return the index of the first substring occurrence at or after idx. Raise IndexError if there is none."""
+    position = data.data.find(substring, idx)
+    if position == -1:
+        msg = "string index out of range"
+        raise IndexError(msg)
+    return position
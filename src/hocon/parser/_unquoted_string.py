@@ -1,4 +1,4 @@
-from hocon.constants import SECTION_OPENING, UNQUOTED_STR_FORBIDDEN_CHARS, WHITE_CHARS
+from hocon.constants import SECTION_OPENING
 from hocon.exceptions import (
     HOCONInvalidKeyError,
     HOCONUnexpectedSeparatorError,
@@ -6,49 +6,39 @@ from hocon.exceptions import (
 )
 from hocon.strings import UnquotedString
 
+from ._scan import UNQUOTED_KEY_RUN, UNQUOTED_VALUE_RUN, scan
 from .data import ParserInput
 
 
 def _parse_unquoted_string_value(data: ParserInput, idx: int) -> tuple[UnquotedString, int]:
-    unquoted_string_end = UNQUOTED_STR_FORBIDDEN_CHARS + WHITE_CHARS
-    string = ""
-    while True:
-        char = data[idx]
-        if char in SECTION_OPENING:
-            msg = f"Forbidden opening '{char}' found when parsing unquoted string."
-            raise HOCONUnquotedStringError(msg)
-        if char in unquoted_string_end or data[idx : idx + 2] == "//":
-            if not string:
-                msg = "Error when parsing unquoted string"
-                raise HOCONUnquotedStringError(msg, data, idx)
-            return UnquotedString(string), idx
-        string += char
-        idx += 1
+    end = scan(UNQUOTED_VALUE_RUN, data, idx)
+    char = data.data[end]
+    if char in SECTION_OPENING:
+        msg = f"Forbidden opening '{char}' found when parsing unquoted string."
+        raise HOCONUnquotedStringError(msg)
+    if end == idx:
+        msg = "Error when parsing unquoted string"
+        raise HOCONUnquotedStringError(msg, data, idx)
+    return UnquotedString(data.data[idx:end]), end
 
 
 def _parse_unquoted_string_key(data: ParserInput, idx: int) -> tuple[UnquotedString, int]:
-    string_end = UNQUOTED_STR_FORBIDDEN_CHARS + "."
-    string = ""
-    while True:
-        char = data[idx]
-        if string == "include":
-            return UnquotedString(string), idx
-        if char in string_end or data[idx : idx + 2] == "//":
-            if not string:
-                _raise_parse_key_exception(data, idx)
-            return UnquotedString(string), idx
-        string += char
-        idx += 1
+    if data.data.startswith("include", idx):
+        return UnquotedString("include"), idx + 7
+    end = scan(UNQUOTED_KEY_RUN, data, idx)
+    if end == idx:
+        _raise_parse_key_exception(data, idx)
+    return UnquotedString(data.data[idx:end]), end
 
 
 def _raise_parse_key_exception(data: ParserInput, idx: int) -> None:
-    if data[idx] == ",":
+    if data.data[idx] == ",":
         msg = "Excessive leading comma found in a dictionary"
         raise HOCONUnexpectedSeparatorError(msg, data, idx)
-    if data[idx] in "{[":
+    if data.data[idx] in "{[":
         msg = "Objects and arrays do not make sense as field keys"
         raise HOCONInvalidKeyError(msg, data, idx)
-    if data[idx] == ".":
+    if data.data[idx] == ".":
         msg = "Keypath separator '.' used in an invalid way"
         raise HOCONInvalidKeyError(msg, data, idx)
     if idx == len(data.data) - 1:
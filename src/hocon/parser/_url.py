@@ -0,0 +1,206 @@
+"""Resources for url() includes, fetched over pooled keep-alive connections and cached on disk."""
+
+import hashlib
+import http.client
+import json
+import tempfile
+import threading
+from dataclasses import dataclass
+from email.message import Message
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from hocon.exceptions import HOCONIncludeError
+
+MAX_REDIRECTS = 5
+_MISSING = frozenset({HTTPStatus.NOT_FOUND, HTTPStatus.GONE})
+_REDIRECTS = frozenset(
+    {
+        HTTPStatus.MOVED_PERMANENTLY,
+        HTTPStatus.FOUND,
+        HTTPStatus.SEE_OTHER,
+        HTTPStatus.TEMPORARY_REDIRECT,
+        HTTPStatus.PERMANENT_REDIRECT,
+    },
+)
+
+
+@dataclass(frozen=True)
+class UrlResource:
+    """Content of an included url, decoded with the charset the server declared (or the document encoding)."""
+
+    url: str
+    text: str
+
+    def __str__(self) -> str:
+        return self.url
+
+
+@dataclass(frozen=True)
+class _Response:
+    status: int
+    headers: Message
+    body: bytes
+
+
+class UrlFetcher:
+    """Fetch url() includes over persistent connections, one per scheme, host and port.
+
+    With cache_dir set, every fetched body is stored on disk along with its ETag / Last-Modified headers.
+    The next fetch is a conditional request (304 Not Modified just reads the stored body), and if the host
+    is unreachable (or fails with 5xx), the stored body is used instead.
+
+    urls.cache_dir = Path("/var/cache/myapp/hocon")
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, timeout: float = 10.0) -> None:
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.timeout = timeout
+        self._connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, encoding: str, *, required: bool = True) -> UrlResource | None:
+        """Return the resource under url (decoded with the charset sent by the server or encoding) or None (404/410).
+
+        Unless required, an unreachable host with no stored body counts as missing too, like a missing file.
+        """
+        cached = self._read_cache(url)
+        try:
+            response, final_url = self._get(url, {} if cached is None else _conditional_headers(cached[0]))
+        except (OSError, http.client.HTTPException):
+            if cached is None and required:
+                raise
+            return None if cached is None else _cached_resource(url, cached, encoding)
+        if cached is not None and (
+            response.status == HTTPStatus.NOT_MODIFIED or response.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+        ):
+            return _cached_resource(url, cached, encoding)
+        if response.status in _MISSING:
+            return None
+        if response.status != HTTPStatus.OK:
+            msg = f"Could not include {final_url}: HTTP {response.status}."
+            raise HOCONIncludeError(msg)
+        charset = response.headers.get_content_charset()
+        self._write_cache(url, response, charset)
+        return UrlResource(url, response.body.decode(charset or encoding))
+
+    def close(self) -> None:
+        """Close all the pooled connections."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+    def _get(self, url: str, headers: dict[str, str]) -> tuple[_Response, str]:
+        for _ in range(MAX_REDIRECTS):
+            response = self._request(url, headers)
+            if response.status not in _REDIRECTS:
+                return response, url
+            url = urljoin(url, response.headers["Location"])
+        msg = f"Could not include {url}: more than {MAX_REDIRECTS} redirects."
+        raise HOCONIncludeError(msg)
+
+    def _request(self, url: str, headers: dict[str, str]) -> _Response:
+        """GET url on a pooled connection. A stale pooled connection (closed by the server) is replaced once.
+
+        The lock guards the pool only, so concurrent requests (to the same host too) do not wait for each other.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        with self._lock:
+            connection = self._connections.pop(key, None)
+        if connection is not None:
+            try:
+                return self._send(key, connection, target, headers)
+            except (OSError, http.client.HTTPException):
+                connection.close()
+        return self._send(key, self._connect(parts.scheme, parts.netloc), target, headers)
+
+    def _send(
+        self,
+        key: tuple[str, str],
+        connection: http.client.HTTPConnection,
+        target: str,
+        headers: dict[str, str],
+    ) -> _Response:
+        """Send the request and read the whole response, so that the connection can go back to the pool.
+
+        The pool keeps one connection per host, a connection freed while another one is pooled gets closed.
+        """
+        connection.request("GET", target, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        if response.will_close:
+            connection.close()
+        else:
+            with self._lock:
+                pooled = self._connections.setdefault(key, connection)
+            if pooled is not connection:
+                connection.close()
+        return _Response(response.status, response.headers, body)
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        if scheme == "http":
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        msg = f"Only http and https urls can be included, got {scheme}."
+        raise HOCONIncludeError(msg)
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path] | None:
+        if self.cache_dir is None:
+            return None
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{name}.json", self.cache_dir / f"{name}.body"
+
+    def _read_cache(self, url: str) -> tuple[dict[str, str], bytes] | None:
+        paths = self._cache_paths(url)
+        if paths is None:
+            return None
+        try:
+            return json.loads(paths[0].read_text()), paths[1].read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, url: str, response: _Response, charset: str | None) -> None:
+        paths = self._cache_paths(url)
+        if paths is None:
+            return
+        validators = {"ETag": response.headers.get("ETag"), "Last-Modified": response.headers.get("Last-Modified")}
+        meta = {name: value for name, value in validators.items() if value is not None}
+        if charset is not None:
+            meta["charset"] = charset
+        paths[0].parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(paths[1], response.body)
+        _write_atomically(paths[0], json.dumps(meta).encode())
+
+
+def is_url(location: str | Path) -> bool:
+    """Check if location (of an included resource) is a url. Files are always located by a Path."""
+    return isinstance(location, str) and urlsplit(location).scheme in {"http", "https"}
+
+
+def _conditional_headers(meta: dict[str, str]) -> dict[str, str]:
+    headers = {}
+    if "ETag" in meta:
+        headers["If-None-Match"] = meta["ETag"]
+    if "Last-Modified" in meta:
+        headers["If-Modified-Since"] = meta["Last-Modified"]
+    return headers
+
+
+def _cached_resource(url: str, cached: tuple[dict[str, str], bytes], encoding: str) -> UrlResource:
+    meta, body = cached
+    return UrlResource(url, body.decode(meta.get("charset") or encoding))
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """Write to a temporary file and move it in place, so that concurrent fetches never read a partial file."""
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as file:
+        file.write(content)
+    Path(file.name).replace(path)
+
+
+urls = UrlFetcher()
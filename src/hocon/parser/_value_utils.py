@@ -1,55 +1,136 @@
 """Utils for dictionary value / list element evaluation."""
 
-from copy import deepcopy
 from functools import reduce
 
-from hocon.exceptions import HOCONExcessiveDataError
+from hocon._value_utils import cast_string_value, merge, resolve_simple_value
+from hocon.constants import ANY_VALUE_TYPE
+from hocon.exceptions import HOCONConcatenationError, HOCONExcessiveDataError
 from hocon.parser._eat import eat_comments, eat_whitespace
 from hocon.parser.data import ParserInput
+from hocon.strings import UnquotedString
 from hocon.unresolved import (
+    ANY_UNRESOLVED,
     UnresolvedConcatenation,
     UnresolvedDuplication,
     UnresolvedSubstitution,
 )
 
 
+def fold_concatenation(concatenation: UnresolvedConcatenation) -> ANY_VALUE_TYPE | UnresolvedConcatenation:
+    """Return the final value of a concatenation without substitutions, the same the resolver would return.
+
+    Strings get joined (a single unquoted one gets cast), lists concatenated and objects merged.
+    Their elements and values are folded already. A concatenation with substitutions (or an invalid one)
+    is returned as it is, for the resolver.
+    """
+    end = len(concatenation)
+    while end > 1 and _is_unquoted_space(concatenation[end - 1]):
+        end -= 1
+    if end == 1:
+        return _fold_single_value(concatenation)
+    values = _sanitize_literal(concatenation)
+    if values is None:
+        return concatenation
+    if len(values) == 1:
+        return _fold_single_value(values)
+    if type(values[0]) is list:
+        return [element for value in values for element in value]
+    if type(values[0]) is dict:
+        merged: dict = reduce(lambda inferior, superior: merge(superior, inferior), values)
+        return merged
+    return resolve_simple_value(list(values))
+
+
+def _sanitize_literal(concatenation: UnresolvedConcatenation) -> UnresolvedConcatenation | None:
+    """Return the sanitized concatenation. None if it has substitutions, is empty or mixes types."""
+    if concatenation.has_substitutions():
+        return None
+    try:
+        values = concatenation.sanitize()
+    except HOCONConcatenationError:
+        return None
+    return values or None
+
+
+def _fold_single_value(concatenation: UnresolvedConcatenation) -> ANY_VALUE_TYPE | UnresolvedConcatenation:
+    """Fold the most common concatenation: a single value followed by nothing but unquoted space."""
+    value: ANY_VALUE_TYPE | UnresolvedSubstitution = concatenation[0]
+    if type(value) is UnquotedString:
+        return concatenation if value.is_empty() else cast_string_value(str(value))
+    if isinstance(value, UnresolvedSubstitution):
+        return concatenation
+    return value
+
+
+def _is_unquoted_space(value: object) -> bool:
+    return type(value) is UnquotedString and value.is_empty()
+
+
 def merge_unconcatenated(
     unconcatenated_dictionary: dict,
     keys: list,
-    unconcatenated_value: UnresolvedConcatenation | dict,
-) -> dict:
+    unconcatenated_value: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+) -> None:
+    """Put the value under keys path of the dictionary (in place), turning repeated keys into duplications.
+
+    Dictionary is never copied, so adding a key costs as much as the length of its keypath.
+    A folded value that is not an object overrides the previous one right away, so does an object
+    that follows a folded value.
+    """
+
     def set_default(dictionary: dict, key: str) -> dict:
         value = dictionary.get(key)
         new_element: dict = {}
         if isinstance(value, UnresolvedDuplication):
             value.append(new_element)
-        elif value is not None:
+        elif isinstance(value, dict | ANY_UNRESOLVED):
             dictionary[key] = UnresolvedDuplication((value, new_element))
         else:
             dictionary[key] = new_element
         return new_element
 
     last_nest = reduce(set_default, keys[:-1], unconcatenated_dictionary)
-    if isinstance(last_nest.get(keys[-1]), UnresolvedDuplication):
-        last_nest[keys[-1]].append(unconcatenated_value)
-    elif last_nest.get(keys[-1]) is not None:
-        last_nest[keys[-1]] = UnresolvedDuplication((last_nest[keys[-1]], unconcatenated_value))
-    else:
-        last_nest[keys[-1]] = unconcatenated_value
-    return deepcopy(unconcatenated_dictionary)
+    key = keys[-1]
+    value = last_nest.get(key)
+    if (
+        key not in last_nest
+        or not isinstance(unconcatenated_value, dict | ANY_UNRESOLVED)
+        or (type(unconcatenated_value) is dict and not isinstance(value, dict | ANY_UNRESOLVED))
+    ):
+        last_nest[key] = unconcatenated_value
+        return
+    if isinstance(value, UnresolvedDuplication):
+        if not fold_self_append(value[-1], unconcatenated_value):
+            value.append(unconcatenated_value)
+    elif not fold_self_append(value, unconcatenated_value):
+        last_nest[key] = UnresolvedDuplication((value, unconcatenated_value))
+
+
+def fold_self_append(
+    previous: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+    unconcatenated_value: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+) -> bool:
+    """Turn a = ${?a} [1] followed by a = ${?a} [2] into a single a = ${?a} [1] [2]. Return True if folded.
+
+    This way N appends (a += x) resolve with a single self-referential substitution instead of a chain of N.
+    """
+    if isinstance(previous, UnresolvedConcatenation) and previous.folds_with(unconcatenated_value):
+        previous.extend(unconcatenated_value[1:])
+        return True
+    return False
 
 
 def convert_iadd_to_self_referential_substitution(
     keys: list[str],
-    concatenation: UnresolvedConcatenation,
-    current_keypath: list[str],
-    root_location: list[str],
+    concatenation: ANY_VALUE_TYPE | UnresolvedConcatenation,
+    current_keypath: tuple[str, ...],
+    root_location: tuple[str, ...],
 ) -> UnresolvedConcatenation:
     """Turn this expression: a += 1 into this: a = ${?a} [1]."""
     return UnresolvedConcatenation(
         [
             UnresolvedSubstitution(
-                keys,
+                tuple(keys),
                 optional=True,
                 relative_location=current_keypath,
                 including_root=root_location,
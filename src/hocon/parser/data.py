@@ -2,16 +2,56 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+from ._prefetch import IncludePrefetcher
+
+
+@dataclass
+class IncludeCache:
+    """Parse trees of files included while parsing a single document, so that each of them gets parsed just once.
+
+    Trees are keyed by file path, encoding and whether they were included at the document root,
+    and stored along with the root path they were first parsed under. Every include gets a copy re-rooted under its
+    own root path. hits counts includes served from the cache, misses the ones that had to be read and parsed.
+    """
+
+    trees: dict[tuple[Path, str, bool], tuple[dict[str, Any], tuple[str, ...]]] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class Sources:
+    """Files read while parsing a single document: the root file and every included one.
+
+    files maps a file path to the text read from it (None for an optional include that did not exist),
+    globs maps an absolute glob include pattern to the files it matched,
+    untracked lists includes whose content caches cannot validate (classpath and url ones),
+    include_cache keeps parse trees of the included ones.
+    """
+
+    files: dict[Path, str | None] = field(default_factory=dict)
+    globs: dict[str, list[Path]] = field(default_factory=dict)
+    untracked: list[str] = field(default_factory=list)
+    include_cache: IncludeCache = field(default_factory=IncludeCache)
 
 
 @dataclass
 class ParserInput:
-    """Represents parsing input (data + metadata)."""
+    """Represents parsing input (data + metadata).
+
+    classpath_name is set for classpath resources: includes without a keyword are looked up on the classpath,
+    relative to it.
+    """
 
     data: str
     absolute_filepath: str | Path
-    root_path: list[str] = field(default_factory=list)
+    root_path: tuple[str, ...] = ()
     encoding: str = "UTF-8"
+    sources: Sources = field(default_factory=Sources)
+    prefetcher: IncludePrefetcher | None = None
+    classpath_name: str | None = None
 
     def __getitem__(self, item: slice | int) -> str:
         """Return data slice."""
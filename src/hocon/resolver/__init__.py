@@ -1,6 +1,8 @@
 """Turns parsed list/dict containing UnresolvedXXX objects into list/dict of python native types."""
 
-from ._lazy_resolver import merge
+from hocon._value_utils import merge
+
 from ._resolver import resolve
+from ._view import ConfigView, resolve_on_access
 
-__all__ = ("merge", "resolve")
+__all__ = ("ConfigView", "merge", "resolve", "resolve_on_access")
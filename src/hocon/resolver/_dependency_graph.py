@@ -0,0 +1,222 @@
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from hocon.constants import ANY_VALUE_TYPE, ROOT_TYPE
+from hocon.exceptions import HOCONSubstitutionCycleError
+from hocon.unresolved import (
+    ANY_UNRESOLVED,
+    UnresolvedConcatenation,
+    UnresolvedDuplication,
+    UnresolvedSubstitution,
+)
+
+from ._substitution import SubstitutionStatus
+from ._substitution_resolver import get_from_env
+
+__all__ = ["DependencyGraph"]
+
+
+@dataclass
+class _Node:
+    """Substitution found in the lazy resolved tree.
+
+    path: where the substitution sits in the tree.
+    is_evaluated: resolving the whole tree certainly resolves this substitution
+        (it's not hidden in a duplication or behind an object merge).
+    is_bare: the substitution is the whole value at its path (not a part of a concatenation).
+    """
+
+    substitution: UnresolvedSubstitution
+    path: tuple[str, ...]
+    is_evaluated: bool
+    is_bare: bool
+
+
+class DependencyGraph:
+    """Substitutions of the lazy resolved tree and the substitutions that resolving each one of them may need.
+
+    A substitution depends on every substitution under the first unresolved node met on the way to its target
+    (or under the target itself), since that is the whole subtree Resolver resolves to reach the target.
+    """
+
+    def __init__(self, lazy_resolved: ROOT_TYPE, environment: dict[str, str | None] | None = None) -> None:
+        """Environment variables consulted by the cycle check get recorded in environment, if given."""
+        self._tree = lazy_resolved
+        self._environment = environment
+        self._nodes: dict[int, _Node] = {}
+        self._under: dict[tuple[str, ...], list[int]] = {}
+        self._collect(lazy_resolved, (), is_evaluated=True)
+        self._edges = {id_: self._dependencies(node) for id_, node in self._nodes.items()}
+
+    def resolution_order(self) -> Iterator[UnresolvedSubstitution]:
+        """Yield the certainly evaluated substitutions outside of cycles, dependencies first.
+
+        Resolving them in this order never re-enters a substitution that is being resolved.
+        Substitutions within cycles are left for the on-the-fly self-reference handling.
+        """
+        for component in _strongly_connected_components(self._edges):
+            id_ = component[0]
+            if len(component) == 1 and id_ not in self._edges[id_] and self._nodes[id_].is_evaluated:
+                yield self._nodes[id_].substitution
+
+    def check_cycles(self) -> None:
+        """Raise HOCONSubstitutionCycleError with the full cycle path on a cycle no self-reference fallback can break.
+
+        Only substitutions that are the whole (certainly evaluated) value at their path and do not point
+        to their own path are considered, so the cycle is bound to happen whatever order values resolve in.
+        """
+        hard = {id_ for id_, node in self._nodes.items() if self._is_hard(node)}
+        hard_edges = {id_: [dependency for dependency in self._edges[id_] if dependency in hard] for id_ in hard}
+        for component in _strongly_connected_components(hard_edges):
+            if len(component) > 1:
+                cycle = _find_cycle(component, hard_edges)
+                path = " -> ".join(str(self._nodes[id_].substitution) for id_ in cycle)
+                msg = f"Cycle occurred when resolving {self._nodes[cycle[0]].substitution}: {path}"
+                raise HOCONSubstitutionCycleError(msg)
+
+    def _collect(self, value: ANY_VALUE_TYPE | ANY_UNRESOLVED, path: tuple[str, ...], *, is_evaluated: bool) -> None:
+        if type(value) is dict:
+            for key, item in value.items():
+                self._collect(item, (*path, key), is_evaluated=is_evaluated)
+        elif type(value) is list:
+            for index, item in enumerate(value):
+                self._collect(item, (*path, str(index)), is_evaluated=is_evaluated)
+        elif isinstance(value, UnresolvedSubstitution):
+            self._add(_Node(value, path, is_evaluated=is_evaluated, is_bare=True))
+        elif isinstance(value, UnresolvedConcatenation | UnresolvedDuplication):
+            self._collect_items(value, path, is_evaluated=is_evaluated)
+
+    def _collect_items(
+        self,
+        value: UnresolvedConcatenation | UnresolvedDuplication,
+        path: tuple[str, ...],
+        *,
+        is_evaluated: bool,
+    ) -> None:
+        """Only the substitutions concatenated directly are evaluated along with the concatenation."""
+        for item in value:
+            if isinstance(value, UnresolvedConcatenation) and isinstance(item, UnresolvedSubstitution):
+                self._add(_Node(item, path, is_evaluated=is_evaluated, is_bare=False))
+            else:
+                self._collect(item, path, is_evaluated=False)
+
+    def _add(self, node: _Node) -> None:
+        self._nodes[node.substitution.id_] = node
+        for depth in range(len(node.path) + 1):
+            self._under.setdefault(node.path[:depth], []).append(node.substitution.id_)
+
+    def _dependencies(self, node: _Node) -> list[int]:
+        substitution = node.substitution
+        candidates = [tuple(substitution.keys)]
+        if substitution.including_root:
+            candidates.append(tuple(substitution.including_root + substitution.keys))
+        dependencies: list[int] = []
+        for keys in candidates:
+            resolved_prefix = self._resolved_prefix(keys)
+            if resolved_prefix is not None:
+                dependencies.extend(self._under.get(resolved_prefix, []))
+        return dependencies
+
+    def _resolved_prefix(self, keys: tuple[str, ...]) -> tuple[str, ...] | None:
+        """Return the path of the first unresolved node on the way to keys (keys if there's none).
+
+        Return None if keys point outside of the tree.
+        """
+        value: ANY_VALUE_TYPE | ANY_UNRESOLVED = self._tree
+        for depth, key in enumerate(keys):
+            if isinstance(value, UnresolvedConcatenation | UnresolvedDuplication | UnresolvedSubstitution):
+                return keys[:depth]
+            if type(value) is dict and key in value:
+                value = value[key]
+            elif type(value) is list and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            else:
+                return None
+        return keys
+
+    def _is_hard(self, node: _Node) -> bool:
+        substitution = node.substitution
+        keys = tuple(substitution.keys)
+        shorter = min(len(keys), len(node.path))
+        is_self_reference = keys[:shorter] == node.path[:shorter]
+        return (
+            node.is_evaluated
+            and node.is_bare
+            and not substitution.optional
+            and not substitution.including_root
+            and not is_self_reference
+            and get_from_env(substitution, self._environment).status == SubstitutionStatus.UNDEFINED
+        )
+
+
+def _strongly_connected_components(edges: dict[int, list[int]]) -> list[list[int]]:
+    """Tarjan's algorithm, iterative (dependency chains can be deeper than the recursion limit).
+
+    Components come out in reverse topological order: every component after all the components it depends on.
+    """
+    index: dict[int, int] = {}
+    low_link: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[list[int]] = []
+    for root, root_successors in edges.items():
+        if root in index:
+            continue
+        work = [(root, iter(root_successors))]
+        index[root] = low_link[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            vertex, successors = work[-1]
+            successor = next(successors, None)
+            if successor is not None:
+                if successor not in index:
+                    index[successor] = low_link[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(edges[successor])))
+                elif successor in on_stack:
+                    low_link[vertex] = min(low_link[vertex], index[successor])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low_link[parent] = min(low_link[parent], low_link[vertex])
+            if low_link[vertex] == index[vertex]:
+                components.append(_pop_component(vertex, stack, on_stack))
+    return components
+
+
+def _pop_component(root: int, stack: list[int], on_stack: set[int]) -> list[int]:
+    """Pop the component of root (root and everything pushed after it) from the Tarjan's algorithm stack."""
+    component: list[int] = []
+    member = None
+    while member != root:
+        member = stack.pop()
+        on_stack.discard(member)
+        component.append(member)
+    return component
+
+
+def _find_cycle(component: list[int], edges: dict[int, list[int]]) -> list[int]:
+    """Return the shortest path from the first parsed component member back to itself (both ends included).
+
+    Breadth-first search, bound to get back to the start, since the component is strongly connected.
+    """
+    start = min(component)
+    members = set(component)
+    previous: dict[int, int] = {}
+    queue = deque([start])
+    while start not in previous:
+        vertex = queue.popleft()
+        for successor in edges[vertex]:
+            if successor in members and successor not in previous:
+                previous[successor] = vertex
+                queue.append(successor)
+    backward_path = [start]
+    vertex = previous[start]
+    while vertex != start:
+        backward_path.append(vertex)
+        vertex = previous[vertex]
+    return [start, *reversed(backward_path[1:]), start]
@@ -1,10 +1,10 @@
 import operator
 from collections.abc import Callable
-from copy import deepcopy
 from dataclasses import dataclass
 from functools import cache, reduce, singledispatch
 from typing import Any
 
+from hocon._value_utils import _merge
 from hocon.constants import ANY_VALUE_TYPE, SIMPLE_VALUE_TYPE
 from hocon.exceptions import HOCONConcatenationError
 from hocon.unresolved import (
@@ -28,11 +28,8 @@ def _(values: SIMPLE_VALUE_TYPE | UnresolvedSubstitution) -> SIMPLE_VALUE_TYPE |
 
 @resolve.register
 def _(values: list) -> list[Any]:
-    resolved_list = []
-    for element in values:
-        resolved_elem = resolve(element)
-        resolved_list.append(resolved_elem)
-    return resolved_list
+    resolved_list = [resolve(element) for element in values]
+    return values if all(map(operator.is_, resolved_list, values)) else resolved_list
 
 
 @resolve.register
@@ -70,10 +67,11 @@ def _(values: UnresolvedDuplication) -> ANY_VALUE_TYPE | UnresolvedDuplication:
     values = values.sanitize()
     first_value = resolve(values[0])
     deduplicated = UnresolvedDuplication([first_value])
+    owned: dict[int, Any] = {}
     for value in values[1:]:
         maybe_resolved_value = resolve(value)
         if isinstance(maybe_resolved_value, dict) and isinstance(deduplicated[-1], dict):
-            deduplicated[-1] = merge(maybe_resolved_value, deduplicated[-1])
+            deduplicated[-1] = _merge(maybe_resolved_value, deduplicated[-1], owned)
         else:
             deduplicated.append(maybe_resolved_value)
     if len(deduplicated) == 1 and isinstance(deduplicated[0], ANY_VALUE_TYPE):
@@ -82,11 +80,14 @@ def _(values: UnresolvedDuplication) -> ANY_VALUE_TYPE | UnresolvedDuplication:
 
 
 def _resolve_dict(values: dict) -> dict[Any, Any]:
+    """Return values itself if none of its values changes, so literal subtrees are shared, not copied."""
     resolved_dict = {}
+    is_changed = False
     for key, value in values.items():
         resolved_value = resolve(value)
         resolved_dict[key] = resolved_value
-    return resolved_dict
+        is_changed = is_changed or resolved_value is not value
+    return resolved_dict if is_changed else values
 
 
 @dataclass(frozen=True)
@@ -120,66 +121,11 @@ def _get_concatenators() -> dict[
 
 
 def _concatenate_dicts(values: UnresolvedConcatenation[dict]) -> dict:
-    return _resolve_dict(reduce(merge, reversed(values)))
+    owned: dict[int, Any] = {}
+    merged = reduce(lambda inferior, superior: _merge(superior, inferior, owned), values)
+    return _resolve_dict(merged)
 
 
 def _concatenate_lists(values: UnresolvedConcatenation) -> list:
     resolved_lists = [resolve(value) for value in values]
     return reduce(operator.iadd, resolved_lists, [])
-
-
-def merge(superior: dict, inferior: dict) -> dict:
-    """Merge two objects recursively. If keys overlap, merge values."""
-    result = deepcopy(inferior)
-    for key, value in superior.items():
-        inferior_value = result.get(key)
-        if inferior_value is None:
-            result[key] = value
-            continue
-        result[key] = _ValueMerger.merge(inferior_value, value)
-    return result
-
-
-class _ValueMerger:
-    duplication_elem = dict | list | UnresolvedSubstitution | UnresolvedConcatenation
-
-    @classmethod
-    def merge(
-        cls,
-        inferior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
-        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
-    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
-        if isinstance(inferior, dict) and isinstance(superior, dict):
-            return merge(superior, inferior)
-        if isinstance(inferior, UnresolvedDuplication):
-            return cls._merge_with_duplication(inferior, superior)
-        if isinstance(inferior, cls.duplication_elem):
-            return cls._merge_with_duplication_element(inferior, superior)
-        return superior
-
-    @classmethod
-    def _merge_with_duplication(
-        cls,
-        inferior: UnresolvedDuplication,
-        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
-    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
-        if isinstance(superior, UnresolvedDuplication):
-            inferior.extend(superior)
-            return inferior
-        if isinstance(superior, cls.duplication_elem):
-            inferior.append(superior)
-            return inferior
-        return superior
-
-    @classmethod
-    def _merge_with_duplication_element(
-        cls,
-        inferior: "_ValueMerger.duplication_elem",
-        superior: ANY_VALUE_TYPE | ANY_UNRESOLVED,
-    ) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
-        if isinstance(superior, UnresolvedDuplication):
-            superior.insert(0, inferior)
-            return superior
-        if isinstance(superior, cls.duplication_elem):
-            return UnresolvedDuplication([inferior, superior])
-        return superior
@@ -0,0 +1,56 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from hocon.constants import ANY_VALUE_TYPE, Undefined
+from hocon.unresolved import ANY_UNRESOLVED
+
+NODE = TypeVar("NODE", bound=ANY_UNRESOLVED)
+
+
+@dataclass
+class MemoStats:
+    """How many times a node resolution was taken from the memo (hits) and how many times it was computed (misses)."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class NodeMemo:
+    """Resolved values of unresolved nodes, keyed by node identity.
+
+    Nodes are kept alive by the memo, so their ids cannot be reused by other nodes.
+    Trees carved out by the self-reference fallback share all the subtrees off the cut path with the original tree,
+    so such nodes hit the same entry in both. It is safe, since a node resolves to the same value in either tree:
+    its substitutions are resolved once, by substitution id, no matter which tree is being resolved.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[int, tuple[ANY_UNRESOLVED, ANY_VALUE_TYPE | Undefined]] = {}
+        self.stats = MemoStats()
+
+    def resolve(
+        self,
+        node: NODE,
+        resolve_function: Callable[[NODE], ANY_VALUE_TYPE | Undefined],
+    ) -> ANY_VALUE_TYPE | Undefined:
+        """Return memoized resolution of node or compute (and memoize) it with resolve_function.
+
+        Memoized dicts and lists are returned as copies, so that no two places in the result share the same object.
+        """
+        if id(node) in self._values:
+            self.stats.hits += 1
+            return copy_resolved(self._values[id(node)][1])
+        self.stats.misses += 1
+        value = resolve_function(node)
+        self._values[id(node)] = (node, value)
+        return value
+
+
+def copy_resolved(value: ANY_VALUE_TYPE | Undefined) -> ANY_VALUE_TYPE | Undefined:
+    """Copy the dicts and lists of a resolved value. Simple values are immutable, so they are shared."""
+    if type(value) is dict:
+        return {key: copy_resolved(item) for key, item in value.items()}
+    if type(value) is list:
+        return [copy_resolved(item) for item in value]
+    return value
@@ -1,13 +1,13 @@
 import json
 import operator
-from copy import deepcopy
+from copy import copy
 from functools import reduce, singledispatchmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from hocon._value_utils import cast_string_value, resolve_simple_value
 from hocon.constants import ANY_VALUE_TYPE, ROOT_TYPE, SIMPLE_VALUE_TYPE, UNDEFINED, Undefined
 from hocon.exceptions import HOCONDeduplicationError, HOCONError
-from hocon.resolver._simple_value import cast_string_value, resolve_simple_value
-from hocon.strings import HOCON_STRING, UnquotedString
+from hocon.strings import HOCON_STRING, QuotedString, UnquotedString
 from hocon.unresolved import (
     ANY_UNRESOLVED,
     UnresolvedConcatenation,
@@ -16,29 +16,90 @@ from hocon.unresolved import (
 )
 
 from . import _lazy_resolver
+from ._dependency_graph import DependencyGraph
+from ._memo import MemoStats, NodeMemo
 from ._substitution_resolver import SubstitutionResolver
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
+_TYPED_SCALARS = frozenset({int, float, bool, type(None), str, QuotedString})
 
-def resolve(parsed: ROOT_TYPE) -> ROOT_TYPE:
+
+def resolve(
+    parsed: ROOT_TYPE,
+    paths: list[list[str]] | None = None,
+    environment: dict[str, str | None] | None = None,
+) -> ROOT_TYPE:
+    """Resolve the whole parsed tree or, if paths are given, only the values under them.
+
+    Partial result keeps the selected values at their original paths. Paths missing in the config are skipped.
+    Environment variables consulted by substitutions get recorded in environment, if given.
+
+    Resolution is not a single walk: the lazy pass merges duplicated objects first (sharing untouched subtrees with
+    parsed), because substitutions are looked up, and self references cut, in the merged tree. Then the dependency
+    graph and the Resolver walk it. Only duplicated objects get merged and resolved in one walk (see
+    Resolver._resolve_duplicates).
+    """
     lazy_resolved = _lazy_resolver.resolve(parsed)
+    if paths is not None:
+        return _resolve_paths(lazy_resolved, paths, environment)
     if type(lazy_resolved) is list:
-        resolver = Resolver(lazy_resolved)
+        resolver = Resolver(lazy_resolved, environment)
+        resolver.resolve_in_dependency_order(DependencyGraph(lazy_resolved, environment))
         return resolver.resolve_list(lazy_resolved)
     if type(lazy_resolved) is dict:
-        resolver = Resolver(lazy_resolved)
+        resolver = Resolver(lazy_resolved, environment)
+        resolver.resolve_in_dependency_order(DependencyGraph(lazy_resolved, environment))
         return resolver.resolve_dict(lazy_resolved)
     msg = f"Fatal error: lazy resolver returned {type(lazy_resolved)}! Only lists and dicts are valid HOCONs!"
     raise HOCONError(msg)
 
 
+def _resolve_paths(
+    lazy_resolved: ANY_VALUE_TYPE | ANY_UNRESOLVED,
+    paths: list[list[str]],
+    environment: dict[str, str | None] | None,
+) -> dict:
+    if type(lazy_resolved) is not dict:
+        msg = "Paths can only be selected from HOCON objects."
+        raise HOCONError(msg)
+    resolver = Resolver(lazy_resolved, environment)
+    partial: dict = {}
+    for keys in paths:
+        value = resolver.resolve_path(keys)
+        if isinstance(value, Undefined):
+            continue
+        parent = partial
+        for key in keys[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[keys[-1]] = value
+    return partial
+
+
 class Resolver:
     """Convert HOCON object to python dict/list."""
 
-    def __init__(self, parsed: ROOT_TYPE) -> None:
-        self._resolve_substitution = SubstitutionResolver(parsed, self)
+    def __init__(self, parsed: ROOT_TYPE, environment: dict[str, str | None] | None = None) -> None:
+        self._resolve_substitution = SubstitutionResolver(parsed, self, environment=environment)
+        self._memo = NodeMemo()
+
+    @property
+    def memo_stats(self) -> MemoStats:
+        """Hit and miss counters of the concatenation/duplication memo."""
+        return self._memo.stats
+
+    def resolve_in_dependency_order(self, graph: DependencyGraph) -> None:
+        """Fail early on unbreakable cycles, then resolve substitutions with their dependencies resolved first.
+
+        Substitutions get cached by SubstitutionResolver, so the main pass finds them already resolved.
+        """
+        graph.check_cycles()
+        for substitution in graph.resolution_order():
+            self._resolve_substitution(substitution)
+
+    def resolve_path(self, keys: list[str]) -> ANY_VALUE_TYPE | Undefined:
+        return self._resolve_substitution.resolve_path(keys)
 
     @singledispatchmethod
     def resolve(self, values: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> ANY_VALUE_TYPE | Undefined:
@@ -52,8 +113,12 @@ class Resolver:
         return values
 
     def resolve_list(self, values: list) -> list:
+        """Typed scalars (see cast_string_value) the parser put into the tree are final, they skip the dispatch."""
         resolved_list: list[ANY_VALUE_TYPE] = []
         for element in values:
+            if type(element) in _TYPED_SCALARS:
+                resolved_list.append(element)
+                continue
             resolved_elem: ANY_VALUE_TYPE | Undefined = self.resolve(element)
             if not isinstance(resolved_elem, Undefined):
                 resolved_list.append(resolved_elem)
@@ -62,6 +127,9 @@ class Resolver:
     def resolve_dict(self, values: dict) -> dict:
         resolved_dict: dict[SIMPLE_VALUE_TYPE, ANY_VALUE_TYPE] = {}
         for key, value in values.items():
+            if type(value) in _TYPED_SCALARS:
+                resolved_dict[key] = value
+                continue
             resolved_value: ANY_VALUE_TYPE | Undefined = self.resolve(value)
             if not isinstance(resolved_value, Undefined):
                 resolved_dict[key] = resolved_value
@@ -71,6 +139,9 @@ class Resolver:
         return self._resolve_substitution(values)
 
     def resolve_concatenation(self, values: UnresolvedConcatenation) -> ANY_VALUE_TYPE | Undefined:
+        return self._memo.resolve(values, self._resolve_concatenation)
+
+    def _resolve_concatenation(self, values: UnresolvedConcatenation) -> ANY_VALUE_TYPE | Undefined:
         values = self.resolve_substitutions(values)
         values = values.sanitize()
         if not values:
@@ -87,6 +158,9 @@ class Resolver:
         return concatenate_functions[concat_type](values)
 
     def resolve_duplication(self, values: UnresolvedDuplication) -> ANY_VALUE_TYPE | Undefined:
+        return self._memo.resolve(values, self._resolve_duplication)
+
+    def _resolve_duplication(self, values: UnresolvedDuplication) -> ANY_VALUE_TYPE | Undefined:
         """Resolve duplication values starting from the last (latest overrides/merges with the rest).
 
         If it's a SIMPLE_VALUE_TYPE or a list, it overrides the rest.
@@ -96,30 +170,59 @@ class Resolver:
         if not values:
             msg = "Unresolved duplicate key must contain at least 1 element."
             raise HOCONDeduplicationError(msg)
-        duplication = UnresolvedDuplication([])
-        reversed_values = reversed(values)
-        for value in reversed_values:
-            resolved_value = self.resolve(value)
+        return self._resolve_duplicates([(value, False) for value in values])
+
+    def _resolve_duplicates(
+        self,
+        values: list[tuple[ANY_VALUE_TYPE | ANY_UNRESOLVED, bool]],
+    ) -> ANY_VALUE_TYPE | Undefined:
+        """Resolve (value, is_resolved) duplicates in a single walk, without lazy merging them first.
+
+        Objects are merged key by key, so values overridden by a latter non-object are never resolved.
+        """
+        values = list(_flatten_duplicates(values))
+        for index in reversed(range(len(values))):
+            value, is_resolved = values[index]
+            resolved_value = value if is_resolved else self.resolve(value)
             if resolved_value is UNDEFINED:
                 continue
-            if isinstance(resolved_value, dict):
-                duplication.append(resolved_value)
+            if not isinstance(resolved_value, dict):
+                return cast("ANY_VALUE_TYPE", resolved_value)
+            objects = self._collect_objects(values[:index])
+            if not objects:
+                return resolved_value
+            objects.reverse()
+            objects.append((resolved_value, True))
+            return self._merge_objects(objects)
+        return UNDEFINED
+
+    def _collect_objects(self, values: list[tuple[ANY_VALUE_TYPE | ANY_UNRESOLVED, bool]]) -> list[tuple[dict, bool]]:
+        """Collect (object, is_resolved) pairs from the last value back to the first one that is not an object."""
+        objects: list[tuple[dict, bool]] = []
+        for value, is_resolved in reversed(values):
+            if isinstance(value, dict):
+                objects.append((value, is_resolved))
+                continue
+            if is_resolved or not isinstance(value, UnresolvedConcatenation | UnresolvedSubstitution):
                 break
-            return resolved_value
-        for value in reversed_values:
-            resolved_value = value
-            if isinstance(value, UnresolvedConcatenation | UnresolvedSubstitution):
-                resolved_value = self.resolve(value)
+            resolved_value = self.resolve(value)
             if resolved_value is UNDEFINED:
                 continue
-            if isinstance(resolved_value, dict):
-                duplication.insert(0, resolved_value)
-                continue
-            break
-        if not duplication:
-            return UNDEFINED
-        lazy_resolved = _lazy_resolver.resolve(duplication)
-        return self.resolve(lazy_resolved)
+            if not isinstance(resolved_value, dict):
+                break
+            objects.append((resolved_value, True))
+        return objects
+
+    def _merge_objects(self, objects: list[tuple[dict, bool]]) -> dict:
+        """Merge (object, is_resolved) pairs, the latter wins. Every key is resolved once, from all its duplicates."""
+        keys = dict.fromkeys(key for obj, _ in objects for key in obj)
+        merged: dict[SIMPLE_VALUE_TYPE, ANY_VALUE_TYPE] = {}
+        for key in keys:
+            duplicates = [(obj[key], is_resolved) for obj, is_resolved in objects if key in obj]
+            resolved_value = self._resolve_duplicates(duplicates)
+            if not isinstance(resolved_value, Undefined):
+                merged[key] = resolved_value
+        return merged
 
     resolve.register(resolve_list)
     resolve.register(resolve_dict)
@@ -128,7 +231,9 @@ class Resolver:
     resolve.register(resolve_duplication)
 
     def _concatenate_dicts(self, values: UnresolvedConcatenation[dict]) -> dict:
-        return self.resolve_dict(reduce(self.merge, reversed(values)))
+        owned: dict[int, dict] = {}
+        merged = reduce(lambda inferior, superior: self._merge(superior, inferior, owned), values)
+        return self.resolve_dict(merged)
 
     @staticmethod
     def _concatenate_simple_values(values: UnresolvedConcatenation) -> SIMPLE_VALUE_TYPE:
@@ -142,12 +247,23 @@ class Resolver:
         return reduce(operator.iadd, resolved_lists, [])
 
     def merge(self, superior: dict, inferior: dict) -> dict:
-        """Merge two objects recursively. If keys overlap, the latter wins."""
-        result = deepcopy(inferior)
+        """Merge two objects recursively. If keys overlap, the latter wins.
+
+        Neither object is modified. Subtrees untouched by the superior object are shared with the result.
+        """
+        return self._merge(superior, inferior, {})
+
+    def _merge(self, superior: dict, inferior: dict, owned: dict[int, dict]) -> dict:
+        """Copy only the objects on the modified paths, each one just once (owned holds the copies by id)."""
+        if id(inferior) in owned:
+            result = inferior
+        else:
+            result = copy(inferior)
+            owned[id(result)] = result
         for key, value in superior.items():
             inferior_value = result.get(key)
             if isinstance(value, dict) and isinstance(inferior_value, dict):
-                result[key] = self.merge(value, inferior_value)
+                result[key] = self._merge(value, inferior_value, owned)
             else:
                 resolved_value: ANY_VALUE_TYPE | Undefined = self.resolve(value)
                 if resolved_value is not UNDEFINED:
@@ -162,3 +278,13 @@ class Resolver:
                 resolved_value = self._resolve_substitution(value)
             values_with_resolved_substitutions.append(resolved_value)
         return values_with_resolved_substitutions
+
+
+def _flatten_duplicates(
+    values: list[tuple[ANY_VALUE_TYPE | ANY_UNRESOLVED, bool]],
+) -> "Iterator[tuple[ANY_VALUE_TYPE | ANY_UNRESOLVED, bool]]":
+    for value, is_resolved in values:
+        if isinstance(value, UnresolvedDuplication) and not is_resolved:
+            yield from _flatten_duplicates([(item, False) for item in value])
+        else:
+            yield value, is_resolved
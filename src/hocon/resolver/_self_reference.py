@@ -1,3 +1,6 @@
+import operator
+from typing import TypeVar, cast
+
 from hocon.constants import ANY_VALUE_TYPE, ROOT_TYPE
 from hocon.exceptions import HOCONSubstitutionUndefinedError
 from hocon.unresolved import (
@@ -9,86 +12,132 @@ from hocon.unresolved import (
 
 __all__ = ["cut_self_reference_and_fields_that_override_it"]
 
+_LIST = TypeVar("_LIST", list, UnresolvedConcatenation, UnresolvedDuplication)
+
 
 class _Cutter:
+    """Cut the substitution (and everything that overrides it) out of the tree without modifying the tree.
+
+    Every cut method returns the subtree unchanged or a shallow copy of it with the cut applied.
+    Only the nodes on the substitution location path get copied, all the other subtrees are shared.
+    """
+
     def __init__(self, sub: UnresolvedSubstitution) -> None:
         self.is_sub_found: bool = False
         self.sub = sub
+        self.location = sub.location
 
-    def cut(self, subtree: ANY_VALUE_TYPE | ANY_UNRESOLVED, keypath_index: int = 0) -> None:
-        is_past_last_key = keypath_index == len(self.sub.location)
+    def cut(self, subtree: ANY_VALUE_TYPE | ANY_UNRESOLVED, keypath_index: int = 0) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
+        is_past_last_key = keypath_index == len(self.location)
         if is_past_last_key:
             return self.final_cut(subtree)
-        key = self.sub.location[keypath_index]
-        is_last_key = keypath_index + 1 == len(self.sub.location)
-        if isinstance(subtree, (UnresolvedDuplication, UnresolvedConcatenation)):
-            for item in subtree:
-                self.cut(item, keypath_index)
-        elif type(subtree) is dict and key in subtree:
+        key = self.location[keypath_index]
+        is_last_key = keypath_index + 1 == len(self.location)
+        if isinstance(subtree, UnresolvedDuplication):
+            return _rebuild(subtree, [self.cut(item, keypath_index) for item in subtree])
+        if isinstance(subtree, UnresolvedConcatenation):
+            return _rebuild(subtree, [self.cut(item, keypath_index) for item in subtree])
+        if type(subtree) is dict and key in subtree:
             return self.cut_dict(subtree, key, keypath_index, is_last_key=is_last_key)
-        elif type(subtree) is list and key.isdigit():
+        if type(subtree) is list and key.isdigit():
             return self.cut_list(subtree, key, keypath_index, is_last_key=is_last_key)
-        return None
+        return subtree
 
-    def cut_list(self, subtree: list, key: str, keypath_index: int, *, is_last_key: bool) -> None:
+    def cut_list(self, subtree: list, key: str, keypath_index: int, *, is_last_key: bool) -> list:
+        index = int(key)
+        result = list(subtree)
         if not is_last_key:
-            return self.cut(subtree[int(key)], keypath_index + 1)
-        if subtree[int(key)] == self.sub or self.is_sub_found:
+            result[index] = self.cut(subtree[index], keypath_index + 1)
+            return _rebuild(subtree, result)
+        if subtree[index] == self.sub or self.is_sub_found:
             self.is_sub_found = True
-            del subtree[int(key)]
-            return None
-        self.cut(subtree[int(key)], keypath_index + 1)
-        if not subtree[int(key)]:
-            del subtree[int(key)]
-        return None
-
-    def cut_dict(self, subtree: dict, key: str, keypath_index: int, *, is_last_key: bool) -> None:
+            del result[index]
+            return result
+        result[index] = self.cut(subtree[index], keypath_index + 1)
+        if _is_emptied(result[index], subtree[index]):
+            del result[index]
+        return _rebuild(subtree, result)
+
+    def cut_dict(self, subtree: dict, key: str, keypath_index: int, *, is_last_key: bool) -> dict:
         if not is_last_key:
-            return self.cut(subtree[key], keypath_index + 1)
+            value = self.cut(subtree[key], keypath_index + 1)
+            return subtree if value is subtree[key] else {**subtree, key: value}
         if subtree[key] == self.sub or self.is_sub_found:
-            subtree.pop(key)
             self.is_sub_found = True
-            return None
-        self.cut(subtree[key], keypath_index + 1)
-        if not subtree[key]:
-            subtree.pop(key)
-        return None
+            return _without_key(subtree, key)
+        value = self.cut(subtree[key], keypath_index + 1)
+        if _is_emptied(value, subtree[key]):
+            return _without_key(subtree, key)
+        return subtree if value is subtree[key] else {**subtree, key: value}
 
-    def final_cut(self, subtree: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> None:
+    def final_cut(self, subtree: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> ANY_VALUE_TYPE | ANY_UNRESOLVED:
+        """Cut the substitution out of the value at its location.
+
+        The parser folds literal values, so a value overridden at the location may be a plain one. It holds
+        no substitution, so it stays as it is. Not finding the substitution at all is reported after the cut.
+        """
         if isinstance(subtree, UnresolvedDuplication):
             return self.cut_duplication(subtree)
         if isinstance(subtree, UnresolvedConcatenation):
             return self.cut_concatenation(subtree)
-        msg = f"Failed to resolve {self.sub}"
-        raise HOCONSubstitutionUndefinedError(msg)
+        return subtree
 
-    def cut_duplication(self, subtree: UnresolvedDuplication) -> None:
+    def cut_duplication(self, subtree: UnresolvedDuplication) -> UnresolvedDuplication:
+        result = list(subtree)
         for index, item in enumerate(subtree):
             if isinstance(item, UnresolvedConcatenation):
-                self.cut_concatenation(item)
-            elif (item == self.sub and item.id_ == self.sub.id_) or self.is_sub_found:
+                result[index] = self.cut_concatenation(item)
+            elif self._is_the_sub(item) or self.is_sub_found:
                 self.is_sub_found = True
-                for _ in range(len(subtree) - index):
-                    subtree.pop()
-        index = len(subtree) - 1
+                del result[index:]
+                break
+        index = len(result) - 1
         while index > 0:
-            if not subtree[index]:
-                subtree.pop(index)
+            if not result[index] and isinstance(result[index], list | dict | ANY_UNRESOLVED):
+                result.pop(index)
             index -= 1
+        return _rebuild(subtree, result)
 
-    def cut_concatenation(self, subtree: UnresolvedConcatenation) -> None:
+    def cut_concatenation(self, subtree: UnresolvedConcatenation) -> UnresolvedConcatenation:
         for index, item in enumerate(subtree):
-            if (item == self.sub and item.id_ == self.sub.id_) or self.is_sub_found:
+            if self._is_the_sub(item) or self.is_sub_found:
                 self.is_sub_found = True
-                for _ in range(len(subtree) - index):
-                    subtree.pop()
-                return
+                return UnresolvedConcatenation(subtree[:index])
+        return subtree
+
+    def _is_the_sub(self, item: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> bool:
+        """Compare ids: a rewritten copy (see SubstitutionResolver) keeps the id_ of the substitution in the tree."""
+        return isinstance(item, UnresolvedSubstitution) and item.id_ == self.sub.id_
+
+
+def _rebuild(original: _LIST, items: list) -> _LIST:
+    """Return the original list, if none of the items has changed. Otherwise return a new list of the same type."""
+    if len(items) == len(original) and all(map(operator.is_, items, original)):
+        return original
+    if type(original) is list:
+        return items
+    return type(original)(items)
+
+
+def _is_emptied(value: ANY_VALUE_TYPE | ANY_UNRESOLVED, original: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> bool:
+    """Check if the cut left nothing of the original value. Falsy literal values (0, "", [], {}) are kept."""
+    return value is not original and not value
+
+
+def _without_key(dictionary: dict, key: str) -> dict:
+    result = dict(dictionary)
+    del result[key]
+    return result
 
 
 def cut_self_reference_and_fields_that_override_it(
     substitution: UnresolvedSubstitution,
     parsed: ROOT_TYPE,
 ) -> ROOT_TYPE:
+    """Return a view of parsed with the substitution cut out. Parsed itself stays untouched."""
     cutter = _Cutter(substitution)
-    cutter.cut(parsed)
-    return parsed
+    carved = cutter.cut(parsed)
+    if not cutter.is_sub_found:
+        msg = f"Failed to resolve {substitution}"
+        raise HOCONSubstitutionUndefinedError(msg)
+    return cast("ROOT_TYPE", carved)
@@ -1,15 +1,15 @@
 import os
-from collections import UserList
-from copy import deepcopy
-from typing import Protocol, get_args
+from dataclasses import replace
+from typing import Protocol, cast, get_args
 
 from hocon.constants import ANY_VALUE_TYPE, ROOT_TYPE, UNDEFINED, Undefined
 from hocon.exceptions import (
+    HOCONError,
     HOCONSubstitutionCycleError,
     HOCONSubstitutionUndefinedError,
 )
 from hocon.strings import QuotedString
-from hocon.unresolved import ANY_UNRESOLVED, UnresolvedSubstitution
+from hocon.unresolved import ANY_UNRESOLVED, UnresolvedConcatenation, UnresolvedDuplication, UnresolvedSubstitution
 
 from ._self_reference import cut_self_reference_and_fields_that_override_it
 from ._substitution import Substitution, SubstitutionStatus
@@ -36,12 +36,17 @@ class SubstitutionResolver:
         parsed: ROOT_TYPE,
         resolver: Resolver,
         substitutions: dict[int, Substitution] | None = None,
+        environment: dict[str, str | None] | None = None,
     ) -> None:
         self._parsed: ROOT_TYPE = parsed
         self.resolver = resolver
         self.subs: dict[int, Substitution] = substitutions or {}
+        self.environment: dict[str, str | None] = {} if environment is None else environment
+        self._path_index: dict[tuple[str, ...], ANY_VALUE_TYPE | Undefined] = {}
+        self._rewritten: dict[int, UnresolvedSubstitution] = {}
 
     def __call__(self, substitution: UnresolvedSubstitution) -> ANY_VALUE_TYPE | Undefined:
+        substitution = self._rewritten.get(substitution.id_, substitution)
         cached_sub = self.subs.get(substitution.id_, Substitution())
         if cached_sub.status.is_resolved:
             return cached_sub.value
@@ -52,6 +57,7 @@ class SubstitutionResolver:
             return result
         self._turn_to_resolving_state(substitution, cached_sub.status)
         subvalue = self._try_resolve(substitution)
+        substitution = self._rewritten.get(substitution.id_, substitution)
         if self.subs[substitution.id_].status.is_resolved:
             return self.subs[substitution.id_].value
         if subvalue == UNDEFINED and not substitution.optional:
@@ -62,27 +68,62 @@ class SubstitutionResolver:
 
     def _try_resolve(self, substitution: UnresolvedSubstitution) -> ANY_VALUE_TYPE | Undefined:
         value: ANY_VALUE_TYPE | ANY_UNRESOLVED | Undefined = self._parsed
-        for key in substitution.keys:
+        for depth, key in enumerate(substitution.keys):
             if isinstance(value, get_args(ANY_UNRESOLVED)):
-                value = self.resolver.resolve(value)
+                value = self._resolve_node(tuple(substitution.keys[:depth]), value)
             if isinstance(value, dict) and key in value:
                 value = value[key]
             elif isinstance(value, list) and key.isdigit() and len(value) > int(key):
                 value = value[int(key)]
-            elif isinstance(value, (dict, list)):
+            elif isinstance(value, dict | list):
                 if substitution.including_root:
-                    substitution.keys = substitution.including_root + substitution.keys
-                    substitution.including_root = []
-                    self.subs.pop(substitution.id_)
+                    substitution = self._rewrite_under_including_root(substitution)
                     value = self(substitution)
                 else:
                     value = self._resolve_sub_from_env(substitution)
-        if isinstance(value, (dict, list, UserList)):
+        if isinstance(value, dict | list | UnresolvedConcatenation | UnresolvedDuplication):
             value = self.resolver.resolve(value)
         if isinstance(value, UnresolvedSubstitution):
             value = self(value)
         return value
 
+    def _rewrite_under_including_root(self, substitution: UnresolvedSubstitution) -> UnresolvedSubstitution:
+        """Return a copy of an included substitution, with its keys prefixed by the including root.
+
+        Substitutions are immutable, so the copy (with the same id_) stands in for the original from now on.
+        """
+        rewritten = replace(substitution, keys=substitution.including_root + substitution.keys, including_root=())
+        self._rewritten[substitution.id_] = rewritten
+        self.subs.pop(substitution.id_)
+        return rewritten
+
+    def resolve_path(self, keys: list[str]) -> ANY_VALUE_TYPE | Undefined:
+        """Resolve just the value under keys (and whatever it refers to). Return UNDEFINED if there is no such path.
+
+        Unlike substitutions, paths never fall back to environment variables and never select list elements.
+        """
+        value: ANY_VALUE_TYPE | ANY_UNRESOLVED | Undefined = self._parsed
+        for depth, key in enumerate(keys):
+            if isinstance(value, get_args(ANY_UNRESOLVED)):
+                value = self._resolve_node(tuple(keys[:depth]), value)
+            if isinstance(value, list):
+                msg = f"Path {'.'.join(keys)} selects a list element. Paths can only select object fields."
+                raise HOCONError(msg)
+            if not isinstance(value, dict) or key not in value:
+                return UNDEFINED
+            value = value[key]
+        return self.resolver.resolve(cast("ANY_VALUE_TYPE | ANY_UNRESOLVED", value))
+
+    def _resolve_node(self, path: tuple[str, ...], node: ANY_UNRESOLVED) -> ANY_VALUE_TYPE | Undefined:
+        """Resolve an unresolved node met on the way to a substitution target.
+
+        Results are indexed by path, so substitutions sharing a prefix (${db.host}, ${db.port})
+        walk through already resolved ancestors instead of resolving them over and over again.
+        """
+        if path not in self._path_index:
+            self._path_index[path] = self.resolver.resolve(node)
+        return self._path_index[path]
+
     def _turn_to_resolving_state(self, substitution: UnresolvedSubstitution, status: SubstitutionStatus) -> None:
         new_status = status.to_resolving()
         if new_status is None:
@@ -91,7 +132,7 @@ class SubstitutionResolver:
         self.subs[substitution.id_] = Substitution(status=new_status)
 
     def _resolve_sub_from_env(self, substitution: UnresolvedSubstitution) -> ANY_VALUE_TYPE | Undefined:
-        resolved_sub = get_from_env(substitution)
+        resolved_sub = get_from_env(substitution, self.environment)
         if resolved_sub.status == SubstitutionStatus.UNDEFINED and substitution.optional is False:
             resolving_status = self.subs[substitution.id_].status
             if resolving_status == SubstitutionStatus.FALLBACK_RESOLVING and substitution.keys not in [
@@ -123,16 +164,20 @@ class SubstitutionResolver:
         b : 5
         and ultimately will return {c:1}
         """
-        orig_parsed = self._parsed
-        carved_parsed = cut_self_reference_and_fields_that_override_it(substitution, deepcopy(self._parsed))
-        self._parsed = carved_parsed
+        orig_parsed, orig_path_index = self._parsed, self._path_index
+        carved_parsed = cut_self_reference_and_fields_that_override_it(substitution, self._parsed)
+        self._parsed, self._path_index = carved_parsed, {}
         result = self(substitution)
-        self._parsed = orig_parsed
+        self._parsed, self._path_index = orig_parsed, orig_path_index
         return result
 
 
-def get_from_env(substitution: UnresolvedSubstitution) -> Substitution:
-    env_value: str | None = os.getenv(".".join(substitution.keys))
+def get_from_env(substitution: UnresolvedSubstitution, consulted: dict[str, str | None] | None = None) -> Substitution:
+    """Look the substitution up in environment variables. Record the variable (and its value) in consulted, if given."""
+    name = ".".join(substitution.keys)
+    env_value: str | None = os.getenv(name)
+    if consulted is not None:
+        consulted[name] = env_value
     if env_value is None:
         return Substitution(value=UNDEFINED, status=SubstitutionStatus.UNDEFINED)
     return Substitution(value=QuotedString(env_value), status=SubstitutionStatus.RESOLVED)
@@ -0,0 +1,72 @@
+from collections.abc import Iterator, Mapping
+from typing import Union
+
+from hocon.constants import ANY_VALUE_TYPE, ROOT_TYPE, Undefined
+from hocon.exceptions import HOCONError
+from hocon.unresolved import (
+    ANY_UNRESOLVED,
+    UnresolvedConcatenation,
+    UnresolvedDuplication,
+    UnresolvedSubstitution,
+)
+
+from . import _lazy_resolver
+from ._resolver import Resolver
+
+VIEW_VALUE_TYPE = Union[ANY_VALUE_TYPE, "ConfigView"]
+
+
+def resolve_on_access(parsed: ROOT_TYPE) -> "ConfigView":
+    """Lazy merge the parsed tree, but leave resolution for the moment the values get accessed."""
+    lazy_resolved = _lazy_resolver.resolve(parsed)
+    if type(lazy_resolved) is not dict:
+        msg = f"Only HOCON objects can be viewed lazily, got {type(lazy_resolved)}."
+        raise HOCONError(msg)
+    return ConfigView(lazy_resolved, Resolver(lazy_resolved))
+
+
+class ConfigView(Mapping[str, VIEW_VALUE_TYPE]):
+    """Read-only mapping over a lazy merged HOCON object.
+
+    Plain objects are returned as nested views, any other value is resolved on first access and cached.
+    All views of one document share a single Resolver, so substitutions are resolved against the full document
+    and each of them just once.
+    """
+
+    def __init__(self, lazy_resolved: dict, resolver: Resolver) -> None:
+        self._lazy_resolved = lazy_resolved
+        self._resolver = resolver
+        self._values: dict[str, VIEW_VALUE_TYPE | Undefined] = {}
+
+    def __getitem__(self, key: str) -> VIEW_VALUE_TYPE:
+        if key not in self._values:
+            self._values[key] = self._resolve(self._lazy_resolved[key])
+        value = self._values[key]
+        if isinstance(value, Undefined):
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the keys. Only values that may turn out undefined (${?optional}) get resolved to check that."""
+        for key, value in self._lazy_resolved.items():
+            if not _may_be_undefined(value) or key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._lazy_resolved)})"
+
+    def _resolve(self, value: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> VIEW_VALUE_TYPE | Undefined:
+        if type(value) is dict:
+            return ConfigView(value, self._resolver)
+        return self._resolver.resolve(value)
+
+
+def _may_be_undefined(value: ANY_VALUE_TYPE | ANY_UNRESOLVED) -> bool:
+    if isinstance(value, UnresolvedSubstitution):
+        return value.optional
+    if isinstance(value, UnresolvedConcatenation | UnresolvedDuplication):
+        return any(map(_may_be_undefined, value))
+    return False
@@ -1,33 +1,97 @@
 """Definition of 3 types unique to hocon, used when resolving parsed data to a simple dict/list."""
 
-from collections import UserList
+from collections.abc import Iterable, Iterator, MutableSequence
 from dataclasses import dataclass, field
 from itertools import count
-from typing import Generic, Self, TypeVar, get_args
+from typing import Any, Self, TypeGuard, TypeVar, get_args, overload
 
-from hocon.constants import ANY_VALUE_TYPE, SIMPLE_VALUE_TYPE, UNDEFINED
+from hocon.constants import SIMPLE_VALUE_TYPE, UNDEFINED
 from hocon.exceptions import HOCONConcatenationError, HOCONDuplicateKeyMergeError
 from hocon.strings import HOCON_STRING, UnquotedString
 
 T = TypeVar("T")
 
 
-class UnresolvedConcatenation(UserList, Generic[T]):
+class _UnresolvedSequence(MutableSequence[T]):
+    """A list-like parse tree node, holding its items in a plain list (data) like UserList did.
+
+    It is not a list, so isinstance(value, list) is true for HOCON lists only. Unlike UserList, it is slotted:
+    the parser creates one per value, so no __dict__ per instance. Slicing it returns a plain list.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self.data: list[T] = list(values)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.data)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self.data)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        return self.data[index]
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        self.data[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self.data[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare items only, like UserList: nodes of both kinds and plain lists with the same items are equal."""
+        return self.data == (other.data if isinstance(other, _UnresolvedSequence) else other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> Self:
+        """Copy the items too, a copy must not share data with the original."""
+        return type(self)(self.data)
+
+    def insert(self, index: int, value: T) -> None:
+        self.data.insert(index, value)
+
+    def append(self, value: T) -> None:
+        self.data.append(value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        self.data.extend(values)
+
+
+class UnresolvedConcatenation(_UnresolvedSequence[T]):
     """A list representing https://github.com/lightbend/config/blob/v1.4.3/HOCON.md#value-concatenation."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         """Replace [] in list repr with 〈 〉 brackets to distinguish Duplications from regular lists, when printed.
 
         A bare minimum, to be able to represent parsed data as string.
         """
-        return "〈" + super().__repr__()[1:-1] + "〉"
+        return "〈" + repr(self.data)[1:-1] + "〉"
 
     def get_type(self) -> type[list | dict | str]:
         """Scan all concatenation items to evaluate type.
 
         After all, string concatenations are resolved differently than lists and dicts.
         """
-        concat_types = {type(value) for value in self}
+        concat_types: set[type] = {type(value) for value in self}
         concat_types.discard(UnresolvedSubstitution)
         simple_value_classes = get_args(SIMPLE_VALUE_TYPE)
         if all(issubclass(concat_type, simple_value_classes) for concat_type in concat_types):
@@ -47,6 +111,29 @@ class UnresolvedConcatenation(UserList, Generic[T]):
         concat_types = {type(value) for value in self}
         return UnresolvedSubstitution in concat_types
 
+    def is_self_append(self) -> bool:
+        """Check if this concatenation looks like ${?a} [x] located at a (which is what a += x turns into).
+
+        Consecutive self appends of the same key are equivalent to a single ${?a} [x] [y] [z] concatenation.
+        """
+        if not self or type(self[-1]) is not list:
+            return False
+        substitution = self[0]
+        return (
+            isinstance(substitution, UnresolvedSubstitution)
+            and substitution.optional
+            and substitution.keys == substitution.location
+        )
+
+    def folds_with(self, other: object) -> "TypeGuard[UnresolvedConcatenation]":
+        """Check if self and other are self appends of the same key, so other can be folded into self."""
+        return (
+            isinstance(other, UnresolvedConcatenation)
+            and self.is_self_append()
+            and other.is_self_append()
+            and self[0] == other[0]
+        )
+
     def sanitize(self) -> "UnresolvedConcatenation":
         """Get rid of elements that should be discarded by hocon resolver.
 
@@ -81,50 +168,66 @@ class UnresolvedConcatenation(UserList, Generic[T]):
         return UnresolvedConcatenation(self[first:last])
 
     @staticmethod
-    def _is_empty_unquoted_string(value: "ANY_VALUE_TYPE | ANY_UNRESOLVED") -> bool:
+    def _is_empty_unquoted_string(value: object) -> bool:
         return isinstance(value, UnquotedString) and value.is_empty()
 
 
-class UnresolvedDuplication(UserList):
+class UnresolvedDuplication(_UnresolvedSequence[Any]):
     """A list representing http://github.com/lightbend/config/blob/v1.4.3/HOCON.md#duplicate-keys-and-object-merging."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         """Replace [] in list repr with 【 】 brackets to distinguish Duplications from regular lists, when printed.
 
         A bare minimum, to be able to represent parsed data as string.
         """
-        return "【" + super().__repr__()[1:-1] + "】"
+        return "【" + repr(self.data)[1:-1] + "】"
 
-    def sanitize(self) -> Self:
-        """Discard all items overriden by a list or a simple value."""
+    def sanitize(self) -> "UnresolvedDuplication":
+        """Discard all items overriden by a list or a simple value. Self stays untouched.
+
+        The parser folds literal values, so a simple value may be followed by items that turn out undefined
+        (like ${?x}). Then it is kept as their fallback, only the items before it get discarded.
+        """
         if len(self) == 0:
             msg = "Unresolved duplicate key must contain at least 2 elements."
             raise HOCONDuplicateKeyMergeError(msg)
         for index in reversed(range(len(self))):
             if not isinstance(self[index], list | dict | ANY_UNRESOLVED):
-                for _ in range(index + 1):
-                    del self[0]
-                break
+                overriding = self[index + 1 :]
+                if overriding and not any(isinstance(value, ANY_UNRESOLVED) for value in overriding):
+                    return UnresolvedDuplication(overriding)
+                return UnresolvedDuplication(self[index:])
         return self
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnresolvedSubstitution:
-    """See https://github.com/lightbend/config/blob/v1.4.3/HOCON.md#substitutions."""
+    """See https://github.com/lightbend/config/blob/v1.4.3/HOCON.md#substitutions.
 
-    keys: list[str]
+    An immutable value: the resolver makes rewritten copies (dataclasses.replace keeps id_) instead of modifying it.
+    Keypaths are tuples. Lists passed in are converted, so the parser can share the same tuples across substitutions.
+    location is computed once, so comparing substitutions allocates nothing.
+    """
+
+    keys: tuple[str, ...]
     optional: bool
-    relative_location: list[str] = field(default_factory=list)
-    including_root: list[str] = field(default_factory=list)
+    relative_location: tuple[str, ...] = ()
+    including_root: tuple[str, ...] = ()
     id_: int = field(default_factory=count().__next__)
-
-    @property
-    def location(self) -> list[str]:
-        """Return FULL path to this substitution from the very root of the main config file.
-
-        Even if this substitution is defined inside a nested included file.
-        """
-        return self.including_root + self.relative_location
+    location: tuple[str, ...] = field(init=False)
+    """FULL path to this substitution from the very root of the main config file.
+
+    Even if this substitution is defined inside a nested included file.
+    """
+
+    def __post_init__(self) -> None:
+        """Accept any sequences of keys."""
+        object.__setattr__(self, "keys", tuple(self.keys))
+        object.__setattr__(self, "relative_location", tuple(self.relative_location))
+        object.__setattr__(self, "including_root", tuple(self.including_root))
+        object.__setattr__(self, "location", self.including_root + self.relative_location)
 
     def __str__(self) -> str:
         """Reconstruct substitution string from original data, like ${?x}."""
@@ -0,0 +1,117 @@
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONIncludeError
+from hocon.parser import Classpath, classpath
+from hocon.parser import _classpath
+
+
+@pytest.fixture
+def roots(monkeypatch):
+    return lambda *roots: monkeypatch.setattr(classpath, "roots", roots)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    package_dir = tmp_path / "site" / "hocon_test_configs"
+    (package_dir / "db").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "db" / "defaults.conf").write_text("host = localhost\nport = 5432")
+    (package_dir / "app.conf").write_text('name = app\ndb { include classpath("db/defaults.conf") }')
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+    yield package_dir
+    sys.modules.pop("hocon_test_configs", None)
+
+
+def test_package_resources(package, roots):
+    roots("hocon_test_configs")
+    result = hocon.loads('include required(classpath("/app.conf"))\ndb.port = 5433')
+    assert result == {"name": "app", "db": {"host": "localhost", "port": 5433}}
+
+
+def test_first_root_wins(package, tmp_path, roots):
+    overrides = tmp_path / "overrides"
+    (overrides / "db").mkdir(parents=True)
+    (overrides / "db" / "defaults.conf").write_text("host = db.internal")
+    roots(overrides, "hocon_test_configs")
+    assert hocon.loads('include classpath("app.conf")') == {"name": "app", "db": {"host": "db.internal"}}
+
+
+def test_zipped_package_is_read_without_extracting(tmp_path, monkeypatch, roots):
+    archive = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("hocon_zipped_configs/__init__.py", "")
+        zip_file.writestr("hocon_zipped_configs/app.conf", 'name = zipped\ninclude classpath("db.conf")')
+        zip_file.writestr("hocon_zipped_configs/db.conf", "port = 1")
+    monkeypatch.syspath_prepend(str(archive))
+    try:
+        roots("hocon_zipped_configs")
+        assert not isinstance(classpath.find("app.conf"), Path)
+        assert hocon.loads('include classpath("app.conf")') == {"name": "zipped", "port": 1}
+    finally:
+        sys.modules.pop("hocon_zipped_configs", None)
+
+
+@pytest.mark.parametrize("include", ['include "db.conf"', 'include required("db.conf")', 'include "../zcfg/db"'])
+def test_relative_include_inside_zipped_resource(tmp_path, roots, include):
+    archive = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("zcfg/app.conf", f"name = zipped\n{include}")
+        zip_file.writestr("zcfg/db.conf", "port = 1")
+    roots(zipfile.Path(archive))
+    assert hocon.loads('include classpath("zcfg/app.conf")') == {"name": "zipped", "port": 1}
+
+
+def test_relative_include_of_missing_classpath_resource(package, roots):
+    roots("hocon_test_configs")
+    (package / "app.conf").write_text('name = app\ninclude "missing.conf"')
+    assert hocon.loads('include classpath("app.conf")') == {"name": "app"}
+    (package / "app.conf").write_text('name = app\ninclude required("missing.conf")')
+    with pytest.raises(HOCONIncludeError, match="Required classpath resource 'missing.conf' not found"):
+        hocon.loads('include classpath("app.conf")')
+
+
+def test_sys_path_is_the_default_classpath(package, tmp_path, monkeypatch, roots):
+    archive = tmp_path / "configs.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("zipped.conf", "zipped = true")
+    monkeypatch.syspath_prepend(str(archive))
+    monkeypatch.syspath_prepend(str(tmp_path / "missing"))
+    roots()
+    result = hocon.loads('include classpath("hocon_test_configs/db/defaults.conf")\ninclude classpath("zipped.conf")')
+    assert result == {"host": "localhost", "port": 5432, "zipped": True}
+    with pytest.raises(HOCONIncludeError, match="Required classpath resource 'absent.conf' not found"):
+        hocon.loads('include required(classpath("absent.conf"))')
+
+
+def test_resources_are_indexed_once(package, monkeypatch):
+    walks = []
+    walk = _classpath._walk
+    monkeypatch.setattr(_classpath, "_walk", lambda *args: walks.append(args) or walk(*args))
+    packages = Classpath(["hocon_test_configs"])
+    assert packages.find("db/defaults.conf") is not None
+    assert packages.find("missing.conf") is None
+    assert len(walks) == 2
+    packages.roots = [package / "db"]
+    assert packages.find("defaults.conf") == package / "db" / "defaults.conf"
+    assert len(walks) == 3
+
+
+def test_documents_with_classpath_includes_are_not_cached(package, tmp_path, roots):
+    roots("hocon_test_configs")
+    root = tmp_path / "application.conf"
+    root.write_text('include classpath("db/defaults.conf")')
+    hocon.cached_load.cache_clear()
+    assert hocon.cached_load(root)["port"] == 5432
+    with open(root) as fp:
+        assert hocon.load(fp, cache_dir=tmp_path / "cache")["port"] == 5432
+    (package / "db" / "defaults.conf").write_text("port = 1")
+    assert hocon.cached_load(root)["port"] == 1
+    with open(root) as fp:
+        assert hocon.load(fp, cache_dir=tmp_path / "cache")["port"] == 1
+    assert hocon.cached_load.cache_info().currsize == 0
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,142 @@
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONIncludeError, HOCONInvalidKeyError
+from hocon.parser import parse
+from hocon.parser.data import Sources
+from hocon.strings import QuotedString
+
+
+def load(path):
+    with open(path) as fp:
+        return hocon.load(fp)
+
+
+def test_json_include(tmp_path):
+    (tmp_path / "db.json").write_text('{"host": "localhost", "port": 5432, "ssl": true, "tags": ["a", null]}')
+    (tmp_path / "application.conf").write_text('db { include "db.json" }\nurl = ${db.host}":"${db.port}')
+    assert load(tmp_path / "application.conf") == {
+        "db": {"host": "localhost", "port": 5432, "ssl": True, "tags": ["a", None]},
+        "url": "localhost:5432",
+    }
+
+
+def test_json_is_shaped_like_a_parse_tree(tmp_path):
+    (tmp_path / "a.json").write_text('{"a": "1", "b": [1.5]}')
+    assert parse('include "a.json"', tmp_path / "application.conf") == {"a": QuotedString("1"), "b": [1.5]}
+    resolved = hocon.loads('include "a.json"', tmp_path / "application.conf")
+    assert type(resolved["a"]) is QuotedString
+
+
+def test_json_duplicate_keys_merge_like_hocon(tmp_path):
+    (tmp_path / "a.json").write_text('{"a": {"x": 1, "y": 1}, "b": 1, "a": {"y": 2}, "b": 2}')
+    assert hocon.loads(f'include "{tmp_path / "a.json"}"') == {"a": {"x": 1, "y": 2}, "b": 2}
+
+
+def test_invalid_json_falls_back_to_hocon(tmp_path):
+    (tmp_path / "a.json").write_text("// not really JSON\na: 1, b: ${a}")
+    assert hocon.loads(f'include "{tmp_path / "a.json"}"') == {"a": 1, "b": 1}
+
+
+def test_json_array_include(tmp_path):
+    (tmp_path / "a.json").write_text("[1, 2]")
+    with pytest.raises(HOCONIncludeError, match="must contain an object, not an array"):
+        hocon.loads(f'include "{tmp_path / "a.json"}"')
+
+
+def test_properties_include(tmp_path):
+    (tmp_path / "a.properties").write_text(
+        "# comment\n"
+        "! comment\n"
+        "db.host = localhost\n"
+        "db.port:5432\n"
+        "db.name value with spaces \\\n"
+        "    continued\n"
+        "escaped\\ key\\=x = tab\\there \\u00e9\n"
+        "empty\n"
+        "a = 1\n"
+        "a.b = 2\n"
+    )
+    assert hocon.loads(f'include "{tmp_path / "a.properties"}"') == {
+        "db": {"host": "localhost", "port": "5432", "name": "value with spaces continued"},
+        "escaped key=x": "tab\there é",
+        "empty": "",
+        "a": {"b": "2"},
+    }
+
+
+def test_properties_object_wins_over_value(tmp_path):
+    (tmp_path / "a.properties").write_text("a.b = 2\na = 1\n")
+    assert hocon.loads(f'include "{tmp_path / "a.properties"}"') == {"a": {"b": "2"}}
+
+
+def test_extensionless_include_merges_all_formats(tmp_path):
+    (tmp_path / "app.properties").write_text("a = properties\nb = properties\nc = properties")
+    (tmp_path / "app.json").write_text('{"b": "json", "c": "json"}')
+    (tmp_path / "app.conf").write_text("c = conf")
+    (tmp_path / "application.conf").write_text('include "app"')
+    assert load(tmp_path / "application.conf") == {"a": "properties", "b": "json", "c": "conf"}
+
+
+def test_extensionless_include_without_matches_reads_the_bare_name(tmp_path):
+    (tmp_path / "app").write_text("a = 1")
+    (tmp_path / "application.conf").write_text('include "app"\ninclude "missing"')
+    assert load(tmp_path / "application.conf") == {"a": 1}
+
+
+def test_missing_probes_are_recorded(tmp_path):
+    (tmp_path / "app.json").write_text('{"a": 1}')
+    sources = Sources()
+    parse('include "app"', tmp_path / "application.conf", sources=sources)
+    assert sources.files == {
+        tmp_path / "app.properties": None,
+        tmp_path / "app.json": '{"a": 1}',
+        tmp_path / "app.conf": None,
+    }
+
+
+def test_extensionless_required_include_of_a_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        hocon.loads('include required("missing")', tmp_path / "application.conf")
+
+
+def test_cached_load_notices_probed_file_appearing(tmp_path):
+    (tmp_path / "app.conf").write_text("a = 1")
+    (tmp_path / "application.conf").write_text('include "app"')
+    assert hocon.cached_load(tmp_path / "application.conf") == {"a": 1}
+    (tmp_path / "app.json").write_text('{"b": 2}')
+    assert hocon.cached_load(tmp_path / "application.conf") == {"a": 1, "b": 2}
+    hocon.cached_load.cache_clear()
+
+
+def test_load_json(tmp_path):
+    (tmp_path / "a.json").write_text('[{"a": "${b}"}, 1.5]')
+    assert load(tmp_path / "a.json") == [{"a": "${b}"}, 1.5]
+
+
+def test_load_properties(tmp_path):
+    (tmp_path / "a.properties").write_text("a.b = ${c}")
+    assert load(tmp_path / "a.properties") == {"a": {"b": "${c}"}}
+
+
+def test_load_invalid_json_falls_back_to_hocon(tmp_path):
+    (tmp_path / "a.json").write_text("a: 1, b: ${a}")
+    assert load(tmp_path / "a.json") == {"a": 1, "b": 1}
+
+
+def test_load_json_scalar_gets_parsed_as_hocon(tmp_path):
+    (tmp_path / "a.json").write_text('"x"')
+    with pytest.raises(HOCONInvalidKeyError):
+        load(tmp_path / "a.json")
+
+
+def test_repeated_json_include(tmp_path):
+    (tmp_path / "a.json").write_text('{"a": {"b": 1}}')
+    (tmp_path / "application.conf").write_text('x { include "a.json" }\ny { include "a.json" }\ny.a.c = 2')
+    sources = Sources()
+    assert hocon.loads((tmp_path / "application.conf").read_text(), tmp_path / "application.conf") == {
+        "x": {"a": {"b": 1}},
+        "y": {"a": {"b": 1, "c": 2}},
+    }
+    parse('include "a.json"\ninclude "a.json"', tmp_path / "application.conf", sources=sources)
+    assert sources.include_cache.misses == 0
@@ -0,0 +1,89 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONIncludeError
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    hocon.cached_load.cache_clear()
+    yield
+    hocon.cached_load.cache_clear()
+
+
+@pytest.fixture
+def conf(tmp_path):
+    conf_d = tmp_path / "conf.d"
+    (conf_d / "nested").mkdir(parents=True)
+    (conf_d / "20-override.conf").write_text('db.host = prod\ninclude "nested/port.conf"')
+    (conf_d / "10-defaults.conf").write_text("db { host = localhost, port = 1 }")
+    (conf_d / "nested" / "port.conf").write_text("db.port = 2")
+    (conf_d / "README.md").write_text("not a config")
+    (conf_d / ".00-hidden.conf").write_text("db.port = 9")
+    root = tmp_path / "application.conf"
+    root.write_text('include required(glob("conf.d/*.conf"))\nservice { include glob("conf.d/1*.conf") }')
+    return root
+
+
+EXPECTED = {
+    "db": {"host": "prod", "port": 2},
+    "service": {"db": {"host": "localhost", "port": 1}},
+}
+
+
+def test_matches_are_merged_in_sorted_order(conf):
+    with open(conf) as fp:
+        assert hocon.load(fp) == EXPECTED
+
+
+def test_same_as_sequential_includes(conf):
+    sequential = conf.read_text().replace(
+        'include required(glob("conf.d/*.conf"))',
+        'include "conf.d/10-defaults.conf"\ninclude "conf.d/20-override.conf"',
+    )
+    assert hocon.loads(sequential, conf) == EXPECTED
+
+
+def test_matches_are_read_by_workers(conf, monkeypatch):
+    threads = {}
+    read_text = Path.read_text
+
+    def record(path, *args, **kwargs):
+        threads[path.name] = threading.current_thread().name
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", record)
+    assert hocon.loads(conf.read_text(), conf) == EXPECTED
+    assert all(threads[name].startswith("hocon-include") for name in ["10-defaults.conf", "port.conf"])
+
+
+def test_with_prefetch(conf):
+    assert hocon.loads(conf.read_text(), conf, prefetch_includes=True) == EXPECTED
+
+
+def test_no_matches(tmp_path):
+    assert hocon.loads('include glob("conf.d/*.conf")\na = 1', tmp_path / "application.conf") == {"a": 1}
+    with pytest.raises(HOCONIncludeError, match="No file matches required glob include 'conf.d/\\*.conf'"):
+        hocon.loads('include required(glob("conf.d/*.conf"))', tmp_path / "application.conf")
+
+
+def test_new_match_invalidates_cached_load(conf, tmp_path):
+    assert hocon.cached_load(conf) == EXPECTED
+    (tmp_path / "conf.d" / "30-last.conf").write_text("db.port = 3")
+    assert hocon.cached_load(conf)["db"] == {"host": "prod", "port": 3}
+    assert hocon.cached_load.cache_info().misses == 2
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("conf.d/10-defaults.conf", {"db": {"host": "localhost", "port": 1}}),
+        ("conf.d/missing.conf", {}),
+        ("conf.d/.*.conf", {"db": {"port": 9}}),
+    ],
+)
+def test_literal_and_hidden_patterns(conf, pattern: str, expected: dict):
+    assert hocon.loads(f'include glob("{pattern}")', conf) == expected
@@ -1,9 +1,47 @@
 from pathlib import Path
 
+import pytest
+
 from hocon import loads
+from hocon.parser import parse
+from hocon.parser.data import Sources
+from hocon.resolver import resolve
 
 
 def test_2_includes_relative_to_cwd():
     conf_filepath = Path(__file__).parent / "data" / "main.conf"
     result = loads(conf_filepath.read_text(), encoding="UTF-8")
     assert result == {"house": {"location": "서울 Nice street 42", "city": "서울"}}
+
+
+def test_repeated_include_is_parsed_once_and_rerooted(tmp_path, monkeypatch):
+    (tmp_path / "common.conf").write_text("x = 1\ny = ${x}\nlist += ${x}")
+    root = tmp_path / "root.conf"
+    root.write_text(
+        'include "common.conf"\na { include "common.conf" }\nb {\n include "common.conf"\n z = 2\n}\nlist += 5\n'
+        'c.d { include "common.conf" }',
+    )
+    reads = []
+    read_text = Path.read_text
+    monkeypatch.setattr(
+        Path, "read_text", lambda path, *args, **kwargs: reads.append(path) or read_text(path, *args, **kwargs)
+    )
+    sources = Sources()
+    parsed = parse(root.read_text(), root, sources=sources)
+    assert reads.count(tmp_path / "common.conf") == 2
+    assert (sources.include_cache.hits, sources.include_cache.misses) == (2, 2)
+    assert resolve(parsed) == {
+        "x": 1,
+        "y": 1,
+        "list": [1, 5],
+        "a": {"x": 1, "y": 1, "list": [1, 5, 1]},
+        "b": {"x": 1, "y": 1, "list": [1, 5, 1], "z": 2},
+        "c": {"d": {"x": 1, "y": 1, "list": [1, 5, 1]}},
+    }
+
+
+def test_required_include_of_file_missing_for_previous_optional_include(tmp_path):
+    root = tmp_path / "root.conf"
+    root.write_text('a { include "missing.conf" }\nb { include required("missing.conf") }')
+    with pytest.raises(FileNotFoundError):
+        parse(root.read_text(), root)
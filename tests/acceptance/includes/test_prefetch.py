@@ -0,0 +1,67 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+import hocon
+
+
+@pytest.fixture
+def reader_threads(monkeypatch):
+    threads = {}
+    read_text = Path.read_text
+
+    def record(path, *args, **kwargs):
+        threads[path.name] = threading.current_thread().name
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", record)
+    return threads
+
+
+@pytest.fixture
+def conf(tmp_path):
+    (tmp_path / "c.conf").write_text("c = 3")
+    (tmp_path / "b.conf").write_text('b = 2\ninclude "c.conf"')
+    (tmp_path / "a.conf").write_text('a = 1\ninclude required(file("b.conf"))\nx = ${b}')
+    root = tmp_path / "root.conf"
+    root.write_text(
+        'include "a.conf"\n// include "commented_out.conf"\ninclude "missing.conf"\nnested { include "b.conf" }'
+    )
+    return root
+
+
+def test_nested_includes_are_read_ahead_by_workers(conf, reader_threads):
+    result = hocon.loads(conf.read_text(), conf, prefetch_includes=True)
+    assert result == {"a": 1, "b": 2, "c": 3, "x": 2, "nested": {"b": 2, "c": 3}}
+    assert all(reader_threads[name].startswith("hocon-include") for name in ["a.conf", "b.conf", "c.conf"])
+    assert result == hocon.loads(conf.read_text(), conf)
+
+
+def test_include_missed_by_prescan_is_read_by_parser(tmp_path, reader_threads):
+    (tmp_path / "a.conf").write_text("a = 1")
+    root = tmp_path / "root.conf"
+    root.write_text('include "\\u0061.conf"')
+    assert hocon.loads(root.read_text(), root, prefetch_includes=True) == {"a": 1}
+    assert reader_threads["a.conf"] == threading.main_thread().name
+
+
+def test_missing_required_include_raises_like_without_prefetch(tmp_path):
+    root = tmp_path / "root.conf"
+    root.write_text('include required("missing.conf")')
+    with pytest.raises(FileNotFoundError):
+        hocon.loads(root.read_text(), root, prefetch_includes=True)
+
+
+def test_unreadable_optional_include_raises_like_without_prefetch(tmp_path):
+    (tmp_path / "dir.conf").mkdir()
+    root = tmp_path / "root.conf"
+    root.write_text('include "dir.conf"')
+    with pytest.raises(IsADirectoryError):
+        hocon.loads(root.read_text(), root, prefetch_includes=True)
+
+
+def test_load_with_cache_dir(conf, tmp_path):
+    with open(conf) as fp:
+        result = hocon.load(fp, cache_dir=tmp_path / "cache", prefetch_includes=True)
+    assert result == {"a": 1, "b": 2, "c": 3, "x": 2, "nested": {"b": 2, "c": 3}}
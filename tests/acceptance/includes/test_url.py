@@ -0,0 +1,185 @@
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONIncludeError
+from hocon.parser import UrlFetcher, _include
+
+ROUTES = {
+    "/app.conf": ('name = app\ninclude "nested/db.conf"', {"ETag": '"v1"'}),
+    "/nested/db.conf": ("db.port = 1", {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+    "/latin.conf": ("name = café".encode("latin-1"), {"Content-Type": "text/plain; charset=latin-1"}),
+    "/closing.conf": ("a = 1", {"Connection": "close"}),
+    "/query.conf?env=prod": ("env = prod", {}),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.client_address[1], dict(self.headers)))
+        if self.path == "/redirect.conf":
+            return self._respond(302, b"", {"Location": "/app.conf"})
+        if self.path == "/loop.conf":
+            return self._respond(302, b"", {"Location": "/loop.conf"})
+        if self.path == "/concurrent.conf":
+            self.server.barrier.wait()
+            return self._respond(200, b"a = 1", {})
+        if self.path == "/error.conf" or self.server.failing:
+            return self._respond(500, b"", {})
+        if self.path not in ROUTES:
+            return self._respond(404, b"", {})
+        body, headers = ROUTES[self.path]
+        body = body if isinstance(body, bytes) else body.encode()
+        etag = headers.get("ETag")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            return self._respond(304, b"", headers)
+        return self._respond(200, body, headers)
+
+    def _respond(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.server.dropping or headers.get("Connection") == "close"
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.requests, httpd.failing, httpd.dropping = [], False, False
+    httpd.barrier = threading.Barrier(2, timeout=5)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    fetcher = UrlFetcher(tmp_path / "urls", timeout=5)
+    monkeypatch.setattr(_include, "urls", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+def test_conditional_requests_on_one_connection(server, fetcher):
+    data = f'include url("{server.url}/app.conf")'
+    assert hocon.loads(data) == {"name": "app", "db": {"port": 1}}
+    assert hocon.loads(data) == {"name": "app", "db": {"port": 1}}
+    paths = [path for path, _, _ in server.requests]
+    assert paths == ["/app.conf", "/nested/db.conf", "/app.conf", "/nested/db.conf"]
+    assert server.requests[2][2]["If-None-Match"] == '"v1"'
+    assert server.requests[3][2]["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert len({port for _, port, _ in server.requests}) == 1
+
+
+def test_unreachable_host_falls_back_to_cache(server, fetcher):
+    data = f'include url("{server.url}/app.conf")'
+    hocon.loads(data)
+    server.failing = True
+    assert hocon.loads(data) == {"name": "app", "db": {"port": 1}}
+    server.shutdown()
+    server.server_close()
+    fetcher.close()
+    assert hocon.loads(data) == {"name": "app", "db": {"port": 1}}
+
+
+def test_unreachable_host_without_cache(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(_include, "urls", UrlFetcher())
+    server.shutdown()
+    server.server_close()
+    assert hocon.loads(f'a = 1\ninclude url("{server.url}/app.conf")') == {"a": 1}
+    with pytest.raises(ConnectionRefusedError):
+        hocon.loads(f'include required(url("{server.url}/app.conf"))')
+
+
+def test_concurrent_requests_to_one_host(server, fetcher):
+    """Each request waits on the server until the other one arrives, so they have to be in flight together."""
+    fetcher.fetch(f"{server.url}/nested/db.conf", "UTF-8")
+    with ThreadPoolExecutor(2) as executor:
+        fetched = list(executor.map(lambda _: fetcher.fetch(f"{server.url}/concurrent.conf", "UTF-8"), range(2)))
+    assert [resource.text for resource in fetched] == ["a = 1", "a = 1"]
+    assert len(fetcher._connections) == 1
+
+
+def test_without_cache_dir(server, monkeypatch):
+    monkeypatch.setattr(_include, "urls", UrlFetcher())
+    data = f'include url("{server.url}/app.conf")'
+    assert hocon.loads(data) == hocon.loads(data) == {"name": "app", "db": {"port": 1}}
+    assert "If-None-Match" not in server.requests[2][2]
+
+
+def test_corrupted_cache_is_ignored(server, fetcher):
+    hocon.loads(f'include url("{server.url}/nested/db.conf")')
+    for meta in fetcher.cache_dir.glob("*.json"):
+        meta.write_text("{")
+    server.failing = True
+    with pytest.raises(HOCONIncludeError, match="HTTP 500"):
+        hocon.loads(f'include url("{server.url}/nested/db.conf")')
+
+
+def test_stale_pooled_connection_is_replaced(server, fetcher):
+    server.dropping = True
+    hocon.loads(f'include url("{server.url}/nested/db.conf")')
+    assert hocon.loads(f'include url("{server.url}/query.conf?env=prod")') == {"env": "prod"}
+    assert len({port for _, port, _ in server.requests}) == 2
+
+
+def test_connection_closed_by_server_is_not_pooled(server, fetcher):
+    assert hocon.loads(f'include url("{server.url}/closing.conf")') == {"a": 1}
+    assert hocon.loads(f'include url("{server.url}/closing.conf")') == {"a": 1}
+    assert len({port for _, port, _ in server.requests}) == 2
+
+
+def test_charset_from_content_type(server, fetcher):
+    data = f'include url("{server.url}/latin.conf")'
+    assert hocon.loads(data) == {"name": "café"}
+    server.failing = True
+    assert hocon.loads(data) == {"name": "café"}
+
+
+def test_redirects(server, fetcher):
+    assert hocon.loads(f'include url("{server.url}/redirect.conf")') == {"name": "app", "db": {"port": 1}}
+    with pytest.raises(HOCONIncludeError, match="more than 5 redirects"):
+        hocon.loads(f'include url("{server.url}/loop.conf")')
+
+
+def test_missing(server, fetcher):
+    assert hocon.loads(f'a = 1\ninclude url("{server.url}/missing.conf")') == {"a": 1}
+    with pytest.raises(HOCONIncludeError, match="Required url resource '.*/missing.conf' not found"):
+        hocon.loads(f'include required(url("{server.url}/missing.conf"))')
+
+
+def test_https_connection():
+    assert isinstance(UrlFetcher()._connect("https", "localhost"), http.client.HTTPSConnection)
+
+
+def test_only_http(fetcher):
+    with pytest.raises(HOCONIncludeError, match="Only http and https urls can be included, got ftp"):
+        hocon.loads('include url("ftp://localhost/app.conf")')
+
+
+def test_documents_with_url_includes_are_not_cached(server, fetcher, tmp_path, monkeypatch):
+    root = tmp_path / "application.conf"
+    root.write_text(f'include url("{server.url}/nested/db.conf")')
+    hocon.cached_load.cache_clear()
+    assert hocon.cached_load(root) == {"db": {"port": 1}}
+    monkeypatch.setitem(ROUTES, "/nested/db.conf", ("db.port = 2", {}))
+    assert hocon.cached_load(root) == {"db": {"port": 2}}
+    with open(root) as fp:
+        assert hocon.load(fp, cache_dir=tmp_path / "cache") == {"db": {"port": 2}}
+    assert hocon.cached_load.cache_info().currsize == 0
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+import hocon
+from hocon import _cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    hocon.cached_load.cache_clear()
+    yield
+    hocon.cached_load.cache_clear()
+
+
+@pytest.fixture
+def conf(tmp_path):
+    (tmp_path / "common.conf").write_text("port = 1")
+    root = tmp_path / "application.conf"
+    root.write_text('include "common.conf"\nhost = h')
+    return root
+
+
+@pytest.fixture
+def no_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed despite the cache")
+
+    return lambda: monkeypatch.setattr(_cache, "parse", fail)
+
+
+def test_hit_skips_parsing(conf, no_parsing):
+    assert hocon.cached_load(conf) == {"port": 1, "host": "h"}
+    no_parsing()
+    assert hocon.cached_load(str(conf)) == {"port": 1, "host": "h"}
+    assert hocon.cached_load.cache_info() == _cache.CacheInfo(hits=1, misses=1, evictions=0, maxsize=128, currsize=1)
+
+
+def test_relative_path_shares_entry_with_absolute(conf, monkeypatch):
+    monkeypatch.chdir(conf.parent)
+    hocon.cached_load(conf)
+    hocon.cached_load("application.conf")
+    assert hocon.cached_load.cache_info().hits == 1
+
+
+def test_changed_include_is_a_miss(conf, tmp_path):
+    hocon.cached_load(conf)
+    (tmp_path / "common.conf").write_text("port = 22")
+    assert hocon.cached_load(conf) == {"port": 22, "host": "h"}
+    assert hocon.cached_load.cache_info().misses == 2
+
+
+def test_touched_file_with_same_content_is_a_hit(conf):
+    hocon.cached_load(conf)
+    os.utime(conf, ns=(0, 0))
+    hocon.cached_load(conf)
+    assert hocon.cached_load.cache_info().hits == 1
+
+
+def test_changed_environment_is_a_miss(tmp_path, monkeypatch):
+    root = tmp_path / "env.conf"
+    root.write_text("host = ${HOCON_CACHED_LOAD_TEST_HOST}")
+    monkeypatch.setenv("HOCON_CACHED_LOAD_TEST_HOST", "a")
+    assert hocon.cached_load(root) == {"host": "a"}
+    monkeypatch.setenv("HOCON_CACHED_LOAD_TEST_HOST", "b")
+    assert hocon.cached_load(root) == {"host": "b"}
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    paths = [tmp_path / f"{name}.conf" for name in "abc"]
+    for path in paths:
+        path.write_text(f"name = {path.stem}")
+    hocon.cached_load(paths[0], maxsize=2)
+    hocon.cached_load(paths[1], maxsize=2)
+    hocon.cached_load(paths[0], maxsize=2)
+    hocon.cached_load(paths[2], maxsize=2)
+    assert hocon.cached_load.cache_info() == _cache.CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+    hocon.cached_load(paths[0], maxsize=2)
+    assert hocon.cached_load.cache_info().hits == 2
+
+
+def test_unbounded(tmp_path):
+    for name in "abc":
+        (tmp_path / f"{name}.conf").write_text("a = 1")
+        hocon.cached_load(tmp_path / f"{name}.conf", maxsize=None)
+    assert hocon.cached_load.cache_info().currsize == 3
+
+
+def test_result_is_copied_unless_asked_not_to(conf):
+    hocon.cached_load(conf)["port"] = 5
+    assert hocon.cached_load(conf)["port"] == 1
+    assert hocon.cached_load(conf, copy=False) is hocon.cached_load(conf, copy=False)
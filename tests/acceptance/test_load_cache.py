@@ -0,0 +1,140 @@
+import io
+import os
+
+import pytest
+
+import hocon
+from hocon import _cache
+from hocon.exceptions import HOCONSubstitutionCycleError
+
+
+@pytest.fixture
+def conf(tmp_path):
+    (tmp_path / "common.conf").write_text("port = 1")
+    root = tmp_path / "application.conf"
+    root.write_text('include "common.conf"\ninclude "optional.conf"\nhost = ${HOCON_CACHE_TEST_HOST}')
+    return root
+
+
+@pytest.fixture
+def no_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed despite the cache")
+
+    return lambda: monkeypatch.setattr(_cache, "parse", fail)
+
+
+def _load(path, cache_dir, **kwargs):
+    with open(path) as fp:
+        return hocon.load(fp, cache_dir=cache_dir, **kwargs)
+
+
+def test_hit_skips_parsing(conf, tmp_path, monkeypatch, no_parsing):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "h"}
+    no_parsing()
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "h"}
+
+
+def test_touched_file_with_same_content_is_a_hit(conf, tmp_path, monkeypatch, no_parsing):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    _load(conf, tmp_path / "cache")
+    os.utime(tmp_path / "common.conf", ns=(0, 0))
+    no_parsing()
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "h"}
+
+
+@pytest.mark.parametrize("filename", ["common.conf", "optional.conf", "application.conf"])
+def test_changed_file_invalidates(conf, tmp_path, monkeypatch, filename):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    _load(conf, tmp_path / "cache")
+    path = tmp_path / filename
+    path.write_text(path.read_text() + "\nport = 2" if path.exists() else "port = 2")
+    assert _load(conf, tmp_path / "cache")["port"] == 2
+
+
+def test_deleted_include_invalidates(conf, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    (tmp_path / "optional.conf").write_text("port = 2")
+    _load(conf, tmp_path / "cache")
+    (tmp_path / "optional.conf").unlink()
+    assert _load(conf, tmp_path / "cache")["port"] == 1
+
+
+def test_changed_environment_resolves_without_parsing(conf, tmp_path, monkeypatch, no_parsing):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    _load(conf, tmp_path / "cache")
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "other")
+    no_parsing()
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "other"}
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "other"}
+
+
+def test_environment_consulted_by_cycle_check_invalidates(tmp_path, monkeypatch):
+    conf = tmp_path / "cycle.conf"
+    conf.write_text("a : { p : ${HOCON_CACHE_TEST_CYCLE} }\nHOCON_CACHE_TEST_CYCLE : ${a}")
+    monkeypatch.setenv("HOCON_CACHE_TEST_CYCLE", "x")
+    _load(conf, tmp_path / "cache")
+    monkeypatch.delenv("HOCON_CACHE_TEST_CYCLE")
+    with pytest.raises(HOCONSubstitutionCycleError):
+        _load(conf, tmp_path / "cache")
+
+
+def test_paths_are_cached_separately(conf, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    assert _load(conf, tmp_path / "cache", paths=["port"]) == {"port": 1}
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "h"}
+
+
+def test_corrupted_entry_is_a_miss(conf, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    _load(conf, tmp_path / "cache")
+    for entry in (tmp_path / "cache").iterdir():
+        entry.write_bytes(b"garbage")
+    assert _load(conf, tmp_path / "cache") == {"port": 1, "host": "h"}
+
+
+def test_file_changed_while_parsing_invalidates(conf, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    parse = _cache.parse
+
+    def parse_and_change(*args, **kwargs):
+        parsed = parse(*args, **kwargs)
+        (tmp_path / "common.conf").write_text("port = 2")
+        return parsed
+
+    monkeypatch.setattr(_cache, "parse", parse_and_change)
+    assert _load(conf, tmp_path / "cache")["port"] == 1
+    monkeypatch.setattr(_cache, "parse", parse)
+    assert _load(conf, tmp_path / "cache")["port"] == 2
+
+
+def test_hit_keeps_value_types(tmp_path, monkeypatch, no_parsing):
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "h")
+    root = tmp_path / "application.conf"
+    root.write_text(
+        'a = "q", b = [1, 2.5, null, true, 1e400], c = {x = ${a}} {y = ${b}}, c = {z = ${HOCON_CACHE_TEST_HOST}}'
+    )
+    expected = hocon.loads(root.read_text())
+    assert _load(root, tmp_path / "cache") == expected
+    no_parsing()
+    monkeypatch.setenv("HOCON_CACHE_TEST_HOST", "other")
+    assert _load(root, tmp_path / "cache")["c"] == {"x": "q", "y": [1, 2.5, None, True, float("inf")], "z": "other"}
+    cached = _load(root, tmp_path / "cache")
+    assert type(cached["a"]) is type(expected["a"])
+    assert type(cached["c"]["x"]) is type(expected["c"]["x"])
+
+
+@pytest.mark.passing_unsupported_type
+def test_uncacheable_value():
+    with pytest.raises(TypeError, match="Cannot cache"):
+        _cache._encode({"a": object()})
+
+
+@pytest.mark.parametrize("name", [None, "<stdin>", 0])
+def test_stream_without_file_is_not_cached(tmp_path, name):
+    fp = io.StringIO("a = 1, b = ${a}")
+    if name is not None:
+        fp.name = name
+    assert hocon.load(fp, cache_dir=tmp_path / "cache") == {"a": 1, "b": 1}
+    assert not (tmp_path / "cache").exists()
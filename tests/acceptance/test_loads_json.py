@@ -0,0 +1,61 @@
+import pytest
+
+import hocon
+from hocon import loads
+from hocon.parser import parse
+from hocon.resolver import resolve
+
+JSON_DOCUMENTS = [
+    '{"a": 1, "b": 1.5, "c": -0.0, "d": 1e3, "e": 100000000000000000000000}',
+    '{"a": "x", "b": "", "c": "\\u00e9\\n\\"", "d": "${not.a.substitution}", "e": "a.b"}',
+    '{"a": true, "b": false, "c": null, "d": {}, "e": []}',
+    ' \n\t{"a": {"b": [1, {"c": ["d"]}]}, "a": {"e": 1}, "a": {"b": {"f": 2}}}\n',
+    '{"a": 1, "a": {"b": 1}, "c": {"d": 1}, "c": [2], "e": [1], "e": [2]}',
+    '[1, "a", [true], {"b": null}]',
+    "[]",
+]
+
+
+def _typed(value):
+    """Make types part of the comparison: QuotedString != str, 1 != 1.0 != True."""
+    if isinstance(value, dict):
+        return {key: _typed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_typed(item) for item in value]
+    return type(value), value
+
+
+@pytest.mark.parametrize("data", JSON_DOCUMENTS)
+def test_json_is_loaded_like_hocon(data):
+    assert _typed(loads(data)) == _typed(resolve(parse(data)))
+
+
+@pytest.mark.parametrize("data", JSON_DOCUMENTS)
+def test_json_skips_the_parser(data, monkeypatch):
+    def fail(*_, **__):
+        raise AssertionError
+
+    monkeypatch.setattr(hocon._main, "parse", fail)
+    loads(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"a": 1, "b": ${a}}',
+        '{"a": 1} // comment',
+        '{"a": unquoted}',
+        '"a": 1',
+        '{"a": 1,}',
+        '{"a" {"b": 1}}',
+        '{"a": NaN}',
+        '{"a": Infinity}',
+        '{"a": """x"""}',
+    ],
+)
+def test_hocon_falls_back_to_the_parser(data):
+    assert loads(data) == resolve(parse(data))
+
+
+def test_json_with_paths():
+    assert loads('{"a": {"b": "x"}, "c": 1}', paths=["a.b"]) == {"a": {"b": "x"}}
@@ -0,0 +1,64 @@
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONError, HOCONSubstitutionUndefinedError
+
+DATA = """
+platform {
+  name = base
+  db { host = localhost, port = 5432, url = "jdbc://"${platform.db.host}":"${platform.db.port} }
+}
+service = ${platform} { name = service }
+broken = ${missing}
+maybe = ${?missing}
+items = [${platform.name}, 2]
+"""
+
+
+def test_untouched_values_are_not_resolved():
+    config = hocon.loads_lazy(DATA)
+    assert config["service"]["db"]["url"] == "jdbc://localhost:5432"
+    with pytest.raises(HOCONSubstitutionUndefinedError):
+        config["broken"]
+
+
+def test_equal_to_eagerly_loaded():
+    data = DATA.replace("broken = ${missing}", "")
+    assert hocon.loads_lazy(data) == hocon.loads(data)
+
+
+def test_undefined_values_are_absent():
+    config = hocon.loads_lazy("maybe = ${?missing}, a = 1")
+    assert "maybe" not in config
+    assert list(config) == ["a"]
+    assert len(config) == 1
+
+
+def test_values_are_cached():
+    config = hocon.loads_lazy(DATA)
+    assert config["items"] is config["items"]
+    assert config["items"] == ["base", 2]
+
+
+def test_read_only():
+    config = hocon.loads_lazy("a = 1")
+    with pytest.raises(TypeError):
+        config["a"] = 2
+
+
+def test_list_root_is_not_supported():
+    with pytest.raises(HOCONError):
+        hocon.loads_lazy("[1, 2]")
+
+
+def test_load_lazy(tmp_path):
+    conf_filepath = tmp_path / "application.conf"
+    conf_filepath.write_text("a { b = 1 }\nc = ${a.b}")
+    with open(conf_filepath) as fp:
+        config = hocon.load_lazy(fp)
+    assert config["c"] == 1
+    assert dict(config["a"]) == {"b": 1}
+
+
+def test_repr():
+    assert repr(hocon.loads_lazy("a = 1, b = ${a}")) == "ConfigView(['a', 'b'])"
@@ -0,0 +1,64 @@
+import pytest
+
+import hocon
+from hocon.exceptions import HOCONError
+
+DATA = """
+defaults { timeout = 5 }
+akka {
+  actor { provider = local, timeout = ${defaults.timeout} }
+  remote { port = ${missing} }
+}
+db = ${defaults} { url = "jdbc://x" }
+"a.b" = 1
+"""
+
+
+def test_only_selected_paths_are_resolved():
+    assert hocon.loads(DATA, paths=["akka.actor", "db"]) == {
+        "akka": {"actor": {"provider": "local", "timeout": 5}},
+        "db": {"timeout": 5, "url": "jdbc://x"},
+    }
+
+
+def test_quoted_path():
+    assert hocon.loads(DATA, paths=['"a.b"']) == {"a.b": 1}
+
+
+def test_missing_path_is_skipped():
+    assert hocon.loads(DATA, paths=["akka.actor.missing", "nope"]) == {}
+
+
+def test_overlapping_paths():
+    assert hocon.loads(DATA, paths=["akka.actor", "akka.actor.provider"]) == {
+        "akka": {"actor": {"provider": "local", "timeout": 5}},
+    }
+
+
+def test_paths_from_list_root():
+    with pytest.raises(HOCONError):
+        hocon.loads("[1, 2]", paths=["0"])
+
+
+def test_load_paths(tmp_path):
+    conf_filepath = tmp_path / "application.conf"
+    conf_filepath.write_text(DATA)
+    with open(conf_filepath) as fp:
+        assert hocon.load(fp, paths=["defaults"]) == {"defaults": {"timeout": 5}}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("db.url", {"db": {"url": "jdbc://x"}}),
+        ("optional.x", {}),
+    ],
+)
+def test_path_through_unresolved_values(path: str, expected: dict):
+    assert hocon.loads(DATA + "list = [1] [2]\noptional = ${?nope}", paths=[path]) == expected
+
+
+@pytest.mark.parametrize("path", ["list.1", "list.0.x", "plain.0"])
+def test_path_into_list(path: str):
+    with pytest.raises(HOCONError, match="selects a list element"):
+        hocon.loads(DATA + "list = [{x = 1}] [2]\nplain = [5]", paths=[path])
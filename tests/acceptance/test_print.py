@@ -8,4 +8,4 @@ def test_print():
     }
     """
     parsed = parser.parse(data)
-    assert str(parsed) == "{'a': 【〈'1'〉, 〈{'c': 〈'3'〉}〉】, 'b': 〈[〈${a.c}〉, 〈'4'〉]〉}"
+    assert str(parsed) == "{'a': {'c': 3}, 'b': [〈${a.c}〉, 4]}"
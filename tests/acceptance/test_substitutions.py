@@ -234,3 +234,16 @@ def test_resolve_to_undefined_duplication_2():
     """
     with pytest.raises(HOCONSubstitutionUndefinedError):
         loads(data)
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ("b = {c = 1}\nb = ${?a}\nb.c = ${b.c}", {"b": {"c": 1}}),
+        ("b.c = 2.5\nb = {x = true} ${?a}\nb.c = ${?b.c}", {"b": {"c": 2.5, "x": True}}),
+        ("b = {c = 2.5}\nb = ${?a} {x = true}\nb.c = ${b.c} 1", {"b": {"c": "2.5 1", "x": True}}),
+        ("b = {c = 0}\nb = ${?a}\nb.c = ${b.c}", {"b": {"c": 0}}),
+    ],
+)
+def test_self_reference_to_literal_value_behind_optional_substitution(data, expected):
+    assert loads(data) == expected
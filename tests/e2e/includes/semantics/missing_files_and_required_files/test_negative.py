@@ -45,10 +45,8 @@ def test_required_missing():
         hocon.load(open(conf_filepath))
 
 
-def test_classpath():
-    """classpath in hocon is supposed to work strictly for Java code.
-    There is no spec for python.
-    Hence, classpath() will raise an Exception for python implementation."""
-    conf_filepath = Path(__file__).parent / "data" / "classpath.conf"
-    with pytest.raises(NotImplementedError):
+def test_required_classpath_missing():
+    """classpath() resources are looked up in the packages and directories set in hocon.parser.classpath.roots."""
+    conf_filepath = Path(__file__).parent / "data" / "classpath_required.conf"
+    with pytest.raises(HOCONIncludeError, match="Required classpath resource 'ialsoexist.conf' not found"):
         hocon.load(open(conf_filepath))
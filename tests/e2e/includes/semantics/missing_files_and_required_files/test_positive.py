@@ -29,3 +29,13 @@ def test_file():
     conf_filepath = Path(__file__).parent / "data" / "file.conf"
     result = hocon.load(open(conf_filepath))
     assert result == {"a": 1, "b": 2, "c": 3, "d": 4}
+
+
+def test_classpath(monkeypatch):
+    """classpath() resources are looked up in the packages and directories set in hocon.parser.classpath.roots
+    (sys.path if there are none). Missing ones are silently ignored, like missing files."""
+    conf_filepath = Path(__file__).parent / "data" / "classpath.conf"
+    monkeypatch.setattr(hocon.parser.classpath, "roots", [])
+    assert hocon.load(open(conf_filepath)) == {"a": 1, "c": 3}
+    monkeypatch.setattr(hocon.parser.classpath, "roots", [Path(__file__).parent / "data"])
+    assert hocon.load(open(conf_filepath)) == {"a": 1, "b": 2.5, "c": 3, "d": 4}
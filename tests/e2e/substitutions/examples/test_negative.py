@@ -59,6 +59,22 @@ def test_impossible_cycle_2():
         hocon.loads(data)
 
 
+def test_impossible_cycle_through_object():
+    data = """
+    a : { p : ${b} }
+    b : ${a}"""
+    with pytest.raises(HOCONSubstitutionCycleError, match=r"\$\{b\} -> \$\{a\} -> \$\{b\}"):
+        hocon.loads(data)
+
+
+def test_impossible_cycle_through_concatenations():
+    data = """
+    a : ${b} x
+    b : ${a} y"""
+    with pytest.raises(HOCONSubstitutionCycleError):
+        hocon.loads(data)
+
+
 def test_undefined_by_spec():
     """Implementations are allowed to handle this by setting both a and b to 1,
     setting both to 2, or generating an error.
@@ -28,3 +28,24 @@ def test_iadd_no_previous_value():
     assert result == {
         "a": [3],
     }
+
+
+@pytest.mark.parametrize("key", ["a", "b.a"])
+def test_iadd_many_times(key: str):
+    data = f"{key} = [0]\n" + "\n".join(f"{key} += {index}" for index in range(1, 1000))
+    expected = {"a": list(range(1000))} if key == "a" else {"b": {"a": list(range(1000))}}
+    assert hocon.loads(data) == expected
+
+
+def test_iadd_after_override():
+    data = """
+    a = [1]
+    a += 2
+    a = [9]
+    a += 3
+    a += 4
+    """
+    result = hocon.loads(data)
+    assert result == {
+        "a": [9, 3, 4],
+    }
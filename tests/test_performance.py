@@ -1,8 +1,67 @@
-from time import time
+import json
+import os
+import tracemalloc
+from collections.abc import Callable
+from time import perf_counter, time
 
 import pytest
 
 import hocon
+from hocon.parser import parse
+from hocon.resolver import resolve
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not os.environ.get("HOCON_BENCHMARK"), reason="timing benchmark, set HOCON_BENCHMARK=1 to run"),
+]
+
+
+def _best_time(function: Callable[[], object], repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _assert_linear(function: Callable[[int], object], size: int, factor: int = 4) -> None:
+    """Growing the input size by `factor` should grow the time by about `factor` too (quadratic would be factor^2)."""
+    small = _best_time(lambda: function(size))
+    big = _best_time(lambda: function(size * factor))
+    assert big / small < factor * 2, f"{size=}: {small:.4f}s, {size * factor}: {big:.4f}s"
+
+
+def test_parse_scales_linearly_with_key_count():
+    def parse_keys(size: int) -> None:
+        parse("\n".join(f"key{index} = value{index}" for index in range(size)))
+
+    _assert_linear(parse_keys, 2000)
+
+
+@pytest.mark.parametrize("prefix", ["", "base = {b = 1}\na = ${base} "], ids=["lazy", "with_substitution"])
+def test_object_concatenation_scales_linearly(prefix: str):
+    def resolve_chain(size: int) -> None:
+        objects = " ".join(f"{{k{index} = {index}, common {{ v{index} = {index} }} }}" for index in range(size))
+        hocon.loads((prefix or "a = ") + objects)
+
+    _assert_linear(resolve_chain, 250)
+
+
+def test_self_referential_substitutions_scale_linearly():
+    def resolve_self_references(size: int) -> None:
+        hocon.loads("\n".join(f"v{index} = {index}\nv{index} = ${{v{index}}} suffix" for index in range(size)))
+
+    _assert_linear(resolve_self_references, 100)
+
+
+@pytest.mark.parametrize("key", ["plugins", "registry.plugins"])
+def test_iadd_scales_linearly(key: str):
+    def resolve_appends(size: int) -> None:
+        result = hocon.loads(f"{key} = []\n" + "\n".join(f"{key} += plugin{index}" for index in range(size)))
+        assert len(result["plugins"] if key == "plugins" else result["registry"]["plugins"]) == size
+
+    _assert_linear(resolve_appends, 500)
 
 
 @pytest.mark.skip
@@ -248,6 +307,7 @@ final {
 ############################################################
     """
     import pyhocon
+
     start = time()
     for _ in range(100):
         hocon.loads(data)
@@ -261,3 +321,76 @@ final {
     pyhocon_time = stop - start
     print(f"{pyhocon_time=}")
     print(f"hocon2 is {pyhocon_time/hocon2_time} faster than pyhocon!")
+
+
+def test_substitutions_with_common_prefix_scale_linearly():
+    def resolve_substitutions(size: int) -> None:
+        defaults = "defaults { " + ", ".join(f"k{index} = {index}" for index in range(size)) + " }"
+        substitutions = "\n".join(f"u{index} = ${{db.k{index}}}" for index in range(size))
+        hocon.loads(f"{defaults}\ndb = ${{defaults}} {{ primary = 1 }}\n{substitutions}")
+
+    _assert_linear(resolve_substitutions, 200)
+
+
+def test_backward_substitution_chain_scales_linearly():
+    """Every value refers to the next one, so resolving in the file order would recurse through the whole chain."""
+
+    def resolve_chain(size: int) -> None:
+        chain = "\n".join(f"v{index} = ${{v{index + 1}}}" for index in range(size))
+        assert hocon.loads(f"{chain}\nv{size} = 1")["v0"] == 1
+
+    _assert_linear(resolve_chain, 500)
+
+
+def test_json_include_is_faster_than_parsing_it_as_hocon(tmp_path):
+    data = json.dumps({f"key{index}": {"value": index, "tags": ["a", "b"]} for index in range(2000)})
+    (tmp_path / "a.json").write_text(data)
+    (tmp_path / "a.conf").write_text(data)
+    as_json = _best_time(lambda: parse('include "a.json"', tmp_path / "application.conf"))
+    as_hocon = _best_time(lambda: parse('include "a.conf"', tmp_path / "application.conf"))
+    assert as_json * 3 < as_hocon, f"json: {as_json:.4f}s, hocon: {as_hocon:.4f}s"
+
+
+def test_loads_json_is_faster_than_parsing_it_as_hocon():
+    data = json.dumps({f"key{index}": {"value": index, "tags": ["a", "b"]} for index in range(2000)})
+    as_json = _best_time(lambda: hocon.loads(data))
+    as_hocon = _best_time(lambda: resolve(parse(data)))
+    assert as_json * 10 < as_hocon, f"json: {as_json:.4f}s, hocon: {as_hocon:.4f}s"
+
+
+def test_parse_tree_memory_per_value():
+    """A 100k value document: 50k object values, 40k list items and 10k substitutions."""
+    values = "\n".join(f"key{index} = value{index}" for index in range(50_000))
+    items = ", ".join(str(index) for index in range(40_000))
+    substitutions = "\n".join(f"ref{index} = ${{key{index}}}" for index in range(10_000))
+    data = f"{values}\nitems = [{items}]\n{substitutions}"
+    tracemalloc.start()
+    try:
+        parsed = parse(data)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert parsed
+    assert size / 100_000 < 320, f"{size / 100_000:.0f} bytes per value"
+
+
+def test_literal_config_resolves_faster_than_it_parses():
+    """Values without substitutions are folded by the parser, so the resolver has little left to do."""
+    data = "\n".join(
+        f'section{index} {{ name = "item{index}", port = {index}, enabled = true, tags = [a, b], ratio = 0.5 }}'
+        for index in range(2000)
+    )
+    parsing = _best_time(lambda: parse(data))
+    parsed = parse(data)
+    resolving = _best_time(lambda: resolve(parsed))
+    assert resolving < parsing, f"parse: {parsing:.4f}s, resolve: {resolving:.4f}s"
+
+
+def test_number_array_resolves_without_casting():
+    """The parser puts typed numbers into the tree, the resolver only copies them."""
+    data = "a = [" + ", ".join(f"{index}.5" if index % 2 else str(index) for index in range(50_000)) + "]"
+    parsing = _best_time(lambda: parse(data))
+    parsed = parse(data)
+    resolving = _best_time(lambda: resolve(parsed))
+    assert resolve(parsed)["a"][:2] == [0, 1.5]
+    assert resolving * 4 < parsing, f"parse: {parsing:.4f}s, resolve: {resolving:.4f}s"
@@ -1,7 +1,8 @@
 import pytest
 
 from hocon.parser.data import ParserInput
-from hocon.parser._key import parse_keypath
+from hocon.exceptions import HOCONInvalidKeyError
+from hocon.parser._key import parse_keypath, parse_path
 
 
 @pytest.mark.parametrize("data, expected", [
@@ -13,3 +14,17 @@ def test_parse_keypath(data: str, expected: list[str]):
     parser_input = ParserInput(data, "")
     keypath = parse_keypath(parser_input, 0)
     assert keypath.keys == expected
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("akka.actor", ["akka", "actor"]),
+    ('a."b.c"', ["a", "b.c"]),
+    ("db", ["db"]),
+])
+def test_parse_path(path: str, expected: list[str]):
+    assert parse_path(path) == expected
+
+
+def test_parse_path_with_content_left():
+    with pytest.raises(HOCONInvalidKeyError):
+        parse_path("a}b")
@@ -4,6 +4,7 @@ from hocon import loads
 from hocon.parser import parse
 from hocon.parser.data import ParserInput
 from hocon.parser._parser import parse_dict_value
+from hocon.parser._value_utils import fold_concatenation
 from hocon.resolver import _lazy_resolver, resolve
 from hocon.strings import QuotedString, UnquotedString
 from hocon.unresolved import (
@@ -15,17 +16,13 @@ from hocon.unresolved import (
 
 def test_two_dicts_concatenation():
     parser_input = ParserInput("{c: 3} {d: 4},}", "")
-    value, _ = parse_dict_value(parser_input, idx=0, current_keypath=[])
-    assert value == UnresolvedConcatenation([
-        {"c": UnresolvedConcatenation(["3"])},
-        UnquotedString(" "),
-        {"d": UnresolvedConcatenation(["4"])},
-    ])
+    value, _ = parse_dict_value(parser_input, idx=0, current_keypath=())
+    assert value == UnresolvedConcatenation([{"c": 3}, UnquotedString(" "), {"d": 4}])
 
 
 def test_string_mix():
     parser_input = ParserInput("""  I "like"  pancakes , """, "")
-    value, _ = parse_dict_value(parser_input, idx=0, current_keypath=[])
+    value, _ = parse_dict_value(parser_input, idx=0, current_keypath=())
     assert value == UnresolvedConcatenation((
         UnquotedString("  "),
         UnquotedString("I"),
@@ -42,15 +39,10 @@ def test_parse_all_unresolved_types():
     result = parse(data)
     expected = {
         "a": UnresolvedDuplication([
-            UnresolvedConcatenation([
-                [
-                    UnresolvedConcatenation(["1"]),
-                    UnresolvedConcatenation(["2"]),
-                ],
-            ]),
+            [1, 2],
             UnresolvedConcatenation([
                 UnresolvedSubstitution(["a"], optional=True, relative_location=["a"]),
-                [UnresolvedConcatenation(["3"])],
+                [3],
             ]),
         ]),
     }
@@ -64,6 +56,22 @@ def test_parse_iadd():
     assert parse(data) == parse(data_iadd)
 
 
+@pytest.mark.f13_2
+def test_parse_iadd_chain_folds_into_single_substitution():
+    result = parse("a=[1], a+=2, a+=3")
+    expected = {
+        "a": UnresolvedDuplication([
+            [1],
+            UnresolvedConcatenation([
+                UnresolvedSubstitution(["a"], optional=True, relative_location=["a"]),
+                [2],
+                [3],
+            ]),
+        ]),
+    }
+    assert result == expected
+
+
 def test_unresolved_include():
     data = """{
      a: 1
@@ -73,3 +81,55 @@ def test_unresolved_include():
 
     resolved = loads(data)
     assert resolved == {"a": 1, "c": 3}
+
+
+def test_substitutions_share_keypaths():
+    parsed = parse("a.b = ${x} ${y}\nc = [${x}, ${y}]")
+    first, _, second = parsed["a"]["b"]
+    assert first.relative_location == ("a", "b")
+    assert first.relative_location is second.relative_location
+    assert first.including_root is second.including_root
+    assert parsed["c"][0][0].relative_location == ("c", "0")
+    assert parsed["c"][1][0].relative_location == ("c", "1")
+
+
+def test_literal_values_are_folded():
+    parsed = parse('a = 1, b = foo bar, c = "x", d = [1] [2], e = {f: 1} {g: true}, h = [null, 0.5 ]')
+    assert parsed == {
+        "a": 1,
+        "b": "foo bar",
+        "c": QuotedString("x"),
+        "d": [1, 2],
+        "e": {"f": 1, "g": True},
+        "h": [None, 0.5],
+    }
+
+
+def test_values_with_substitutions_are_not_folded():
+    parsed = parse("a = ${x} [1], b = [${x}] [2]")
+    assert parsed["a"] == UnresolvedConcatenation([
+        UnresolvedSubstitution(["x"], optional=False, relative_location=["a"]),
+        UnquotedString(" "),
+        [1],
+    ])
+    assert parsed["b"] == [
+        UnresolvedConcatenation([UnresolvedSubstitution(["x"], optional=False, relative_location=["b", "0"])]),
+        2,
+    ]
+
+
+def test_folded_value_overrides_previous_one():
+    assert parse("a = {b: 1}, a = 2, c = 1, c = {d: 2}") == {"a": 2, "c": {"d": 2}}
+    assert parse("a = 1, a = ${?x}") == {
+        "a": UnresolvedDuplication([
+            1,
+            UnresolvedConcatenation([UnresolvedSubstitution(["x"], optional=True, relative_location=["a"])]),
+        ]),
+    }
+
+
+def test_fold_concatenation_strips_unquoted_space():
+    concatenation = UnresolvedConcatenation([UnquotedString(" "), QuotedString("x"), UnquotedString(" ")])
+    assert fold_concatenation(concatenation) == QuotedString("x")
+    invalid = UnresolvedConcatenation([[1], UnquotedString(" "), {"a": 1}])
+    assert fold_concatenation(invalid) is invalid
@@ -0,0 +1,9 @@
+from hocon.parser._prefetch import IncludePrefetcher
+
+
+def test_nothing_gets_prefetched_after_exit(tmp_path):
+    (tmp_path / "a.conf").write_text("a = 1")
+    with IncludePrefetcher("UTF-8") as prefetcher:
+        pass
+    prefetcher.prefetch('include "a.conf"', tmp_path / "root.conf")
+    assert prefetcher._reads == {}
@@ -38,3 +38,20 @@ def test_parse_substitution(data: str, expected: UnresolvedSubstitution):
     parser_input = ParserInput(data, "")
     result, _ = parse_simple_value(parser_input)
     assert result == expected
+
+
+@pytest.mark.f8
+@pytest.mark.parametrize("data, expected", [
+    ("a/b/c ,", (UnquotedString("a/b/c"), 5)),
+    ("a/b//c\n", (UnquotedString("a/b"), 3)),
+    ("a//x\n", (UnquotedString("a"), 1)),
+])
+def test_parse_unquoted_string_with_slashes(data: str, expected: tuple[UnquotedString, int]):
+    parser_input = ParserInput(data, "")
+    assert parse_simple_value(parser_input) == expected
+
+
+def test_parse_unquoted_string_until_eof():
+    parser_input = ParserInput("abc", "")
+    with pytest.raises(IndexError):
+        parse_simple_value(parser_input)
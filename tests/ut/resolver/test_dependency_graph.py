@@ -0,0 +1,46 @@
+import pytest
+
+from hocon.exceptions import HOCONSubstitutionCycleError
+from hocon.parser import parse
+from hocon.resolver import _lazy_resolver
+from hocon.resolver._dependency_graph import DependencyGraph
+
+
+def _graph(data: str) -> DependencyGraph:
+    return DependencyGraph(_lazy_resolver.resolve(parse(data)))
+
+
+def test_resolution_order_dependencies_first():
+    graph = _graph("a = ${b}, b = ${c} x, c = {d = ${e}}, e = 1")
+    assert [str(substitution) for substitution in graph.resolution_order()] == ["${e}", "${c}", "${b}"]
+
+
+def test_resolution_order_skips_not_evaluated_and_cyclic_substitutions():
+    graph = _graph("a = ${missing}, a = 1, b = [0], b = ${b} [1], c = ${e} {x = ${d}}, d = 3, e = {}")
+    assert [str(substitution) for substitution in graph.resolution_order()] == ["${e}"]
+
+
+def test_check_cycles_reports_full_cycle():
+    graph = _graph("a = ${b}, b = {c = ${d}}, d = ${a.c}")
+    with pytest.raises(HOCONSubstitutionCycleError, match=r"\$\{b\} -> \$\{d\} -> \$\{a\.c\} -> \$\{b\}"):
+        graph.check_cycles()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "a = 1, a = ${b}, b = ${a}",
+        "a = [0], a = ${a} [1]",
+        "a = ${?b}, b = ${?a}",
+        "a = ${b} x, b = ${a} y",
+    ],
+)
+def test_check_cycles_leaves_breakable_cycles_to_the_resolver(data: str):
+    _graph(data).check_cycles()
+
+
+def test_check_cycles_records_consulted_environment(monkeypatch):
+    monkeypatch.setenv("b", "x")
+    environment = {}
+    DependencyGraph(_lazy_resolver.resolve(parse("a : {p : ${b}}, b : ${a}, c : ${?d}")), environment).check_cycles()
+    assert environment == {"b": "x", "a": None}
@@ -51,7 +51,7 @@ def test_4():
     }
     """
     parsed = parse(data)
-    sub = parsed["a"][0]["b"][1]
+    sub = parsed["a"]["b"][1]
     carved = cut_self_reference_and_fields_that_override_it(sub, parsed)
     result = resolve(carved)
     assert result == {"a": {"a": 1, "b": "c"}}
@@ -80,12 +80,24 @@ def test_array_ref():
     ]
     """
     parsed = parse(data)
-    sub = parsed["a"][0][2][0]["b"][0][2][0]
+    sub = parsed["a"][2]["b"][2][0]
     carved = cut_self_reference_and_fields_that_override_it(sub, parsed)
     result = resolve(carved)
     assert result == {"a": [1, 2, {"b": [1, 2, 4]}, 4]}
 
 
+def test_cut_through_concatenation():
+    data = """
+    a = ${?x} {b: 1}
+    a.c = ${a.b}
+    """
+    parsed = parse(data)
+    sub = parsed["a"][1]["c"][0]
+    carved = cut_self_reference_and_fields_that_override_it(sub, parsed)
+    assert carved["a"][0] is parsed["a"][0]
+    assert resolve(carved) == {"a": {"b": 1}}
+
+
 def test_array_ref2():
     """cutting self reference should also work on lazy-resolved object."""
     data = """
@@ -117,3 +129,21 @@ def test_wrong_location():
     parsed["a"][0]["c"] = [sub, "42"]
     with pytest.raises(HOCONSubstitutionUndefinedError):
         cut_self_reference_and_fields_that_override_it(sub, parsed)
+
+
+def test_cut_does_not_modify_parsed():
+    data = """
+    a : { a : { c : 1 } }
+    b : 1
+    d : { e : [1, 2] }
+    a : ${a.a}
+    a : { a : 2 }
+    b : 3
+    """
+    parsed = parse(data)
+    sub = parsed["a"][1][0]
+    expected = parse(data)
+    carved = cut_self_reference_and_fields_that_override_it(sub, parsed)
+    assert parsed == expected
+    assert carved["d"] is parsed["d"]
+    assert resolve(carved) == {"a": {"a": {"c": 1}}, "b": 3, "d": {"e": [1, 2]}}
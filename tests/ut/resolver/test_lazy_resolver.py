@@ -36,3 +36,17 @@ def test_concatenation_substitution_only():
     concatenation = UnresolvedConcatenation([sub])
     result = _lazy_resolver.resolve(concatenation)
     assert result == sub
+
+
+def test_concatenations_without_substitutions():
+    """The parser folds these, but the lazy resolver still handles them in hand made trees."""
+    assert _lazy_resolver.resolve(UnresolvedConcatenation([[1], UnquotedString(" "), [2]])) == [1, 2]
+    assert _lazy_resolver.resolve(UnresolvedConcatenation([{"a": 1}, {"b": 2}])) == {"a": 1, "b": 2}
+
+
+def test_literal_subtrees_are_shared():
+    parsed = {"a": {"b": [1, {"c": "x"}]}, "d": UnresolvedDuplication([{"e": 1}, {"f": 2}])}
+    result = _lazy_resolver.resolve(parsed)
+    assert result == {"a": {"b": [1, {"c": "x"}]}, "d": {"e": 1, "f": 2}}
+    assert result["a"] is parsed["a"]
+    assert _lazy_resolver.resolve(parsed["a"]) is parsed["a"]
@@ -1,5 +1,8 @@
+import pytest
+
+from hocon.resolver import merge as lazy_merge
 from hocon.resolver._resolver import Resolver
-from hocon.unresolved import UnresolvedSubstitution
+from hocon.unresolved import UnresolvedDuplication, UnresolvedSubstitution
 
 
 def test_1():
@@ -72,3 +75,30 @@ def test_3():
 def test_4():
     output = Resolver({}).merge({"a": UnresolvedSubstitution(["c"], True)}, {"a": 1})
     assert output == {"a": 1}
+
+
+@pytest.mark.parametrize("merge", [Resolver({}).merge, lazy_merge])
+def test_merge_shares_untouched_subtrees(merge):
+    untouched = {"x": {"y": 1}}
+    inferior = {"a": {"b": 0, "c": 1}, "u": untouched}
+    superior = {"a": {"b": 2}}
+    output = merge(superior, inferior)
+    assert output == {"a": {"b": 2, "c": 1}, "u": {"x": {"y": 1}}}
+    assert output["u"] is untouched
+    assert inferior == {"a": {"b": 0, "c": 1}, "u": {"x": {"y": 1}}}
+    assert superior == {"a": {"b": 2}}
+
+
+def test_lazy_merge_simple_value_overrides_duplication():
+    inferior = {"a": UnresolvedDuplication([{"x": 1}, {"y": 2}])}
+    assert lazy_merge({"a": 5}, inferior) == {"a": 5}
+
+
+def test_lazy_merge_keeps_simple_value_as_fallback():
+    optional = UnresolvedSubstitution(["x"], optional=True)
+    assert lazy_merge({"a": optional}, {"a": 5}) == {"a": UnresolvedDuplication([5, optional])}
+
+
+def test_lazy_merge_keeps_null_as_fallback():
+    optional = UnresolvedSubstitution(["x"], optional=True)
+    assert lazy_merge({"a": optional}, {"a": None}) == {"a": UnresolvedDuplication([None, optional])}
@@ -2,6 +2,8 @@ import pytest
 
 from hocon.constants import UNDEFINED
 from hocon.exceptions import HOCONConcatenationError, HOCONDeduplicationError, HOCONError
+from hocon.parser import parse
+from hocon.resolver import _lazy_resolver
 from hocon.resolver._resolver import Resolver, resolve
 from hocon.unresolved import UnresolvedConcatenation, UnresolvedDuplication
 
@@ -40,3 +42,49 @@ def test_concatenation_cant_contain_concatenations():
 def test_lazy_resolver_bad_return_type():
     with pytest.raises(HOCONError, match="lazy resolver returned <class 'int'>"):
         resolve(5)
+
+
+def test_memo_resolves_shared_concatenation_once():
+    concatenation = UnresolvedConcatenation([[1], [2]])
+    resolver = Resolver({})
+    resolved = resolver.resolve_list([concatenation, concatenation])
+    assert resolved == [[1, 2], [1, 2]]
+    assert resolved[0] is not resolved[1]
+    assert (resolver.memo_stats.hits, resolver.memo_stats.misses) == (1, 1)
+
+
+def test_memo_is_shared_with_self_reference_fallback():
+    parsed = _lazy_resolver.resolve(parse("x : {k : ${b}} {m : 1}, b : 5, a : {p : ${x}}, a : ${a} {q : ${x}}"))
+    resolver = Resolver(parsed)
+    assert resolver.resolve_dict(parsed)["a"] == {"p": {"k": 5, "m": 1}, "q": {"k": 5, "m": 1}}
+    assert resolver.memo_stats.hits > 0
+
+
+def test_resolve_duplication_merges_objects_in_one_walk(monkeypatch):
+    def fail(values):
+        raise AssertionError(values)
+
+    monkeypatch.setattr("hocon.resolver._lazy_resolver.resolve", fail)
+    duplication = UnresolvedDuplication(
+        [
+            {"a": {"x": 1, "y": UnresolvedConcatenation([[1], [2]])}},
+            {"a": UnresolvedDuplication([5, {"z": 3}])},
+            {"a": {"y": UnresolvedConcatenation([[3]])}},
+        ]
+    )
+    assert Resolver({}).resolve(duplication) == {"a": {"z": 3, "y": [3]}}
+
+
+def test_resolve_duplication_merges_substituted_object_between_objects():
+    assert resolve(parse("a = {x: 1}, a = ${b}, a = {y: 2}, b = {z: 3}"))["a"] == {"x": 1, "y": 2, "z": 3}
+    assert resolve(parse("a = {x: 1}, a = ${b}, a = {y: 2}, b = 5"))["a"] == {"y": 2}
+
+
+@pytest.mark.parametrize("data", ["a : {b : null}, a : {b : ${?zz}}", "a {b : null}\na {b : ${?zz}}"])
+def test_null_stays_as_fallback_of_undefined_optional_substitution(data):
+    assert resolve(parse(data)) == {"a": {"b": None}}
+
+
+def test_null_is_not_a_missing_value_for_self_append():
+    with pytest.raises(HOCONConcatenationError):
+        resolve(parse("a {b : null}\na.b += 1"))
@@ -3,6 +3,7 @@ import pytest
 from hocon.exceptions import HOCONSubstitutionCycleError
 from hocon.resolver._substitution import Substitution, SubstitutionStatus
 from hocon.resolver._substitution_resolver import SubstitutionResolver
+from hocon.resolver import _lazy_resolver, resolve
 from hocon.resolver._resolver import Resolver
 from hocon.unresolved import UnresolvedSubstitution
 from hocon.parser import parse
@@ -19,3 +20,38 @@ def test_error_when_fallback_resolving():
     sub_resolver.subs[sub.id_] = Substitution(status=SubstitutionStatus.FALLBACK_RESOLVING)
     with pytest.raises(HOCONSubstitutionCycleError, match=r"Could not resolve \${b}"):
         sub_resolver(sub)
+
+
+class SpyResolver:
+    def __init__(self, resolver: Resolver):
+        self.resolver = resolver
+        self.resolved = []
+
+    def resolve(self, values):
+        self.resolved.append(values)
+        return self.resolver.resolve(values)
+
+
+def test_common_substitution_prefix_resolved_once():
+    parsed = _lazy_resolver.resolve(parse("""
+    defaults {host: h, port: 1}
+    db = ${defaults} {user: u}
+    host = ${db.host}
+    port = ${db.port}
+    """))
+    db = parsed["db"]
+    spy = SpyResolver(Resolver(parsed))
+    sub_resolver = SubstitutionResolver(parsed, spy)
+    assert sub_resolver(parsed["host"]) == "h"
+    assert sub_resolver(parsed["port"]) == 1
+    assert [node for node in spy.resolved if node is db] == [db]
+
+
+def test_included_substitution_is_rewritten_not_modified(tmp_path):
+    (tmp_path / "included.conf").write_text("b = ${c}")
+    parsed = parse('a { c = 1\ninclude "included.conf" }', tmp_path / "application.conf")
+    sub: UnresolvedSubstitution = parsed["a"]["b"][0]
+    assert resolve(parsed) == {"a": {"c": 1, "b": 1}}
+    assert sub.keys == ("c",)
+    assert sub.including_root == ("a",)
+    assert resolve(parsed) == {"a": {"c": 1, "b": 1}}
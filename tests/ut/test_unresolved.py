@@ -1,3 +1,6 @@
+from copy import copy
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
 
 from hocon.exceptions import HOCONDuplicateKeyMergeError
@@ -23,6 +26,13 @@ def test_sanitize_duplication():
     assert sanitized == UnresolvedDuplication([{"b": 2}, {"c": 3}])
 
 
+def test_sanitize_duplication_keeps_simple_value_followed_by_unresolved():
+    optional = UnresolvedConcatenation([UnresolvedSubstitution(["x"], optional=True)])
+    duplication = UnresolvedDuplication([{"a": 1}, 4, optional])
+    assert duplication.sanitize() == UnresolvedDuplication([4, optional])
+    assert UnresolvedDuplication([{"a": 1}, 4]).sanitize() == UnresolvedDuplication([4])
+
+
 def test_filter_unquoted_spaces():
     concatenation = UnresolvedConcatenation([{}, {}, UnquotedString("  "), {}, UnquotedString("")])
     result = concatenation.filter_out_unquoted_space()
@@ -44,3 +54,49 @@ def test_sub_hashing():
         b: ".".join(b.keys)
     }
     assert sub_dict[a] == "a.b"
+
+
+@pytest.mark.parametrize(
+    "node",
+    [UnresolvedConcatenation([1]), UnresolvedDuplication([{}]), UnresolvedSubstitution(("a",), optional=False)],
+)
+def test_nodes_have_no_instance_dict(node):
+    assert not hasattr(node, "__dict__")
+
+
+@pytest.mark.parametrize("node_type", [UnresolvedConcatenation, UnresolvedDuplication])
+def test_nodes_are_not_lists(node_type):
+    """Only HOCON lists are lists, so isinstance(value, list) tells them apart from unresolved nodes."""
+    node = node_type([1, 2])
+    assert not isinstance(node, list)
+    node.insert(0, 0)
+    del node[-1]
+    node.extend([3])
+    assert node == [0, 1, 3] == node_type([0, 1, 3])
+    assert node[1:] == [1, 3] and 3 in node and list(reversed(node)) == [3, 1, 0]
+    node_copy = copy(node)
+    node_copy.append(4)
+    assert type(node_copy) is node_type and node == [0, 1, 3]
+
+
+def test_sub_keypaths_are_tuples():
+    substitution = UnresolvedSubstitution(["a", "b"], optional=True, relative_location=["c"], including_root=["d"])
+    assert substitution.keys == ("a", "b")
+    assert substitution.location == ("d", "c")
+    assert substitution == UnresolvedSubstitution(
+        ("a", "b"), optional=True, relative_location=("c",), including_root=("d",)
+    )
+    assert repr(substitution) == "${?a.b}"
+
+
+def test_reprs():
+    assert repr(UnresolvedConcatenation([1, "a"])) == "〈1, 'a'〉"
+    assert repr(UnresolvedDuplication([{}, []])) == "【{}, []】"
+
+
+def test_sub_is_immutable():
+    substitution = UnresolvedSubstitution(("a",), optional=False, relative_location=("b",), including_root=("c",))
+    with pytest.raises(FrozenInstanceError):
+        substitution.keys = ("d",)
+    assert substitution.location is substitution.location
+    assert replace(substitution, including_root=()).location == ("b",)
@@ -0,0 +1,51 @@
+import pytest
+
+from hocon._value_utils import cast_string_value, resolve_simple_value
+from hocon.constants import NUMBER_RE
+from hocon.strings import QuotedString, UnquotedString
+
+
+def test_1():
+    data = [UnquotedString("  "), UnquotedString("43.2"), UnquotedString(" ")]
+    result = resolve_simple_value(data)
+    assert result == 43.2
+
+
+def test_2():
+    data = [QuotedString("  "), UnquotedString("43.2"), UnquotedString(" ")]
+    result = resolve_simple_value(data)
+    assert result == "  43.2"
+
+
+def test_3():
+    data = [UnquotedString("  "), QuotedString("43.2"), UnquotedString(" ")]
+    result = resolve_simple_value(data)
+    assert result == "43.2"
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("true", True),
+        ("false", False),
+        ("null", None),
+        ("0", 0),
+        ("-12", -12),
+        ("1.5", 1.5),
+        ("1e3", 1000.0),
+        ("-2.5E-1", -0.25),
+        ("-Infinity", float("-inf")),
+        ("truest", True),
+        ("nullable", None),
+        ("007", "007"),
+        ("1.", "1."),
+        ("Infinityx", "Infinityx"),
+    ],
+)
+def test_cast_string_value(token, expected):
+    result = cast_string_value(token)
+    assert (type(result), result) == (type(expected), expected)
+
+
+def test_number_re_is_kept():
+    assert NUMBER_RE.match("-2.5E-1").groups() == ("-2", ".5", "E-1")